@@ -17,6 +17,7 @@ from auth.google_auth import auth_bp, oauth
 from backend.routes.index import index_bp
 from backend.services.cache_service import cache, check_cache_health
 from backend.utils import rate_limit
+from backend.utils.json_provider import FastJSONProvider
 
 # Logging configuration
 logging.basicConfig(
@@ -34,6 +35,9 @@ logger.info("Starting Flask application")
 # Initialize Flask app
 app = Flask(__name__)
 
+# orjson-backed JSON for every response (stdlib json when orjson is missing)
+app.json = FastJSONProvider(app)
+
 # Configure CORS for frontend access
 # In production, restrict origins to your Vercel domain
 default_origins = (
@@ -47,7 +51,7 @@ CORS(
             "origins": "*",  # Allow all origins for public API to avoid CORS issues
             "methods": ["GET", "POST", "PUT", "DELETE", "OPTIONS"],
             "allow_headers": ["Content-Type", "Authorization"],
-            "expose_headers": ["Content-Type"],
+            "expose_headers": ["Content-Type", "ETag", "Last-Modified"],
             "supports_credentials": False,
         }
     },
@@ -127,6 +131,16 @@ from backend.models.project_url import ProjectURL
 from backend.models.analytics import ProjectAnalytics, ProjectEvent
 from backend.models.user import User
 
+
+@limiter.request_filter
+def _exempt_cache_warmup():
+    """Cache warm-up requests are internal and never count against the limits."""
+    from flask import request
+    from backend.services.warmup import WARMUP_ENVIRON_KEY
+
+    return bool(request.environ.get(WARMUP_ENVIRON_KEY))
+
+
 logger.info("Registering blueprints")
 app.register_blueprint(api_bp)
 app.register_blueprint(admin_bp)
@@ -8,7 +8,7 @@ from flask import (
     current_app,
     make_response,
 )
-from sqlalchemy import text, desc
+from sqlalchemy import text
 from backend import db
 from backend.models.project import Project, ProjectImage, ProjectTranslation
 from backend.models.project_url import ProjectURL
@@ -19,7 +19,8 @@ from backend.models.profile import Profile, ProfileTranslation
 from backend.models.certification import Certification, CertificationTranslation
 from backend.models.tag import Tag
 from backend.services.cloudinary_service import cloudinary_service
-from backend.services.cache_service import invalidate_entities_cache
+from backend.services.cache_service import invalidate_entities_cache, get_cache_stats
+from backend.services.serializers import serialize_admin, BACKUP_SERIALIZERS
 from backend.services.github_service import GitHubService
 from backend.services.ai_service import AIProjectGenerator
 import json
@@ -30,11 +31,25 @@ from auth.decorators import requires_login, requires_role
 admin_bp = Blueprint("admin", __name__, template_folder="../../templates")
 
 
+# Rows per request when the admin page loads a listing
+ADMIN_PAGE_SIZE = 50
+
+# Paginated admin listings: type -> (model, keyset column, newest first, relationships to load)
+ADMIN_LISTINGS = {
+    "project": (Project, Project.created_at, True, ("translations", "images", "urls", "tags")),
+    "experience": (Experience, Experience.start_date, True, ("translations", "tags")),
+    "education": (Education, Education.start_date, True, ("translations", "courses")),
+    "skill": (Skill, Skill.created_at, True, ("translations",)),
+    "skill-category": (SkillCategory, SkillCategory.order, False, ("translations",)),
+    "certification": (Certification, Certification.issue_date, True, ("translations",)),
+}
+
+
 @admin_bp.route("/admin")
 @requires_login
 @requires_role("admin")
 def admin_home():
-    from sqlalchemy.orm import joinedload
+    from sqlalchemy.orm import selectinload
     
     ready = request.args.get("ready")
     
@@ -44,85 +59,14 @@ def admin_home():
             db.session.execute(text("SELECT 1"))
             db.session.commit()
 
-            # Fetch all data with eager loading to prevent N+1 queries
-            projects_data = Project.query.options(
-                joinedload(Project.translations),
-                joinedload(Project.images),
-                joinedload(Project.urls),
-                joinedload(Project.tags)
-            ).order_by(desc(Project.created_at)).all()
-            
-            experiences_data = Experience.query.options(
-                joinedload(Experience.translations),
-                joinedload(Experience.tags)
-            ).order_by(desc(Experience.start_date)).all()
-            
-            education_data = Education.query.options(
-                joinedload(Education.translations),
-                joinedload(Education.courses)
-            ).order_by(desc(Education.start_date)).all()
-            
-            skills_data = Skill.query.options(
-                joinedload(Skill.translations)
-            ).order_by(Skill.order).all()
-            
-            certifications_data = Certification.query.options(
-                joinedload(Certification.translations)
-            ).order_by(desc(Certification.issue_date)).all()
-            
-            skill_categories_data = SkillCategory.query.options(
-                joinedload(SkillCategory.translations)
-            ).order_by(SkillCategory.order).all()
-            
+            # Entity lists are paged in by admin.js from /admin/data/<type>
             profile_data = Profile.query.options(
-                joinedload(Profile.translations)
+                selectinload(Profile.translations)
             ).first()
 
-            # Helper to serialize objects
-            def serialize(obj):
-                if not obj: return None
-                d = {c.name: getattr(obj, c.name) for c in obj.__table__.columns}
-                # Handle dates
-                for k, v in d.items():
-                    if hasattr(v, 'isoformat'):
-                        d[k] = v.isoformat()
-                
-                # Handle relationships
-                if hasattr(obj, 'translations'):
-                    d['translations'] = [{c.name: getattr(t, c.name) for c in t.__table__.columns} for t in obj.translations]
-                
-                if hasattr(obj, 'tags'):
-                    d['tags'] = [{'id': t.id, 'name': t.name, 'slug': t.slug} for t in obj.tags]
-                    
-                if hasattr(obj, 'images'):
-                    d['images'] = [{c.name: getattr(i, c.name) for c in i.__table__.columns} for i in obj.images]
-                    
-                if hasattr(obj, 'courses'):
-                    d['courses'] = [c.name for c in sorted(obj.courses, key=lambda x: x.order)]
-
-                if hasattr(obj, 'urls'):
-                    d['urls'] = [{c.name: getattr(u, c.name) for c in u.__table__.columns} for u in sorted(obj.urls, key=lambda x: x.order)]
-                    
-                return d
-
-            projects = [serialize(p) for p in projects_data]
-            experiences = [serialize(e) for e in experiences_data]
-            education = [serialize(e) for e in education_data]
-            skills = [serialize(s) for s in skills_data]
-            skill_categories = [serialize(sc) for sc in skill_categories_data]
-            certifications = [serialize(c) for c in certifications_data]
-            profile = serialize(profile_data) if profile_data else {}
+            profile = serialize_admin(profile_data) if profile_data else {}
 
-            return render_template(
-                "admin.html",
-                projects=projects,
-                experiences=experiences,
-                education=education,
-                skills=skills,
-                skill_categories=skill_categories,
-                certifications=certifications,
-                profile=profile
-            )
+            return render_template("admin.html", profile=profile, page_size=ADMIN_PAGE_SIZE)
 
         except Exception as e:
             import traceback
@@ -143,6 +87,35 @@ def admin_home():
     return render_template("admin_base.html")
 
 
+@admin_bp.route("/admin/data/<type>")
+@requires_login
+@requires_role("admin")
+def admin_data(type):
+    """
+    One page of an entity listing as JSON (``?limit=``, ``?cursor=``), in
+    the same shape ``admin_home`` renders. Keyset on the column the admin
+    list is shown by (``start_date`` / ``issue_date``, newest first and
+    undated last; ``created_at`` for projects and skills; ``order`` for
+    skill categories), plus ``id``, so every page costs the same and
+    "Load more" appends below the rows already shown.
+    """
+    from sqlalchemy.orm import selectinload
+    from backend.utils.pagination import PaginationError, parse_page_args, paginate_query, DEFAULT_PAGE_SIZE
+
+    if type not in ADMIN_LISTINGS:
+        return jsonify({"error": True, "message": f"Unknown type: {type}", "available": list(ADMIN_LISTINGS)}), 400
+
+    model, column, descending, relationships = ADMIN_LISTINGS[type]
+    try:
+        limit, after = parse_page_args(request.args)
+        query = model.query.options(*(selectinload(getattr(model, r)) for r in relationships))
+        rows, next_cursor = paginate_query(query, column, model.id, limit or DEFAULT_PAGE_SIZE, after, descending)
+    except PaginationError as e:
+        return jsonify({"error": True, "message": str(e)}), 400
+
+    return jsonify({"items": [serialize_admin(row) for row in rows], "next_cursor": next_cursor})
+
+
 @admin_bp.route("/admin/check")
 @requires_login
 @requires_role("admin")
@@ -164,6 +137,16 @@ def admin_check():
     return jsonify({"ready": False})
 
 
+@admin_bp.route("/admin/cache/stats")
+@requires_login
+@requires_role("admin")
+def cache_stats():
+    """Response cache hit ratios (L1 = this worker, L2 = shared cache) and the last warm-up."""
+    from backend.services.warmup import get_last_warmup_report
+
+    return jsonify({**get_cache_stats(), "warmup": get_last_warmup_report()})
+
+
 # ==========================================
 # SAVE ENDPOINTS
 # ==========================================
@@ -367,7 +350,7 @@ def save_project():
             project.tags.append(tag)
             
         db.session.commit()
-        invalidate_entities_cache()
+        invalidate_entities_cache("project")
         return jsonify({"success": True, "id": project.id, "slug": project.slug}), 200
         
     except Exception as e:
@@ -393,7 +376,7 @@ def delete_project(project_id):
         
         db.session.delete(project)
         db.session.commit()
-        invalidate_entities_cache()
+        invalidate_entities_cache("project")
         
         return jsonify({"success": True, "message": f"Project '{project.slug}' deleted"}), 200
         
@@ -503,7 +486,7 @@ def save_experience():
             exp.tags.append(tag)
             
         db.session.commit()
-        invalidate_entities_cache()
+        invalidate_entities_cache("experience")
         return jsonify({"success": True, "id": exp.id}), 200
         
     except Exception as e:
@@ -613,7 +596,7 @@ def save_education():
             edu.courses.append(c)
             
         db.session.commit()
-        invalidate_entities_cache()
+        invalidate_entities_cache("education")
         return jsonify({"success": True, "id": edu.id}), 200
         
     except Exception as e:
@@ -694,7 +677,7 @@ def save_skill():
                 skill.translations.append(t)
             
         db.session.commit()
-        invalidate_entities_cache()
+        invalidate_entities_cache("skill")
         return jsonify({"success": True, "id": skill.id}), 200
         
     except Exception as e:
@@ -744,7 +727,7 @@ def save_skill_category():
                 cat.translations.append(t)
             
         db.session.commit()
-        invalidate_entities_cache()
+        invalidate_entities_cache("skill_category")
         return jsonify({"success": True, "id": cat.id}), 200
         
     except Exception as e:
@@ -847,7 +830,7 @@ def save_certification():
                 cert.translations.append(t)
             
         db.session.commit()
-        invalidate_entities_cache()
+        invalidate_entities_cache("certification")
         return jsonify({"success": True, "id": cert.id}), 200
         
     except Exception as e:
@@ -900,7 +883,7 @@ def save_profile():
             profile.translations.append(t)
             
         db.session.commit()
-        invalidate_entities_cache()
+        invalidate_entities_cache("profile")
         return jsonify({"success": True}), 200
         
     except Exception as e:
@@ -939,7 +922,11 @@ def delete_item(type, id):
             
         db.session.delete(item)
         db.session.commit()
-        invalidate_entities_cache()
+        if type == "skill-category":
+            # Unlinked skills fall back to "Other"
+            invalidate_entities_cache("skill_category", "skill")
+        else:
+            invalidate_entities_cache(type)
         return jsonify({"success": True}), 200
         
     except Exception as e:
@@ -1011,143 +998,34 @@ def backup_database():
             'profile': None
         }
         
-        # Backup Projects
-        for p in Project.query.all():
-            backup_data['projects'].append({
-                'id': p.id,
-                'slug': p.slug,
-                'category': p.category,
-                'is_featured_cv': p.is_featured_cv,
-                'created_at': p.created_at.isoformat() if p.created_at else None,
-                'translations': [{
-                    'lang': t.lang,
-                    'title': t.title,
-                    'subtitle': t.subtitle,
-                    'description': t.description,
-                    'summary': t.summary,
-                    'content': t.content,
-                    'cv_description': getattr(t, 'cv_description', None)
-                } for t in p.translations],
-                'urls': [{
-                    'url_type': u.url_type,
-                    'url': u.url,
-                    'order': u.order
-                } for u in p.urls],
-                'images': [{
-                    'url': img.url,
-                    'type': img.type,
-                    'alt_text': getattr(img, 'alt_text', None),
-                    'width': getattr(img, 'width', None),
-                    'height': getattr(img, 'height', None),
-                    'is_featured': getattr(img, 'is_featured', False),
-                    'order': img.order
-                } for img in p.images],
-                'tags': [{'name': tag.name, 'slug': tag.slug} for tag in p.tags]
-            })
-        
-        # Backup Experiences
-        for e in Experience.query.all():
-            backup_data['experiences'].append({
-                'id': e.id,
-                'slug': e.slug,
-                'company': e.company,
-                'location': e.location,
-                'start_date': e.start_date if isinstance(e.start_date, str) else (e.start_date.isoformat() if e.start_date else None),
-                'end_date': e.end_date if isinstance(e.end_date, str) else (e.end_date.isoformat() if e.end_date else None),
-                'current': e.current,
-                'translations': [{
-                    'lang': t.lang,
-                    'title': t.title,
-                    'description': t.description
-                } for t in e.translations],
-                'tags': [{'name': tag.name} for tag in e.tags]
-            })
-        
-        # Backup Education
-        for edu in Education.query.all():
-            backup_data['education'].append({
-                'id': edu.id,
-                'slug': edu.slug,
-                'institution': edu.institution,
-                'location': edu.location,
-                'start_date': edu.start_date if isinstance(edu.start_date, str) else (edu.start_date.isoformat() if edu.start_date else None),
-                'end_date': edu.end_date if isinstance(edu.end_date, str) else (edu.end_date.isoformat() if edu.end_date else None),
-                'current': edu.current,
-                'courses': [{'name': c.name, 'order': c.order} for c in edu.courses],
-                'translations': [{
-                    'lang': t.lang,
-                    'title': t.title,
-                    'description': t.description
-                } for t in edu.translations]
-            })
-        
-        # Backup Skill Categories
-        backup_data['skill_categories'] = []
-        for sc in SkillCategory.query.all():
-            backup_data['skill_categories'].append({
-                'id': sc.id,
-                'slug': sc.slug,
-                'order': sc.order,
-                'translations': [{
-                    'lang': t.lang,
-                    'name': t.name
-                } for t in sc.translations]
-            })
-        
-        # Backup Skills
-        for s in Skill.query.all():
-            backup_data['skills'].append({
-                'id': s.id,
-                'slug': s.slug,
-                'category_id': s.category_id,
-                'proficiency': s.proficiency,
-                'icon_url': s.icon_url,
-                'is_visible_cv': s.is_visible_cv,
-                'is_visible_portfolio': s.is_visible_portfolio,
-                'order': s.order,
-                'translations': [{
-                    'lang': t.lang,
-                    'name': t.name,
-                    'description': t.description
-                } for t in s.translations]
-            })
-        
-        # Backup Certifications
-        for c in Certification.query.all():
-            backup_data['certifications'].append({
-                'id': c.id,
-                'slug': c.slug,
-                'issuer': c.issuer,
-                'issue_date': c.issue_date if isinstance(c.issue_date, str) else (c.issue_date.isoformat() if c.issue_date else None),
-                'expiry_date': c.expiry_date if isinstance(c.expiry_date, str) else (c.expiry_date.isoformat() if c.expiry_date else None),
-                'credential_url': c.credential_url,
-                'translations': [{
-                    'lang': t.lang,
-                    'title': t.title,
-                    'description': t.description
-                } for t in c.translations]
-            })
-        
-        # Backup Profile
-        profile = Profile.query.first()
+        from sqlalchemy.orm import selectinload
+
+        def rows(model, *relationships):
+            return model.query.options(*(selectinload(getattr(model, r)) for r in relationships)).all()
+
+        backup_data['projects'] = [
+            BACKUP_SERIALIZERS['projects'](p) for p in rows(Project, 'translations', 'urls', 'images', 'tags')
+        ]
+        backup_data['experiences'] = [
+            BACKUP_SERIALIZERS['experiences'](e) for e in rows(Experience, 'translations', 'tags')
+        ]
+        backup_data['education'] = [
+            BACKUP_SERIALIZERS['education'](edu) for edu in rows(Education, 'courses', 'translations')
+        ]
+        backup_data['skill_categories'] = [
+            BACKUP_SERIALIZERS['skill_categories'](sc) for sc in rows(SkillCategory, 'translations')
+        ]
+        backup_data['skills'] = [BACKUP_SERIALIZERS['skills'](s) for s in rows(Skill, 'translations')]
+        backup_data['certifications'] = [
+            BACKUP_SERIALIZERS['certifications'](c) for c in rows(Certification, 'translations')
+        ]
+
+        profile = Profile.query.options(selectinload(Profile.translations)).first()
         if profile:
-            backup_data['profile'] = {
-                'id': profile.id,
-                'name': profile.name,
-                'email': profile.email,
-                'location': profile.location,
-                'social_links': profile.social_links,
-                'translations': [{
-                    'lang': t.lang,
-                    'role': t.role,
-                    'tagline': t.tagline,
-                    'bio': t.bio
-                } for t in profile.translations]
-            }
-        
-        
+            backup_data['profile'] = BACKUP_SERIALIZERS['profile'](profile)
+
         # Create response with JSON file download
-        response = make_response(json.dumps(backup_data, indent=2, ensure_ascii=False))
+        response = make_response(current_app.json.dumps_bytes(backup_data, indent=2, sort_keys=False, ensure_ascii=False))
         response.headers['Content-Type'] = 'application/json'
         response.headers['Content-Disposition'] = f'attachment; filename=portfolio_backup_{timestamp}.json'
         
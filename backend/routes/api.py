@@ -1,21 +1,21 @@
 """
 REST API endpoints for portfolio data.
-Refactored to use proper relational models.
+Served from the in-process read model (see services/read_model.py).
 """
 
+import time
 from flask import Blueprint, jsonify, request
 from backend import db
-from sqlalchemy import desc
-from sqlalchemy.orm import joinedload
-from backend.models.project import Project, ProjectTranslation
-from backend.models.experience import Experience, ExperienceTranslation
-from backend.models.education import Education, EducationTranslation
-from backend.models.skill import Skill, SkillTranslation
-from backend.models.profile import Profile, ProfileTranslation
-from backend.models.certification import Certification, CertificationTranslation
-from backend.models.tag import Tag
-from backend.services.cache_service import cache_response, cache_key_with_lang, cache_key_simple
+from backend.services.read_model import (
+    get_view, get_card_view, get_last_modified, PROJECT_FIELDS, CARD_FIELDS
+)
+from backend.services.cache_service import (
+    cache_response, cache_key_with_lang, cache_key_with_projection, cache_key_with_include,
+    cache_key_simple, ENTITY_TYPES
+)
 from backend.utils.rate_limit import api_rate_limit, generous_rate_limit
+from backend.utils.pagination import PaginationError, parse_page_args, paginate_sequence
+from backend.services.search_index import search, SEARCH_TYPES
 
 api_bp = Blueprint("api", __name__, url_prefix="/api")
 
@@ -28,6 +28,13 @@ def error_response(message, status_code, details=None):
     return jsonify(response), status_code
 
 
+def snapshot_response(payload, last_modified=None):
+    """JSON response for read-model data, stamped with Last-Modified."""
+    response = jsonify(payload)
+    response.last_modified = last_modified
+    return response, 200
+
+
 @api_bp.route("/health", methods=["GET"])
 @generous_rate_limit()
 def health_check():
@@ -42,140 +49,101 @@ def health_check():
 # PROJECTS
 # ==========================================
 
+PROJECT_VIEWS = ("full", "card")
+
+
+def _project_key(project):
+    """Keyset sort key of the project list: newest first, undated last (the loaders' ORDER BY)."""
+    return (project["created_at"] or "", project["id"])
+
+
+def _project_fields(project, fields):
+    """Project payload reduced to ``fields`` (``thumbnail`` derived from images)."""
+    projected = {}
+    for name in fields:
+        if name == "thumbnail" and name not in project:
+            image = next((i for i in project["images"] if i["is_featured"]),
+                         project["images"][0] if project["images"] else None)
+            projected[name] = (image["thumbnail_url"] or image["url"]) if image else None
+        else:
+            projected[name] = project[name]
+    return projected
+
+
 @api_bp.route("/projects", methods=["GET"])
 @api_rate_limit()
-@cache_response(timeout=3600, key_func=cache_key_with_lang)
+@cache_response(timeout=3600, soft_timeout=600, key_func=cache_key_with_projection,
+                depends_on=("project", "tag"))
 def get_projects():
+    """
+    List projects. ``?view=card`` returns the lean card fields only and
+    ``?fields=a,b`` any subset of project fields; projections that fit in
+    the card fields are served from a query that skips the heavy columns.
+
+    ``?limit=`` / ``?cursor=`` return one page as ``{"items", "next_cursor"}``
+    (keyset on ``(created_at, id)``); without them the whole list is returned.
+    """
     lang = request.args.get("lang", "es")
     category = request.args.get("category")
+    view = request.args.get("view", "full")
+    fields = request.args.get("fields")
 
-    query = Project.query.options(
-        joinedload(Project.translations),
-        joinedload(Project.images),
-        joinedload(Project.tags),
-        joinedload(Project.urls)
-    )
+    if view not in PROJECT_VIEWS:
+        return error_response("Unknown view", 400, {"available": list(PROJECT_VIEWS)})
+
+    try:
+        limit, after = parse_page_args(request.args)
+    except PaginationError as e:
+        return error_response(str(e), 400)
+
+    if fields:
+        requested = {f.strip() for f in fields.split(",")} - {""}
+        unknown = requested - set(PROJECT_FIELDS)
+        if unknown:
+            return error_response(
+                "Unknown project fields", 400,
+                {"unknown": sorted(unknown), "available": list(PROJECT_FIELDS)}
+            )
+        fields = [f for f in PROJECT_FIELDS if f in requested]
+    elif view == "card":
+        fields = list(CARD_FIELDS)
+
+    if fields and set(fields) <= set(CARD_FIELDS):
+        cards = get_card_view(lang)
+        projects, last_modified = cards.projects, cards.last_modified
+    else:
+        projects = get_view(lang).projects
+        last_modified = get_last_modified("projects", lang=lang)
 
     if category:
-        query = query.filter(Project.category == category)
-
-    projects = query.order_by(desc(Project.created_at)).all()
-    
-    result = []
-    for p in projects:
-        trans = next((t for t in p.translations if t.lang == lang), None)
-        if not trans and p.translations:
-            trans = p.translations[0]
-            
-        if trans:
-            # Sort images by order
-            images = sorted(p.images, key=lambda x: x.order)
-            
-            # Find preview video (gif or video type)
-            preview_video = next((img.url for img in images if img.type in ['video', 'gif']), None)
-            
-            # Serialize URLs
-            urls = [
-                {
-                    "type": url.url_type,
-                    "url": url.url,
-                    "label": url.label,
-                    "order": url.order
-                } for url in sorted(p.urls or [], key=lambda x: x.order)
-            ]
-            
-            result.append({
-                "id": p.id,
-                "slug": p.slug,
-                "category": p.category,
-                "urls": urls,
-                "title": trans.title,
-                "subtitle": trans.subtitle,
-                "summary": trans.summary,
-                "description": trans.description,
-                "content": trans.content,
-                "tags": [t.name for t in p.tags],
-                "images": [{
-                    "url": img.url,
-                    "type": img.type,
-                    "caption": img.caption,
-                    "order": img.order,
-                    "thumbnail_url": img.thumbnail_url,
-                    "alt_text": img.alt_text,
-                    "width": img.width,
-                    "height": img.height,
-                    "is_featured": img.is_featured
-                } for img in images],
-                # Backward compatibility fields
-                "desktop_image": images[0].url if images else None,
-                "mobile_image": images[1].url if len(images) > 1 else None,
-                "preview_video": preview_video,
-                "created_at": p.created_at.isoformat() if p.created_at else None
-            })
-            
-    return jsonify(result), 200
+        projects = [p for p in projects if p["category"] == category]
+
+    next_cursor = None
+    if limit:
+        try:
+            projects, next_cursor = paginate_sequence(projects, limit, after, _project_key)
+        except PaginationError as e:
+            return error_response(str(e), 400)
+    if fields:
+        projects = [_project_fields(p, fields) for p in projects]
+
+    if limit:
+        return snapshot_response({"items": list(projects), "next_cursor": next_cursor}, last_modified)
+    return snapshot_response(list(projects), last_modified)
 
 
 @api_bp.route("/projects/<slug>", methods=["GET"])
 @api_rate_limit()
-@cache_response(timeout=3600, key_func=cache_key_with_lang)
+@cache_response(timeout=3600, soft_timeout=600, key_func=cache_key_with_lang,
+                depends_on=("project", "tag"))
 def get_project(slug):
     lang = request.args.get("lang", "es")
-    
-    project = Project.query.options(
-        joinedload(Project.translations),
-        joinedload(Project.images),
-        joinedload(Project.tags),
-        joinedload(Project.urls)
-    ).filter_by(slug=slug).first()
-    
+
+    project = get_view(lang).projects_by_slug.get(slug)
     if not project:
         return error_response("Project not found", 404)
-        
-    trans = next((t for t in project.translations if t.lang == lang), None)
-    if not trans and project.translations:
-        trans = project.translations[0]
-        
-    images = sorted(project.images, key=lambda x: x.order)
-    preview_video = next((img.url for img in images if img.type in ['video', 'gif']), None)
-    
-    # Serialize URLs
-    urls = [
-        {
-            "type": url.url_type,
-            "url": url.url,
-            "label": url.label,
-            "order": url.order
-        } for url in sorted(project.urls or [], key=lambda x: x.order)
-    ]
-    
-    return jsonify({
-        "id": project.id,
-        "slug": project.slug,
-        "category": project.category,
-        "urls": urls,
-        "title": trans.title if trans else "",
-        "subtitle": trans.subtitle if trans else "",
-        "summary": trans.summary if trans else "",
-        "description": trans.description if trans else "",
-        "content": trans.content if trans else {},
-        "tags": [t.name for t in project.tags],
-        "images": [{
-            "url": img.url,
-            "type": img.type,
-            "caption": img.caption,
-            "order": img.order,
-            "thumbnail_url": img.thumbnail_url,
-            "alt_text": img.alt_text,
-            "width": img.width,
-            "height": img.height,
-            "is_featured": img.is_featured
-        } for img in images],
-        "preview_video": preview_video,
-        "desktop_image": images[0].url if images else None,
-        "mobile_image": images[1].url if len(images) > 1 else None,
-        "created_at": project.created_at.isoformat() if project.created_at else None
-    }), 200
+
+    return snapshot_response(project, get_last_modified("projects", slug, lang=lang))
 
 
 # ==========================================
@@ -184,36 +152,13 @@ def get_project(slug):
 
 @api_bp.route("/experience", methods=["GET"])
 @api_rate_limit()
-@cache_response(timeout=3600, key_func=cache_key_with_lang)
+@cache_response(timeout=3600, soft_timeout=600, key_func=cache_key_with_lang,
+                depends_on=("experience", "tag"))
 def get_experience():
     lang = request.args.get("lang", "es")
-    
-    exps = Experience.query.options(
-        joinedload(Experience.translations),
-        joinedload(Experience.tags)
-    ).order_by(desc(Experience.start_date)).all()
-    
-    result = []
-    for e in exps:
-        trans = next((t for t in e.translations if t.lang == lang), None)
-        if not trans and e.translations:
-            trans = e.translations[0]
-            
-        if trans:
-            result.append({
-                "id": e.id,
-                "slug": e.slug,
-                "company": trans.title,  # Title holds Company Name in DB
-                "location": e.location,
-                "startDate": e.start_date,
-                "endDate": e.end_date,
-                "current": e.current,
-                "title": trans.subtitle,  # Subtitle holds Job Role in DB
-                "description": trans.description,
-                "tags": [t.name for t in e.tags]
-            })
-            
-    return jsonify(result), 200
+    return snapshot_response(
+        list(get_view(lang).experience), get_last_modified("experience", lang=lang)
+    )
 
 
 # ==========================================
@@ -222,37 +167,13 @@ def get_experience():
 
 @api_bp.route("/education", methods=["GET"])
 @api_rate_limit()
-@cache_response(timeout=3600, key_func=cache_key_with_lang)
+@cache_response(timeout=3600, soft_timeout=600, key_func=cache_key_with_lang,
+                depends_on=("education",))
 def get_education():
     lang = request.args.get("lang", "es")
-    
-    edus = Education.query.options(
-        joinedload(Education.translations),
-        joinedload(Education.courses)
-    ).order_by(desc(Education.start_date)).all()
-    
-    result = []
-    for e in edus:
-        trans = next((t for t in e.translations if t.lang == lang), None)
-        if not trans and e.translations:
-            trans = e.translations[0]
-            
-        if trans:
-            result.append({
-                "id": e.id,
-                "slug": e.slug,
-                "institution": e.institution,
-                "location": e.location,
-                "startDate": e.start_date,
-                "endDate": e.end_date,
-                "current": e.current,
-                "title": trans.title,  # Degree
-                "subtitle": trans.subtitle, # Field
-                "description": trans.description,
-                "courses": [c.name for c in sorted(e.courses, key=lambda x: x.order)]
-            })
-            
-    return jsonify(result), 200
+    return snapshot_response(
+        list(get_view(lang).education), get_last_modified("education", lang=lang)
+    )
 
 
 # ==========================================
@@ -261,39 +182,13 @@ def get_education():
 
 @api_bp.route("/skills", methods=["GET"])
 @api_rate_limit()
-@cache_response(timeout=3600, key_func=cache_key_with_lang)
+@cache_response(timeout=3600, soft_timeout=600, key_func=cache_key_with_lang,
+                depends_on=("skill", "skill_category"))
 def get_skills():
     lang = request.args.get("lang", "es")
-    
-    from backend.models.skill import SkillCategory
-    skills = Skill.query.options(
-        joinedload(Skill.translations),
-        joinedload(Skill.skill_category).joinedload(SkillCategory.translations)
-    ).order_by(Skill.order).all()
-
-    result = []
-    for s in skills:
-        trans = next((t for t in s.translations if t.lang == lang), None)
-        if not trans and s.translations:
-            trans = s.translations[0]
-
-        if trans:
-            cat_name = None
-            if s.skill_category:
-                cat_trans = next((t for t in s.skill_category.translations if t.lang == lang), None)
-                cat_name = cat_trans.name if cat_trans else s.skill_category.slug
-            result.append({
-                "id": s.id,
-                "slug": s.slug,
-                "icon_url": s.icon_url,
-                "proficiency": s.proficiency,
-                "category": cat_name,
-                "category_id": s.category_id,
-                "name": trans.name,
-                "description": trans.description
-            })
-            
-    return jsonify(result), 200
+    return snapshot_response(
+        list(get_view(lang).skills), get_last_modified("skills", lang=lang)
+    )
 
 
 # ==========================================
@@ -302,33 +197,13 @@ def get_skills():
 
 @api_bp.route("/certifications", methods=["GET"])
 @api_rate_limit()
-@cache_response(timeout=3600, key_func=cache_key_with_lang)
+@cache_response(timeout=3600, soft_timeout=600, key_func=cache_key_with_lang,
+                depends_on=("certification",))
 def get_certifications():
     lang = request.args.get("lang", "es")
-    
-    certs = Certification.query.options(
-        joinedload(Certification.translations)
-    ).order_by(desc(Certification.issue_date)).all()
-    
-    result = []
-    for c in certs:
-        trans = next((t for t in c.translations if t.lang == lang), None)
-        if not trans and c.translations:
-            trans = c.translations[0]
-            
-        if trans:
-            result.append({
-                "id": c.id,
-                "slug": c.slug,
-                "issuer": c.issuer,
-                "issueDate": c.issue_date,
-                "expiryDate": c.expiry_date,
-                "url": c.credential_url,
-                "title": trans.title,
-                "description": trans.description
-            })
-            
-    return jsonify(result), 200
+    return snapshot_response(
+        list(get_view(lang).certifications), get_last_modified("certifications", lang=lang)
+    )
 
 
 # ==========================================
@@ -337,30 +212,138 @@ def get_certifications():
 
 @api_bp.route("/profile", methods=["GET"])
 @api_rate_limit()
-@cache_response(timeout=3600, key_func=cache_key_with_lang)
+@cache_response(timeout=3600, soft_timeout=600, key_func=cache_key_with_lang,
+                depends_on=("profile",))
 def get_profile():
     lang = request.args.get("lang", "es")
-    
-    profile = Profile.query.options(
-        joinedload(Profile.translations)
-    ).first()  # Assuming single profile
-    
+
+    profile = get_view(lang).profile  # Assuming single profile
     if not profile:
         return error_response("Profile not found", 404)
-        
-    trans = next((t for t in profile.translations if t.lang == lang), None)
-    if not trans and profile.translations:
-        trans = profile.translations[0]
-        
-    return jsonify({
-        "name": profile.name,
-        "email": profile.email,
-        "location": profile.location,
-        "avatar_url": profile.avatar_url,
-        "social": profile.social_links,
-        "role": trans.role if trans else "",
-        "tagline": trans.tagline if trans else "",
-        "bio": trans.bio if trans else ""
-    }), 200
 
+    return snapshot_response(profile, get_last_modified("profile", lang=lang))
 
+
+# ==========================================
+# TAGS
+# ==========================================
+
+@api_bp.route("/tags", methods=["GET"])
+@api_rate_limit()
+@cache_response(timeout=3600, soft_timeout=600, key_func=cache_key_with_lang,
+                depends_on=("project", "experience", "tag"))
+def get_tags():
+    """Tags in use with their project and experience counts, most used first."""
+    lang = request.args.get("lang", "es")
+    view = get_view(lang)
+    return snapshot_response(
+        {"tags": list(view.tag_facets), "total": len(view.tag_facets)},
+        view.last_modified.get("tags"),
+    )
+
+
+@api_bp.route("/tags/<slug>", methods=["GET"])
+@api_rate_limit()
+@cache_response(timeout=3600, soft_timeout=600, key_func=cache_key_with_lang,
+                depends_on=("project", "experience", "tag"))
+def get_tag(slug):
+    """Projects (as cards) and experience using a tag, from the read model's tag index."""
+    lang = request.args.get("lang", "es")
+    view = get_view(lang)
+
+    entry = view.tags.get(slug)
+    if not entry:
+        return error_response("Tag not found", 404)
+
+    return snapshot_response({
+        "tag": entry["tag"],
+        "projects": [_project_fields(p, CARD_FIELDS) for p in entry["projects"]],
+        "experience": list(entry["experience"]),
+    }, view.last_modified.get("tags"))
+
+
+# ==========================================
+# BUNDLE
+# ==========================================
+
+# Response order; each is a read model attribute with the same payload as its own endpoint
+BUNDLE_SECTIONS = ("profile", "experience", "education", "skills", "certifications", "projects")
+
+
+@api_bp.route("/bundle", methods=["GET"])
+@api_rate_limit()
+@cache_response(timeout=3600, soft_timeout=600, key_func=cache_key_with_include,
+                depends_on=ENTITY_TYPES)
+def get_bundle():
+    """Every section for one language in one response; ``?include=a,b`` selects sections."""
+    lang = request.args.get("lang", "es")
+    include = request.args.get("include")
+
+    sections = BUNDLE_SECTIONS
+    if include:
+        requested = {s.strip() for s in include.split(",")} - {""}
+        unknown = requested - set(BUNDLE_SECTIONS)
+        if unknown:
+            return error_response(
+                "Unknown bundle sections", 400,
+                {"unknown": sorted(unknown), "available": list(BUNDLE_SECTIONS)}
+            )
+        sections = [s for s in BUNDLE_SECTIONS if s in requested]
+
+    view = get_view(lang)
+    payload = {"lang": lang}
+    for section in sections:
+        value = getattr(view, section)
+        payload[section] = list(value) if isinstance(value, tuple) else value
+
+    stamps = [view.last_modified.get(section) for section in sections]
+    return snapshot_response(payload, max((s for s in stamps if s is not None), default=None))
+
+
+SEARCH_MAX_QUERY = 200
+SEARCH_MAX_RESULTS = 50
+
+
+@api_bp.route("/search", methods=["GET"])
+@api_rate_limit()
+def search_portfolio():
+    """
+    Full-text search over projects, experience and skills in one language.
+    ``?type=a,b`` restricts the entity types; the last query word also
+    matches as a prefix. Not response-cached: queries are answered from the
+    in-memory index in well under a millisecond.
+    """
+    started = time.perf_counter()
+    query = request.args.get("q", "").strip()
+    lang = request.args.get("lang", "es")
+    types = request.args.get("type")
+
+    if not query:
+        return error_response("Missing search query", 400)
+    if len(query) > SEARCH_MAX_QUERY:
+        return error_response(f"Query must be at most {SEARCH_MAX_QUERY} characters", 400)
+
+    if types:
+        types = {t.strip() for t in types.split(",")} - {""}
+        unknown = types - set(SEARCH_TYPES)
+        if unknown:
+            return error_response(
+                "Unknown search types", 400,
+                {"unknown": sorted(unknown), "available": list(SEARCH_TYPES)}
+            )
+
+    try:
+        limit = int(request.args.get("limit", 10))
+    except ValueError:
+        return error_response("limit must be an integer", 400)
+    if not 1 <= limit <= SEARCH_MAX_RESULTS:
+        return error_response(f"limit must be between 1 and {SEARCH_MAX_RESULTS}", 400)
+
+    total, results = search(request.args.get("q", ""), lang, types=types, limit=limit)
+    return jsonify({
+        "query": query,
+        "lang": lang,
+        "total": total,
+        "results": results,
+        "took_ms": round((time.perf_counter() - started) * 1000, 3),
+    })
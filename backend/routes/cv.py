@@ -18,6 +18,7 @@ from backend.models.education import Education
 from backend.models.skill import Skill, SkillCategory
 from backend.models.certification import Certification
 from backend.services.pdf_service import PDFService
+from backend.services.cv_cache import cv_cache, cv_language
 from sqlalchemy import desc
 
 cv_bp = Blueprint("cv", __name__)
@@ -111,14 +112,20 @@ def format_date(date_obj, lang="es"):
         return date_obj.strftime("%b %Y")
 
 
+@cv_cache()
 def build_cv_from_models(lang="es"):
-    """Build JSON Resume format from database models"""
-    from sqlalchemy.orm import joinedload
+    """
+    Build JSON Resume format from database models.
+
+    Cached per language in the shared cache until a CV entity type is
+    invalidated (see ``cv_cache``); callers must not mutate the result.
+    """
+    from sqlalchemy.orm import joinedload, selectinload
 
     current_app.logger.info(f"Building CV for language: {lang}")
     try:
         # 1. Fetch Profile
-        profile = Profile.query.options(joinedload(Profile.translations)).first()
+        profile = Profile.query.options(selectinload(Profile.translations)).first()
         if not profile:
             return None
 
@@ -181,8 +188,8 @@ def build_cv_from_models(lang="es"):
 
         # 2. Fetch Experience
         experiences = Experience.query.options(
-            joinedload(Experience.translations),
-            joinedload(Experience.tags),
+            selectinload(Experience.translations),
+            selectinload(Experience.tags),
         ).order_by(desc(Experience.start_date)).all()
         for exp in experiences:
             trans = next((t for t in exp.translations if t.lang == lang), None)
@@ -226,8 +233,8 @@ def build_cv_from_models(lang="es"):
 
         # 3. Fetch Education
         educations = Education.query.options(
-            joinedload(Education.translations),
-            joinedload(Education.courses)
+            selectinload(Education.translations),
+            selectinload(Education.courses)
         ).order_by(desc(Education.start_date)).all()
         for edu in educations:
             trans = next((t for t in edu.translations if t.lang == lang), None)
@@ -255,8 +262,8 @@ def build_cv_from_models(lang="es"):
 
         # 4. Fetch Skills
         skills = Skill.query.filter_by(is_visible_cv=True).options(
-            joinedload(Skill.translations),
-            joinedload(Skill.skill_category).joinedload(SkillCategory.translations)
+            selectinload(Skill.translations),
+            joinedload(Skill.skill_category).selectinload(SkillCategory.translations)
         ).order_by(Skill.order).all()
 
         skills_by_category = {}
@@ -320,7 +327,7 @@ def build_cv_from_models(lang="es"):
             ]
 
         # 5. Fetch Certifications
-        certs = Certification.query.options(joinedload(Certification.translations)).order_by(desc(Certification.issue_date)).all()
+        certs = Certification.query.options(selectinload(Certification.translations)).order_by(desc(Certification.issue_date)).all()
         for cert in certs:
             trans = next((t for t in cert.translations if t.lang == lang), None)
             if not trans: continue
@@ -346,7 +353,7 @@ def build_cv_from_models(lang="es"):
 def cv_view():
     """Render CV HTML page"""
     try:
-        lang = request.args.get("lang", "es")
+        lang = cv_language(request.args.get("lang", "es"))
         private = request.args.get("private") == "1"
         cv_data = build_cv_from_models(lang)
 
@@ -370,64 +377,200 @@ def cv_view():
         return render_template("error.html", error="Error generating CV"), 500
 
 
+def _pdf_filename(cv_data, lang, private=False):
+    """Download name derived from the profile name."""
+    name_slug = cv_data["basics"]["name"].replace(" ", "_")
+    suffix = "_Private" if private else ""
+    return f"CV_{name_slug}_{lang}{suffix}.pdf"
+
+
 @cv_bp.route("/cv/pdf", methods=["GET"])
 @strict_rate_limit()
 def cv_pdf():
     """Generate and download CV PDF with caching"""
     try:
-        from backend.services.cv_cache import get_cached_pdf, set_cached_pdf
-        from io import BytesIO
+        from backend.services.cv_cache import (
+            get_cached_pdf, set_cached_pdf, get_cv_version, get_pdf_hash
+        )
 
-        lang = request.args.get("lang", "es")
+        lang = cv_language(request.args.get("lang", "es"))
         preview = request.args.get("preview", "0") == "1"
         private = request.args.get("private") == "1"
+        variant = "private" if private else "public"
+        # Read before the document so a PDF never outlives a newer version
+        version = get_cv_version()
         cv_data = build_cv_from_models(lang)
 
         if not cv_data:
             return jsonify({"error": "CV data not found"}), 404
 
+        # Content address of the public document; the variant is part of the file name
+        data_hash = get_pdf_hash(lang, cv_data, version)
+        filename = _pdf_filename(cv_data, lang, private)
+
         if private:
             cv_data = _strip_contact_info(cv_data)
 
-        # Derive filename from profile name
-        name_slug = cv_data["basics"]["name"].replace(" ", "_")
-        suffix = "_Private" if private else ""
-        filename = f"CV_{name_slug}_{lang}{suffix}.pdf"
-
-        # Check cache first
-        cached_pdf, cache_hit = get_cached_pdf(lang, cv_data)
-        if cache_hit and cached_pdf:
-            current_app.logger.info(f"PDF cache HIT for lang={lang}")
-            _notify_cv_download(lang)
+        def send_pdf(pdf):
+            # A path lets the server use sendfile instead of copying through Python
             return send_file(
-                BytesIO(cached_pdf),
+                pdf,
                 mimetype="application/pdf",
                 as_attachment=not preview,
                 download_name=filename,
+                etag=f"{data_hash}-{variant}",
             )
 
+        # Check cache first
+        cached_path, cache_hit = get_cached_pdf(lang, data_hash, variant)
+        if cache_hit:
+            try:
+                response = send_pdf(cached_path)
+            except FileNotFoundError:
+                current_app.logger.info(f"PDF for lang={lang} evicted before it was sent")
+            else:
+                current_app.logger.info(f"PDF cache HIT for lang={lang}")
+                _notify_cv_download(lang)
+                return response
+
         # Cache miss - generate PDF
         current_app.logger.info(f"PDF cache MISS for lang={lang}, generating...")
         pdf_service = PDFService()
         pdf_bytes = pdf_service.generate_cv_pdf(cv_data, lang)
 
-        set_cached_pdf(lang, cv_data, pdf_bytes)
+        stored_path = set_cached_pdf(lang, data_hash, pdf_bytes, variant)
         current_app.logger.info(f"PDF cached for lang={lang}")
 
         # Alert: CV downloaded (fire for both cache hit and miss — moved below)
         _notify_cv_download(lang)
 
-        return send_file(
-            pdf_bytes,
-            mimetype="application/pdf",
-            as_attachment=not preview,
-            download_name=filename,
-        )
+        try:
+            return send_pdf(stored_path) if stored_path else send_pdf(pdf_bytes)
+        except FileNotFoundError:
+            pdf_bytes.seek(0)
+            return send_pdf(pdf_bytes)
     except Exception as e:
         current_app.logger.error(f"PDF generation error: {traceback.format_exc()}")
         return render_template("error.html"), 500
 
 
+def _job_response(job):
+    """Job state as returned by the job endpoints, with ready-made URLs."""
+    from flask import url_for
+
+    payload = {
+        "job_id": job["id"],
+        "status": job["status"],
+        "lang": job["lang"],
+        "private": job["variant"] == "private",
+        "created_at": job["created_at"],
+        "started_at": job["started_at"],
+        "finished_at": job["finished_at"],
+        "render_ms": job["render_ms"],
+        "error": job["error"],
+        "status_url": url_for("cv.cv_pdf_job_status", job_id=job["id"]),
+        "download_url": None,
+    }
+    if job["status"] == "done":
+        payload["download_url"] = url_for("cv.cv_pdf_file", file_id=job["file_id"])
+    return payload
+
+
+@cv_bp.route("/cv/pdf/jobs", methods=["POST"])
+@strict_rate_limit()
+def cv_pdf_job_create():
+    """
+    Queue a CV PDF render and return at once. 202 while the job is queued or
+    running (poll ``status_url``), 200 when the PDF is already available.
+    Identical requests attach to the same job.
+    """
+    from backend.services.cv_cache import get_cv_version, get_pdf_hash
+    from backend.services.pdf_jobs import submit_pdf_job, PDFJobQueueFull
+
+    try:
+        params = {**request.args, **(request.get_json(silent=True) or {})}
+        lang = cv_language(str(params.get("lang", "es")))
+        private = str(params.get("private", "")).lower() in ("1", "true")
+        variant = "private" if private else "public"
+
+        version = get_cv_version()
+        cv_data = build_cv_from_models(lang)
+        if not cv_data:
+            return jsonify({"error": "CV data not found"}), 404
+        data_hash = get_pdf_hash(lang, cv_data, version)
+
+        try:
+            job = submit_pdf_job(current_app._get_current_object(), lang, variant, data_hash)
+        except PDFJobQueueFull:
+            response = jsonify({"error": "Too many PDF jobs in progress, try again shortly"})
+            response.headers["Retry-After"] = "10"
+            return response, 503
+        except ValueError:
+            return jsonify({"error": "Invalid language"}), 400
+
+        return jsonify(_job_response(job)), 200 if job["status"] == "done" else 202
+    except Exception:
+        current_app.logger.error(f"PDF job error: {traceback.format_exc()}")
+        return jsonify({"error": "PDF job could not be created"}), 500
+
+
+@cv_bp.route("/cv/pdf/jobs/<job_id>", methods=["GET"])
+@api_rate_limit()
+def cv_pdf_job_status(job_id):
+    """Progress of a PDF job: queued, running, done (with ``download_url``) or failed."""
+    from backend.services.cv_cache import get_cached_pdf
+    from backend.services.pdf_jobs import get_job, parse_job_id, done_job
+
+    job = get_job(job_id)
+    if not job:
+        # State expired or lost, but the id is the PDF's address: it may still be stored
+        try:
+            data_hash, lang, variant = parse_job_id(job_id)
+        except ValueError:
+            return jsonify({"error": "Job not found"}), 404
+        if not get_cached_pdf(lang, data_hash, variant)[1]:
+            return jsonify({"error": "Job not found"}), 404
+        job = done_job(job_id, lang, variant)
+    response = jsonify(_job_response(job))
+    if job["status"] in ("queued", "running"):
+        response.headers["Retry-After"] = "2"
+    return response
+
+
+@cv_bp.route("/cv/pdf/files/<file_id>.pdf", methods=["GET"])
+@api_rate_limit()
+def cv_pdf_file(file_id):
+    """Download a finished PDF from the store by its content address."""
+    from backend.services.cv_cache import get_cached_pdf
+    from backend.services.pdf_jobs import parse_job_id
+
+    try:
+        data_hash, lang, variant = parse_job_id(file_id)
+    except ValueError:
+        return jsonify({"error": "PDF not found"}), 404
+
+    path, hit = get_cached_pdf(lang, data_hash, variant)
+    if not hit:
+        return jsonify({"error": "PDF not found or expired, create a new job"}), 404
+
+    cv_data = build_cv_from_models(lang)
+    filename = _pdf_filename(cv_data, lang, variant == "private") if cv_data else f"CV_{lang}.pdf"
+    try:
+        # Content-addressed: the file behind this URL never changes
+        response = send_file(
+            path,
+            mimetype="application/pdf",
+            as_attachment=request.args.get("preview") != "1",
+            download_name=filename,
+            etag=file_id,
+            max_age=86400,
+        )
+    except FileNotFoundError:
+        return jsonify({"error": "PDF not found or expired, create a new job"}), 404
+    _notify_cv_download(lang)
+    return response
+
+
 @cv_bp.route("/cv/clear-cache", methods=["POST"])
 @requires_login
 @requires_role("admin")
@@ -435,10 +578,11 @@ def cv_pdf():
 def clear_cv_cache():
     """Manually clear CV data and PDF caches"""
     try:
-        from backend.services.cv_cache import invalidate_all_cv_cache, get_cache_stats
+        from backend.services.cv_cache import invalidate_all_cv_cache, invalidate_pdf_cache, get_cache_stats
 
         stats_before = get_cache_stats()
         invalidate_all_cv_cache()
+        invalidate_pdf_cache()
         stats_after = get_cache_stats()
 
         return jsonify({
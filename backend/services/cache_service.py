@@ -6,10 +6,30 @@ Automatically falls back to in-memory if Redis is unavailable.
 """
 
 import os
+import mmap
+import gzip
+import struct
+import time
+import uuid
+import hashlib
 import logging
+import tempfile
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from functools import wraps
 from flask_caching import Cache
 
+try:
+    import brotli
+except ImportError:  # Flask-Compress installs it, but it is optional here
+    brotli = None
+
+try:
+    import fcntl
+except ImportError:  # Windows: no shared generation file, counters stay per process
+    fcntl = None
+
 logger = logging.getLogger(__name__)
 
 # Cache configuration based on environment
@@ -35,6 +55,21 @@ else:
 # Initialize cache instance (will be initialized with app later)
 cache = Cache(config=cache_config)
 
+# Shared Redis client for locks and counters (created on first use)
+_redis_client = None
+
+
+def get_redis_client():
+    """Return the process-wide Redis client, or None when Redis is not configured."""
+    global _redis_client
+    if not REDIS_URL:
+        return None
+    if _redis_client is None:
+        import redis
+
+        _redis_client = redis.from_url(REDIS_URL, socket_connect_timeout=5, socket_timeout=5)
+    return _redis_client
+
 
 def cache_key_with_lang(*args, **kwargs):
     """
@@ -49,6 +84,36 @@ def cache_key_with_lang(*args, **kwargs):
     return f"{request.path}:{lang}:{entity_type}:{category}"
 
 
+def _normalized_list(value):
+    return ",".join(sorted({part.strip() for part in (value or "").split(",")} - {""}))
+
+
+def cache_key_with_projection(*args, **kwargs):
+    """
+    Language-aware cache key that also covers ``?view=``, ``?fields=`` and
+    the ``?limit=`` / ``?cursor=`` page, so each projection and page of a
+    list is cached separately.
+    """
+    from flask import request
+
+    view = request.args.get("view", "full")
+    fields = _normalized_list(request.args.get("fields")) or "all"
+    page = f"{request.args.get('limit', 'all')}:{request.args.get('cursor', '-')}"
+    return f"{cache_key_with_lang(*args, **kwargs)}:{view}:{fields}:{page}"
+
+
+def cache_key_with_include(*args, **kwargs):
+    """
+    Cache key for endpoints that select sections with ``?include=``.
+    The section list is normalized, so ``a,b`` and ``b,a`` share an entry.
+    """
+    from flask import request
+
+    lang = request.args.get("lang", "es")
+    include = _normalized_list(request.args.get("include"))
+    return f"{request.path}:{lang}:{include or 'all'}"
+
+
 def cache_key_simple():
     """
     Simple cache key based on request path only.
@@ -59,53 +124,908 @@ def cache_key_simple():
     return request.path
 
 
-def invalidate_entities_cache():
+# ============================================
+# Generation counters
+# ============================================
+
+# Entity types cached responses can declare a dependency on
+ENTITY_TYPES = (
+    "project", "experience", "education", "skill", "skill_category",
+    "certification", "profile", "tag",
+)
+GLOBAL_GENERATION = "all"  # Bumped to invalidate everything at once
+
+KEY_NAMESPACE = "api:v2:"
+GEN_KEY_PREFIX = "portfolio:gen:"
+GEN_TIMES_KEY = "portfolio:gen_at"  # Hash: name -> time of its last bump (seconds)
+
+# Without Redis, counters live in a small memory-mapped file shared by every
+# worker on the machine, and each worker keeps the values it last saw here
+_local_generations = {}
+_local_bumped_at = {}
+_local_generations_lock = threading.Lock()
+_local_stamp = None
+
+GEN_FILE = os.getenv("CACHE_GENERATION_FILE") or os.path.join(
+    tempfile.gettempdir(),
+    "portfolio-generations-"
+    + hashlib.blake2b(os.getenv("DATABASE_URL", "").encode(), digest_size=6).hexdigest(),
+)
+
+
+class _GenerationFile:
+    """
+    Generation counters as int64 slots in a file mapped by every worker.
+
+    Reading is a single ``unpack_from`` on shared memory (no syscall);
+    bumps take an exclusive ``flock``. Slots follow ``names``, so new
+    entity types must be appended to keep existing files valid. The time
+    of each counter's last bump is kept at ``TIMES_OFFSET``.
+    """
+
+    TIMES_OFFSET = 4096  # Room for 512 counters before the bump times
+
+    def __init__(self, path, names):
+        self.path = path
+        self.names = names
+        self._slots = struct.Struct(f"<{len(names)}q")
+        self._times = struct.Struct(f"<{len(names)}d")
+        self._size = self.TIMES_OFFSET + self._times.size
+        self._fd = None
+        self._map = None
+        self._pid = None
+
+    def _open(self):
+        # Reopen after fork: flock is per open file, so a shared fd would not exclude
+        if self._pid == os.getpid():
+            return
+        fd = os.open(self.path, os.O_RDWR | os.O_CREAT, 0o600)
+        if os.fstat(fd).st_size < self._size:
+            os.ftruncate(fd, self._size)  # New slots read as zero
+        self._fd, self._map, self._pid = fd, mmap.mmap(fd, self._size), os.getpid()
+
+    def read(self):
+        self._open()
+        return self._slots.unpack_from(self._map)
+
+    def read_times(self):
+        self._open()
+        return self._times.unpack_from(self._map, self.TIMES_OFFSET)
+
+    def bump(self, names):
+        self._open()
+        fcntl.flock(self._fd, fcntl.LOCK_EX)
+        try:
+            values = list(self._slots.unpack_from(self._map))
+            times = list(self._times.unpack_from(self._map, self.TIMES_OFFSET))
+            now = time.time()
+            for name in names:
+                values[self.names.index(name)] += 1
+                times[self.names.index(name)] = now
+            self._slots.pack_into(self._map, 0, *values)
+            self._times.pack_into(self._map, self.TIMES_OFFSET, *times)
+        finally:
+            fcntl.flock(self._fd, fcntl.LOCK_UN)
+        return values
+
+
+# With Redis, every worker mirrors the counters so that resolving a key
+# needs no round trip. Bumps are broadcast on GEN_CHANNEL; while the
+# subscription is down the mirror is re-read at most every GEN_POLL_INTERVAL.
+GEN_CHANNEL = "portfolio:generations"
+GEN_POLL_INTERVAL = 5  # seconds
+GEN_RESYNC_INTERVAL = 60  # seconds between full re-reads while subscribed
+
+_mirror_generations = {}
+_mirror_live = False
+_mirror_synced_at = float("-inf")
+_listener_pid = None
+_listener_lock = threading.Lock()
+
+# Increments the counters, records when, and publishes the new values atomically.
+# KEYS: generation counters, then GEN_TIMES_KEY; ARGV: channel, then one name per counter
+_BUMP_SCRIPT = """
+local now = redis.call('TIME')
+local parts = {}
+for i = 1, #KEYS - 1 do
+    parts[i] = ARGV[i + 1] .. '=' .. redis.call('INCR', KEYS[i])
+    redis.call('HSET', KEYS[#KEYS], ARGV[i + 1], now[1] .. '.' .. string.format('%06d', now[2]))
+end
+local message = table.concat(parts, ' ')
+redis.call('PUBLISH', ARGV[1], message)
+return message
+"""
+
+
+def _generation_names(depends_on):
+    return (GLOBAL_GENERATION, *depends_on)
+
+
+def _parse_generations(message):
+    if isinstance(message, bytes):
+        message = message.decode()
+    return {name: int(value) for name, value in (part.split("=") for part in message.split())}
+
+
+def _apply_generations(generations, exact=False):
+    """
+    Update the mirror and drop L1 entries built from changed counters.
+
+    Broadcasts only ever move counters forward (they may arrive out of
+    order); a full re-read is ``exact`` so a flushed Redis is followed too.
+    """
+    changed = {
+        name for name, value in generations.items()
+        if value > _mirror_generations.get(name, 0)
+        or (exact and value != _mirror_generations.get(name, 0))
+    }
+    if changed:
+        _mirror_generations.update({name: generations[name] for name in changed})
+        _l1.drop(changed)
+
+
+def _sync_generations(client):
+    """Re-read every counter from Redis into the mirror."""
+    global _mirror_synced_at
+
+    names = (GLOBAL_GENERATION, *ENTITY_TYPES)
+    values = client.mget([f"{GEN_KEY_PREFIX}{name}" for name in names])
+    _apply_generations({name: int(value or 0) for name, value in zip(names, values)}, exact=True)
+    _mirror_synced_at = time.monotonic()
+
+
+def _listen_for_generations():
+    """Worker thread: keep the mirror current from GEN_CHANNEL, reconnecting on errors."""
+    global _mirror_live
+    import redis
+
+    backoff = 1
+    while True:
+        try:
+            client = redis.from_url(REDIS_URL, socket_connect_timeout=5, health_check_interval=30)
+            pubsub = client.pubsub(ignore_subscribe_messages=True)
+            pubsub.subscribe(GEN_CHANNEL)
+            # Subscribed first, so no bump can fall between the read and the feed
+            _sync_generations(client)
+            _mirror_live = True
+            backoff = 1
+            logger.info(f"Subscribed to cache invalidations on {GEN_CHANNEL}")
+
+            while True:
+                message = pubsub.get_message(timeout=GEN_POLL_INTERVAL)
+                if message:
+                    _apply_generations(_parse_generations(message["data"]))
+                if time.monotonic() - _mirror_synced_at >= GEN_RESYNC_INTERVAL:
+                    _sync_generations(client)
+        except Exception as e:
+            _mirror_live = False
+            logger.warning(f"Cache invalidation subscriber lost, polling instead: {e}")
+            time.sleep(backoff)
+            backoff = min(backoff * 2, 30)
+
+
+def _ensure_listener():
+    """Start the subscriber thread once per worker process (also after a fork)."""
+    global _listener_pid, _mirror_live
+
+    if _listener_pid == os.getpid():
+        return
+    with _listener_lock:
+        if _listener_pid != os.getpid():
+            _listener_pid = os.getpid()
+            _mirror_live = False  # A thread inherited across fork is not running here
+            threading.Thread(
+                target=_listen_for_generations, name="cache-generations", daemon=True
+            ).start()
+
+
+_generation_file = _GenerationFile(GEN_FILE, (GLOBAL_GENERATION, *ENTITY_TYPES)) if fcntl else None
+
+# Counters as this worker last saw them when watching for other workers' bumps
+_watched_generations = {}
+_watcher_pid = None
+
+
+def _sync_local_generations():
+    """
+    Pick up bumps made by other workers through the shared file.
+
+    Called on every lookup; when the stamp moved, L1 entries depending on
+    the changed counters are dropped, as a broadcast would with Redis.
+    """
+    global _local_stamp
+
+    if _generation_file is None:
+        return _local_generations
+    try:
+        stamp = _generation_file.read()
+    except OSError as e:
+        logger.warning(f"Generation file {GEN_FILE} unavailable: {e}")
+        return None
+    if stamp != _local_stamp:
+        with _local_generations_lock:
+            changed = {
+                name for name, value in zip(_generation_file.names, stamp)
+                if _local_generations.get(name, 0) != value
+            }
+            _local_generations.update(zip(_generation_file.names, stamp))
+            _local_stamp = stamp
+        _l1.drop(changed)
+    return _local_generations
+
+
+def _current_generations():
+    """
+    Counters to build keys from, or None when they cannot be read.
+
+    Without Redis these come from the shared generation file (or stay in
+    process where ``fcntl`` is unavailable). With Redis it is the mirror,
+    polled directly whenever the subscription is not live.
+    """
+    client = get_redis_client()
+    if client is None:
+        return _sync_local_generations()
+
+    _ensure_listener()
+    if not _mirror_live and time.monotonic() - _mirror_synced_at >= GEN_POLL_INTERVAL:
+        try:
+            _sync_generations(client)
+        except Exception as e:
+            logger.warning(f"Failed to read cache generations: {e}")
+            return None
+    return _mirror_generations
+
+
+def _other_workers_bumps():
+    """Counters in the generation file moved since the last check, other than by this worker."""
+    stamp = _generation_file.read()
+    with _local_generations_lock:
+        changed = {
+            name for name, value in zip(_generation_file.names, stamp)
+            if value > _watched_generations.get(name, 0)
+        }
+        _watched_generations.update(zip(_generation_file.names, stamp))
+    return changed
+
+
+def _watch_generation_file(on_bump, interval):
+    """Worker thread: report other workers' bumps to ``on_bump`` every ``interval`` seconds."""
+    while True:
+        time.sleep(interval)
+        try:
+            changed = _other_workers_bumps()
+            if changed:
+                on_bump(() if GLOBAL_GENERATION in changed else tuple(sorted(changed)))
+        except Exception as e:
+            logger.warning(f"Failed to watch generation file {GEN_FILE}: {e}")
+
+
+def watch_generation_file(on_bump, interval=GEN_POLL_INTERVAL):
+    """
+    Without Redis, call ``on_bump(entity_types)`` from a background thread
+    whenever another worker bumps counters in the shared generation file
+    (``()`` when the global generation moved). Started once per process.
+
+    Returns False when there is nothing to watch: with Redis the shared
+    cache is already refilled by the worker that saved, and without
+    ``fcntl`` there is no shared file.
+    """
+    global _watcher_pid
+
+    if get_redis_client() is not None or _generation_file is None:
+        return False
+    with _listener_lock:
+        if _watcher_pid == os.getpid():
+            return True
+        _watcher_pid = os.getpid()
+        _other_workers_bumps()  # Baseline: what is already there is not news
+    threading.Thread(
+        target=_watch_generation_file, args=(on_bump, interval), name="cache-generation-watch", daemon=True
+    ).start()
+    return True
+
+
+def generation_stamp(*entity_types):
+    """
+    Current counters of the global generation and ``entity_types``.
+
+    Process-local caches compare this against the stamp they were filled
+    under to notice invalidations made by other workers. None when the
+    counters cannot be read.
+    """
+    generations = _current_generations()
+    if generations is None:
+        return None
+    return tuple(generations.get(name, 0) for name in _generation_names(entity_types))
+
+
+def bump_generation(*entity_types):
+    """
+    Invalidate every cached response built from ``entity_types``.
+
+    With no arguments the global generation is bumped, which invalidates
+    all responses. Each bump is a single O(1) INCR, broadcast to every
+    worker so their L1 caches drop the affected entries; superseded keys
+    are never read again and simply age out of the backend.
+    """
+    names = entity_types or (GLOBAL_GENERATION,)
+    unknown = set(names) - set(ENTITY_TYPES) - {GLOBAL_GENERATION}
+    if unknown:
+        raise ValueError(f"Unknown entity types: {sorted(unknown)}")
+
+    client = get_redis_client()
+    if client is not None:
+        message = client.eval(
+            _BUMP_SCRIPT, len(names) + 1, *(f"{GEN_KEY_PREFIX}{name}" for name in names),
+            GEN_TIMES_KEY, GEN_CHANNEL, *names,
+        )
+        # Don't wait for our own broadcast to stop serving superseded entries
+        _apply_generations(_parse_generations(message))
+        return
+
+    if _generation_file is not None:
+        values = _generation_file.bump(names)
+        with _local_generations_lock:
+            # Our own bumps are warmed by our own invalidation, not the watcher
+            _watched_generations.update((name, values[_generation_file.names.index(name)]) for name in names)
+        _sync_local_generations()
+        return
+
+    with _local_generations_lock:
+        for name in names:
+            _local_generations[name] = _local_generations.get(name, 0) + 1
+            _local_bumped_at[name] = time.time()
+    _l1.drop(set(names))
+
+
+def generation_bumped_at(*entity_types):
+    """
+    When the global generation or any of ``entity_types`` was last bumped
+    (epoch seconds), or None if never (or unreadable).
+
+    Deleting a row leaves no ``updated_at`` behind; this time stands in
+    for it in Last-Modified. Read only when a view is built, so it costs a
+    round trip with Redis.
+    """
+    names = _generation_names(entity_types)
+    try:
+        client = get_redis_client()
+        if client is not None:
+            times = [float(t) for t in client.hmget(GEN_TIMES_KEY, names) if t]
+        elif _generation_file is not None:
+            times = [t for name, t in zip(_generation_file.names, _generation_file.read_times()) if name in names]
+        else:
+            times = [_local_bumped_at[name] for name in names if name in _local_bumped_at]
+    except Exception as e:
+        logger.warning(f"Failed to read cache generation times: {e}")
+        return None
+    return max((t for t in times if t), default=None)
+
+
+def _versioned_lookup(cache_key, depends_on, ttl=None):
+    """
+    Resolve ``cache_key`` against the current generations and fetch it,
+    from this worker's L1 first and then from the shared backend (L2).
+
+    L2 hits are copied into L1 for ``ttl`` seconds from their creation.
+    Returns ``(versioned_key, entry)``; ``versioned_key`` is None when the
+    generations cannot be read, in which case the response is not cached.
+    """
+    generations = _current_generations()
+    if generations is None:
+        return None, None
+
+    gens = ".".join(str(generations.get(name, 0)) for name in _generation_names(depends_on))
+    versioned = f"{KEY_NAMESPACE}{gens}:{cache_key}"
+
+    entry = _l1.get(versioned)
+    if entry is not None:
+        _count("l1_hits")
+        return versioned, entry
+
+    try:
+        entry = cache.get(versioned)
+    except Exception as e:
+        logger.warning(f"Cache lookup failed for {cache_key}, bypassing cache: {e}")
+        return None, None
+
+    if entry is None:
+        _count("misses")
+    else:
+        _count("l2_hits")
+        if ttl:
+            _l1.set(versioned, entry, depends_on, ttl)
+    return versioned, entry
+
+
+# ============================================
+# L1: in-process LRU in front of the shared cache
+# ============================================
+
+# Per worker; 0 disables L1
+L1_MAX_BYTES = int(os.getenv("CACHE_L1_MAX_BYTES", 32 * 1024 * 1024))
+
+
+class _LocalLRU:
+    """
+    Byte-bounded LRU of cache entries private to one worker.
+
+    Entries are shared, never copied, so a hit costs neither a round trip
+    nor unpickling; callers must not mutate them. Each entry remembers the
+    entity types it depends on so invalidations can drop it right away.
+    """
+
+    def __init__(self, max_bytes):
+        self.max_bytes = max_bytes
+        self.size = 0
+        self._items = OrderedDict()  # key -> (entry, size, depends_on, expires)
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._items)
+
+    def get(self, key):
+        with self._lock:
+            item = self._items.get(key)
+            if item is None:
+                return None
+            if item[3] <= time.time():
+                self._pop(key)
+                return None
+            self._items.move_to_end(key)
+            return item[0]
+
+    def set(self, key, entry, depends_on, ttl):
+        size = sum(len(entry[name]) for name in ("body", "gzip", "br") if entry[name])
+        if size > self.max_bytes:
+            return
+        with self._lock:
+            if key in self._items:
+                self._pop(key)
+            self._items[key] = (entry, size, frozenset(depends_on), entry["created"] + ttl)
+            self.size += size
+            while self.size > self.max_bytes:
+                self._pop(next(iter(self._items)))
+
+    def drop(self, names):
+        """Drop entries depending on any of ``names``; the global generation drops all."""
+        with self._lock:
+            if GLOBAL_GENERATION in names:
+                self._items.clear()
+                self.size = 0
+                return
+            for key in [key for key, item in self._items.items() if item[2] & names]:
+                self._pop(key)
+
+    def clear(self):
+        self.drop({GLOBAL_GENERATION})
+
+    def _pop(self, key):
+        self.size -= self._items.pop(key)[1]
+
+
+_l1 = _LocalLRU(L1_MAX_BYTES)
+
+_stats = {"l1_hits": 0, "l2_hits": 0, "misses": 0}
+_stats_lock = threading.Lock()
+
+
+def _count(name):
+    with _stats_lock:
+        _stats[name] += 1
+
+
+def clear_local_cache():
+    """Empty this worker's L1 (the shared cache is left alone)."""
+    _l1.clear()
+
+
+def get_cache_stats():
+    """Lookup counters and hit ratios for this worker, for monitoring."""
+    with _stats_lock:
+        counts = dict(_stats)
+    lookups = sum(counts.values())
+    l1_misses = counts["l2_hits"] + counts["misses"]
+
+    if get_redis_client() is None:
+        invalidation = "local"
+    else:
+        invalidation = "pubsub" if _mirror_live else "polling"
+
+    return {
+        **counts,
+        "lookups": lookups,
+        "hit_ratio": round((lookups - counts["misses"]) / lookups, 4) if lookups else None,
+        "l1_hit_ratio": round(counts["l1_hits"] / lookups, 4) if lookups else None,
+        "l2_hit_ratio": round(counts["l2_hits"] / l1_misses, 4) if l1_misses else None,
+        "l1_entries": len(_l1),
+        "l1_bytes": _l1.size,
+        "l1_max_bytes": _l1.max_bytes,
+        "invalidation": invalidation,
+    }
+
+
+# ============================================
+# Dependency map
+# ============================================
+
+# Cached views per entity type, filled in by ``cache_response(depends_on=...)``
+_dependent_views = {entity_type: set() for entity_type in ENTITY_TYPES}
+
+# CV sections (see ``build_cv_from_models``) built from each entity type.
+# Projects are not part of the CV.
+CV_SECTIONS = {
+    "profile": ("basics",),
+    "experience": ("work",),
+    "education": ("education",),
+    "skill": ("skills", "languages"),
+    "skill_category": ("skills", "languages"),
+    "certification": ("certifications",),
+    "tag": ("work",),
+}
+
+
+def get_dependents(entity_type):
+    """Cached views and CV sections that must be refreshed when ``entity_type`` changes."""
+    if entity_type not in ENTITY_TYPES:
+        raise ValueError(f"Unknown entity type: {entity_type}")
+    return {
+        "views": sorted(_dependent_views[entity_type]),
+        "cv_sections": list(CV_SECTIONS.get(entity_type, ())),
+    }
+
+
+def invalidate_entities_cache(*entity_types):
     """
-    Invalidate all entity-related cache entries.
+    Invalidate cache entries built from ``entity_types``.
     Call this when entities are created/updated/deleted.
-    Also invalidates CV data and PDF caches.
+
+    Only responses that declared one of the types in ``depends_on`` are
+    invalidated, and the CV data and PDF caches only when a type feeds a CV
+    section. With no arguments everything is invalidated. The read model is
+    always rebuilt, since it holds every entity type. Afterwards the
+    affected views are warmed up again in the background.
     """
     try:
-        # Also invalidate CV and PDF caches
-        from backend.services.cv_cache import invalidate_all_cv_cache
-        invalidate_all_cv_cache()
-        logger.info("Invalidated CV and PDF caches")
-        
-        # Delete all keys with 'entities' pattern
-        if REDIS_URL:
-            # Redis-specific invalidation
-            import redis
-
-            r = redis.from_url(REDIS_URL)
-            keys = r.keys("portfolio:*/api/entities*")
-            if keys:
-                r.delete(*keys)
-                logger.info(f"Invalidated {len(keys)} entity cache keys")
+        from backend.services.read_model import invalidate_read_model
+        invalidate_read_model()
+
+        if not entity_types or any(t in CV_SECTIONS for t in entity_types):
+            # Also invalidate CV and PDF caches
+            from backend.services.cv_cache import invalidate_all_cv_cache
+            invalidate_all_cv_cache()
+            logger.info("Invalidated CV and PDF caches")
+
+        bump_generation(*entity_types)
+        if entity_types:
+            views = sorted({v for t in entity_types for v in _dependent_views[t]})
+            logger.info(f"Bumped cache generation for {', '.join(entity_types)} ({len(views)} views)")
         else:
-            # SimpleCache doesn't support pattern deletion, clear all
-            cache.clear()
-            logger.info("Cleared all cache (SimpleCache)")
+            logger.info("Bumped global cache generation")
     except Exception as e:
         logger.error(f"Failed to invalidate cache: {e}")
+        return
+
+    # Rebuild what was just invalidated before a visitor asks for it
+    from flask import current_app, has_app_context
+    from backend.services.warmup import schedule_warmup
+
+    if has_app_context():
+        schedule_warmup(current_app._get_current_object(), entity_types)
+
 
+def _build_snapshot(response):
+    """
+    Turn a view response into a cache entry holding the final body bytes,
+    ready-made compressed variants, a content hash and validators.
+    """
+    from flask import current_app
+
+    body = response.get_data()
+    entry = {
+        "status": response.status_code,
+        "mimetype": response.mimetype,
+        "body": body,
+        "hash": hashlib.blake2b(body, digest_size=16).hexdigest(),
+        "last_modified": response.headers.get("Last-Modified"),
+        "gzip": None,
+        "br": None,
+    }
 
-def cache_response(timeout=300, key_func=None):
+    # Same eligibility rules Flask-Compress applies on the request path.
+    # Compression happens once per entry, so use the highest levels.
+    config = current_app.config
+    if (
+        response.mimetype in config.get("COMPRESS_MIMETYPES", ())
+        and len(body) >= config.get("COMPRESS_MIN_SIZE", 500)
+    ):
+        entry["gzip"] = gzip.compress(body, compresslevel=9)
+        if brotli is not None:
+            entry["br"] = brotli.compress(body, quality=11)
+
+    return entry
+
+
+def _is_not_modified(entry, etags):
+    """
+    Evaluate If-None-Match / If-Modified-Since against a cache entry.
+
+    If-None-Match wins when present (RFC 9110 13.2.2); the ETag is the
+    authoritative validator, Last-Modified only covers clients that never
+    received one.
+    """
+    from flask import request
+    from werkzeug.http import parse_date
+
+    if entry["status"] != 200:
+        return False
+
+    if request.if_none_match:
+        return any(request.if_none_match.contains_weak(tag) for tag in etags)
+
+    if request.if_modified_since and entry["last_modified"]:
+        return parse_date(entry["last_modified"]) <= request.if_modified_since
+
+    return False
+
+
+def _snapshot_response(entry, cache_status):
+    """
+    Build a response from a cache entry without encoding or compressing,
+    or an empty 304 when the client already holds the current body.
+    """
+    from flask import current_app, request
+
+    encodings = [name for name in ("br", "gzip") if entry[name] is not None]
+    encoding = request.accept_encodings.best_match(encodings) if encodings else None
+
+    # Strong ETag per representation, in the style Flask-Compress uses
+    etags = [entry["hash"]] + [f"{entry['hash']}:{name}" for name in encodings]
+    etag = f"{entry['hash']}:{encoding}" if encoding else entry["hash"]
+
+    if _is_not_modified(entry, etags):
+        response = current_app.response_class(status=304)
+    else:
+        response = current_app.response_class(
+            entry[encoding] if encoding else entry["body"],
+            status=entry["status"],
+            mimetype=entry["mimetype"],
+        )
+        if encoding:
+            # Flask-Compress skips responses that already carry Content-Encoding
+            response.headers["Content-Encoding"] = encoding
+
+    if entry["status"] == 200:
+        response.set_etag(etag)
+        if entry["last_modified"]:
+            response.headers["Last-Modified"] = entry["last_modified"]
+        # Revalidate every time instead of heuristic freshness from Last-Modified
+        response.headers["Cache-Control"] = "no-cache"
+    response.headers["Vary"] = "Accept-Encoding"
+    response.headers["X-Cache"] = cache_status
+    return response
+
+
+# ============================================
+# Single-flight miss coalescing
+# ============================================
+
+# How long a request waits for another thread/worker to fill the same key
+SINGLE_FLIGHT_TIMEOUT = 30  # seconds
+SINGLE_FLIGHT_POLL = 0.05  # seconds between cache checks while waiting on another worker
+LOCK_KEY_PREFIX = "portfolio:lock:"
+
+# Compare-and-delete so a worker never releases a lock it no longer owns
+_RELEASE_LOCK_SCRIPT = """
+if redis.call('GET', KEYS[1]) == ARGV[1] then
+    return redis.call('DEL', KEYS[1])
+end
+return 0
+"""
+
+
+class _Flight:
+    """A cache fill in progress inside this worker."""
+
+    __slots__ = ("done", "entry", "error")
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.entry = None
+        self.error = None
+
+
+_flights = {}
+_flights_lock = threading.Lock()
+
+
+def _fill_across_workers(cache_key, fill, usable):
+    """
+    Run ``fill`` while holding a Redis lock on ``cache_key``.
+
+    If another worker holds the lock, wait for a ``usable`` entry to show up
+    in the cache instead. Without Redis (or if Redis errors) this degrades
+    to the in-process guarantee only.
+    """
+    client = get_redis_client()
+    if client is None:
+        return fill()
+
+    lock_key = f"{LOCK_KEY_PREFIX}{cache_key}"
+    token = uuid.uuid4().hex
+    try:
+        acquired = client.set(lock_key, token, nx=True, px=SINGLE_FLIGHT_TIMEOUT * 1000)
+    except Exception as e:
+        logger.warning(f"Single-flight lock unavailable, filling locally: {e}")
+        return fill()
+
+    if acquired:
+        try:
+            # Another worker may have filled the key just before we locked it
+            entry = cache.get(cache_key)
+            return entry if usable(entry) else fill()
+        finally:
+            try:
+                client.eval(_RELEASE_LOCK_SCRIPT, 1, lock_key, token)
+            except Exception as e:
+                logger.warning(f"Failed to release single-flight lock {lock_key}: {e}")
+
+    deadline = time.monotonic() + SINGLE_FLIGHT_TIMEOUT
+    while time.monotonic() < deadline:
+        time.sleep(SINGLE_FLIGHT_POLL)
+        entry = cache.get(cache_key)
+        if usable(entry):
+            return entry
+        try:
+            if not client.exists(lock_key):
+                break  # Owner finished without caching (or died); fill ourselves
+        except Exception:
+            break
+    return fill()
+
+
+def _single_flight(cache_key, fill, usable):
+    """
+    Coalesce concurrent cache fills for ``cache_key``.
+
+    The first caller (the leader) runs ``fill``; concurrent callers in the
+    same worker wait for its result. Returns ``(entry, leader)``, where
+    ``entry`` is None when the leader produced nothing cacheable.
+    """
+    with _flights_lock:
+        flight = _flights.get(cache_key)
+        leader = flight is None
+        if leader:
+            flight = _flights[cache_key] = _Flight()
+
+    if not leader:
+        if not flight.done.wait(SINGLE_FLIGHT_TIMEOUT):
+            return None, False
+        if flight.error is not None:
+            raise flight.error
+        return flight.entry, False
+
+    try:
+        flight.entry = _fill_across_workers(cache_key, fill, usable)
+        return flight.entry, True
+    except Exception as e:
+        flight.error = e
+        raise
+    finally:
+        with _flights_lock:
+            _flights.pop(cache_key, None)
+        flight.done.set()
+
+
+# ============================================
+# Stale-while-revalidate / stale-if-error
+# ============================================
+
+# Expired entries stay in the backend this much longer so the last good
+# body can still be served when the database is unreachable
+STALE_IF_ERROR_TTL = 86400  # 24 hours
+
+_refresh_executor = ThreadPoolExecutor(max_workers=2, thread_name_prefix="cache-refresh")
+_refreshing = set()
+_refreshing_lock = threading.Lock()
+
+
+def _entry_age(entry):
+    return time.time() - entry["created"]
+
+
+def _schedule_refresh(cache_key, fill, usable):
+    """Refresh ``cache_key`` in the background, at most once at a time per worker."""
+    from flask import copy_current_request_context
+
+    with _refreshing_lock:
+        if cache_key in _refreshing:
+            return
+        _refreshing.add(cache_key)
+
+    @copy_current_request_context
+    def refresh():
+        try:
+            _single_flight(cache_key, fill, usable)
+            logger.debug(f"Cache REFRESHED: {cache_key}")
+        except Exception as e:
+            logger.warning(f"Background refresh failed for {cache_key}: {e}")
+        finally:
+            with _refreshing_lock:
+                _refreshing.discard(cache_key)
+
+    try:
+        _refresh_executor.submit(refresh)
+    except RuntimeError:  # Interpreter shutting down
+        with _refreshing_lock:
+            _refreshing.discard(cache_key)
+
+
+def _serve_stale_on_error(stale_entry, error):
+    """Fall back to the last good entry after a database error."""
+    from backend import db
+
+    logger.warning(f"Serving stale cache entry after database error: {error}")
+    try:
+        db.session.rollback()
+    except Exception:
+        pass
+    return _snapshot_response(stale_entry, "STALE-IF-ERROR")
+
+
+def cache_response(timeout=300, key_func=None, soft_timeout=None, depends_on=()):
     """
     Decorator to cache API responses.
 
+    Entries store the serialized body together with pre-compressed gzip and
+    brotli variants, so a cache hit only picks the variant matching the
+    request's Accept-Encoding and writes bytes. Successful responses carry a
+    strong ETag (content hash) and the view's Last-Modified, and conditional
+    requests that match are answered with 304 Not Modified.
+
+    Concurrent misses for the same key are coalesced: one thread computes
+    the entry while the others wait for it, and with Redis configured a
+    short lock extends that guarantee across gunicorn workers.
+
+    Entries younger than ``soft_timeout`` are served as-is. Between
+    ``soft_timeout`` and ``timeout`` the stale body is served while a
+    background thread recomputes it. Past ``timeout`` the request recomputes
+    synchronously, but if the database raises ``OperationalError`` the last
+    good body is served instead (``X-Cache: STALE-IF-ERROR``).
+
+    Keys are namespaced with the generation counters of ``depends_on``
+    (plus the global one), so invalidation never has to find or delete keys.
+    Each worker keeps recent entries in a byte-bounded L1 in front of the
+    shared cache; bumps are broadcast so every L1 drops what they affect.
+
     Args:
-        timeout: Cache timeout in seconds (default 5 minutes)
+        timeout: Hard TTL in seconds (default 5 minutes)
         key_func: Function to generate cache key (default: uses full URL with query params)
+        soft_timeout: Soft TTL in seconds (default: same as ``timeout``, i.e. no
+            background revalidation)
+        depends_on: Entity types (see ``ENTITY_TYPES``) the response is built from
 
     Usage:
-        @cache_response(timeout=600, key_func=cache_key_with_lang)
+        @cache_response(timeout=3600, soft_timeout=600, key_func=cache_key_with_lang,
+                        depends_on=("project", "tag"))
         def get_entities():
             ...
     """
+    if soft_timeout is None or soft_timeout > timeout:
+        soft_timeout = timeout
+    unknown = set(depends_on) - set(ENTITY_TYPES)
+    if unknown:
+        raise ValueError(f"Unknown entity types: {sorted(unknown)}")
 
     def decorator(f):
+        for entity_type in depends_on:
+            _dependent_views[entity_type].add(f.__name__)
+
         @wraps(f)
         def decorated_function(*args, **kwargs):
+            from flask import make_response
+            from sqlalchemy.exc import OperationalError
+
             # Generate cache key
             if key_func:
                 cache_key = key_func(*args, **kwargs)
@@ -114,20 +1034,60 @@ def cache_response(timeout=300, key_func=None):
 
                 cache_key = request.full_path
 
-            # Try to get from cache
-            cached_response = cache.get(cache_key)
-            if cached_response is not None:
-                logger.debug(f"Cache HIT: {cache_key}")
-                return cached_response
+            # Worker-local L1 first, then at most one round trip to the shared cache
+            cache_key, entry = _versioned_lookup(
+                cache_key, depends_on, ttl=timeout + STALE_IF_ERROR_TTL
+            )
+            if cache_key is None:
+                return make_response(f(*args, **kwargs))
+
+            uncached = []
+
+            def fill():
+                response = make_response(f(*args, **kwargs))
+
+                # Server errors and streamed bodies are passed through uncached
+                if response.status_code >= 500 or response.is_streamed:
+                    uncached.append(response)
+                    return None
+
+                entry = _build_snapshot(response)
+                entry["created"] = time.time()
+                cache.set(cache_key, entry, timeout=timeout + STALE_IF_ERROR_TTL)
+                _l1.set(cache_key, entry, depends_on, timeout + STALE_IF_ERROR_TTL)
+                return entry
+
+            def fresh(entry):
+                return entry is not None and _entry_age(entry) < soft_timeout
+
+            stale_entry = None
+            if entry is not None:
+                age = _entry_age(entry)
+                if age < soft_timeout:
+                    logger.debug(f"Cache HIT: {cache_key}")
+                    return _snapshot_response(entry, "HIT")
+                if age < timeout:
+                    logger.debug(f"Cache STALE: {cache_key}")
+                    _schedule_refresh(cache_key, fill, fresh)
+                    return _snapshot_response(entry, "STALE")
+                stale_entry = entry  # Past hard TTL: only kept for errors
 
-            # Cache miss, execute function
+            # Cache miss: one request computes, concurrent ones wait for it
             logger.debug(f"Cache MISS: {cache_key}")
-            response = f(*args, **kwargs)
+            try:
+                entry, leader = _single_flight(cache_key, fill, fresh)
+            except OperationalError as e:
+                if stale_entry is None:
+                    raise
+                return _serve_stale_on_error(stale_entry, e)
 
-            # Store in cache
-            cache.set(cache_key, response, timeout=timeout)
+            if uncached:
+                return uncached[0]
+            if entry is None:
+                # Nothing shareable came back (uncacheable or timed out)
+                return make_response(f(*args, **kwargs))
 
-            return response
+            return _snapshot_response(entry, "MISS" if leader else "COALESCED")
 
         return decorated_function
 
@@ -2,63 +2,214 @@
 CV Cache Service
 
 Implements caching for CV data to reduce database queries.
-Uses in-memory cache (can be upgraded to Redis later).
+
+Built CV documents are stored in the shared cache backend (Redis when
+configured), so one build serves every worker, with a small per-worker
+copy in front of it. Their keys carry a version stamp: the cache
+generations of the entity types the CV is built from (the same counters
+the API caches use) plus a CV epoch bumped by ``invalidate_all_cv_cache``.
+An admin save handled by any worker therefore retires the cached
+documents everywhere without deleting anything.
+
+PDFs live in the disk store shared by all workers (``pdf_store``), named
+by a hash of the document they were rendered from. Each worker remembers
+that hash per version stamp, so the document is hashed once per change
+rather than on every request.
+
+The language comes from the client, so it is mapped to a language in use
+(``cv_language``) before anything is built or cached, and both per-worker
+maps are capped at ``CV_LOCAL_MAX_ENTRIES``.
 """
 
+from collections import OrderedDict
 from functools import wraps
+import os
 import json
 import hashlib
+import logging
+import threading
 from datetime import datetime, timedelta
 
-# Simple in-memory cache
-# In production, replace with Redis
-_cache = {}
+logger = logging.getLogger(__name__)
+
+CV_LOCAL_MAX_ENTRIES = 64  # Per map; languages x profiles x the versions still being read
+
+
+class _LRUDict:
+    """Small thread-safe map that drops its least recently used entry past ``max_entries``."""
+
+    def __init__(self, max_entries):
+        self.max_entries = max_entries
+        self._items = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key):
+        with self._lock:
+            value = self._items.get(key)
+            if value is not None:
+                self._items.move_to_end(key)
+            return value
+
+    def set(self, key, value):
+        with self._lock:
+            self._items[key] = value
+            self._items.move_to_end(key)
+            while len(self._items) > self.max_entries:
+                self._items.popitem(last=False)
+
+    def pop(self, key):
+        with self._lock:
+            self._items.pop(key, None)
+
+    def keys(self):
+        with self._lock:
+            return list(self._items)
+
+    def clear(self):
+        with self._lock:
+            self._items.clear()
+
+    def __len__(self):
+        return len(self._items)
+
+
+# Per-worker copies of the shared CV documents
+_cache = _LRUDict(CV_LOCAL_MAX_ENTRIES)
 _cache_ttl = timedelta(hours=1)  # Cache for 1 hour
 
-# PDF cache with longer TTL (PDFs are expensive to generate)
-_pdf_cache = {}
-_pdf_cache_ttl = timedelta(hours=24)  # Cache PDFs for 24 hours
+# (lang, CV version) -> content hash of its PDFs (see ``get_pdf_hash``)
+_pdf_hashes = _LRUDict(CV_LOCAL_MAX_ENTRIES)
+_fingerprint = None
+
+# Generations the local copies were filled under (see cache_service.generation_stamp)
+_cache_stamp = None
+
+# Shared counter bumped by ``invalidate_all_cv_cache``; part of the version stamp
+EPOCH_KEY = "cv:epoch"
+
+
+def _sync_with_generations():
+    """Drop this worker's copies if the CV's entity types were invalidated since they were filled."""
+    global _cache_stamp
+    from backend.services.cache_service import CV_SECTIONS, generation_stamp
+
+    stamp = generation_stamp(*CV_SECTIONS)
+    if stamp is not None and stamp != _cache_stamp:
+        invalidate_local_cv_cache()
+        _cache_stamp = stamp
+    return stamp
+
+
+def get_cv_version():
+    """
+    Cheap version stamp of the CV data: the CV entity generations plus the
+    CV epoch, e.g. ``"3.1.0.2.0.0.1-4"``. None when the generations cannot
+    be read, in which case CV documents are not cached.
+    """
+    from backend.services.cache_service import cache
+
+    stamp = _sync_with_generations()
+    if stamp is None:
+        return None
+    try:
+        epoch = cache.get(EPOCH_KEY) or 0
+    except Exception as e:
+        logger.warning(f"Failed to read CV cache epoch: {e}")
+        return None
+    return f"{'.'.join(str(g) for g in stamp)}-{epoch}"
+
+
+def cv_language(lang):
+    """
+    ``lang`` if some entity is translated into it, else the first fallback
+    language, so made-up languages share one document instead of each
+    building and caching its own (like ``read_model.Snapshot.view``).
+    """
+    from backend.services.read_model import get_read_model, TRANSLATION_FALLBACKS
+
+    if lang in get_read_model().languages:
+        return lang
+    return TRANSLATION_FALLBACKS[0] if TRANSLATION_FALLBACKS else "es"
 
 
-def get_cache_key(lang, profile_slug="default"):
+def get_cache_key(lang, profile_slug="default", version=None):
     """Generate cache key"""
-    return f"cv:{profile_slug}:{lang}"
+    return f"cv:{version}:{profile_slug}:{lang}"
 
 
-def get_cached_cv(lang, profile_slug="default"):
-    """Get CV from cache"""
-    key = get_cache_key(lang, profile_slug)
-    if key in _cache:
-        data, timestamp = _cache[key]
+def get_cached_cv(lang, profile_slug="default", version=None):
+    """Get CV from the worker's copy, else from the shared cache (``version`` defaults to the current one)"""
+    from backend.services.cache_service import cache
+
+    if version is None:
+        version = get_cv_version()
+    if version is None:
+        return None
+    key = get_cache_key(lang, profile_slug, version)
+
+    entry = _cache.get(key)
+    if entry is not None:
+        data, timestamp = entry
         if datetime.now() - timestamp < _cache_ttl:
             return data
         else:
             # Expired, remove from cache
-            del _cache[key]
-    return None
+            _cache.pop(key)
 
+    try:
+        data = cache.get(key)
+    except Exception as e:
+        logger.warning(f"CV cache lookup failed for {key}: {e}")
+        return None
+    if data is not None:
+        _cache.set(key, (data, datetime.now()))
+    return data
 
-def set_cached_cv(lang, cv_data, profile_slug="default"):
-    """Store CV in cache"""
-    key = get_cache_key(lang, profile_slug)
-    _cache[key] = (cv_data, datetime.now())
+
+def set_cached_cv(lang, cv_data, profile_slug="default", version=None):
+    """
+    Store CV in the shared cache and the worker's copy, under ``version``:
+    the stamp read before ``cv_data`` was built (defaults to the current one).
+    """
+    from backend.services.cache_service import cache
+
+    if version is None:
+        version = get_cv_version()
+    if version is None:
+        return
+    key = get_cache_key(lang, profile_slug, version)
+    _cache.set(key, (cv_data, datetime.now()))
+    try:
+        cache.set(key, cv_data, timeout=int(_cache_ttl.total_seconds()))
+    except Exception as e:
+        logger.warning(f"Failed to store CV in shared cache: {e}")
 
 
 def invalidate_cv_cache(profile_slug="default"):
-    """Invalidate all cached CVs for a profile"""
-    keys_to_remove = [k for k in _cache.keys() if k.startswith(f"cv:{profile_slug}:")]
+    """Invalidate this worker's cached CVs for a profile"""
+    keys_to_remove = [k for k in _cache.keys() if k.split(":")[2] == profile_slug]
     for key in keys_to_remove:
-        del _cache[key]
+        _cache.pop(key)
 
 
 def cv_cache(profile_slug="default"):
-    """Decorator to cache CV data"""
+    """
+    Decorator to cache CV data. The returned document is shared between
+    callers and must not be mutated (copy it first, as ``_strip_contact_info``
+    does). Unknown languages get the fallback language's document.
+    """
 
     def decorator(func):
         @wraps(func)
-        def wrapper(lang, *args, **kwargs):
+        def wrapper(lang="es", *args, **kwargs):
+            lang = cv_language(lang)
+            # Read once: a save during the build must not file old data under the new version
+            version = get_cv_version()
+            if version is None:
+                return func(lang, *args, **kwargs)
+
             # Try cache first
-            cached = get_cached_cv(lang, profile_slug)
+            cached = get_cached_cv(lang, profile_slug, version)
             if cached is not None:
                 return cached
 
@@ -67,7 +218,7 @@ def cv_cache(profile_slug="default"):
 
             # Store in cache
             if cv_data:
-                set_cached_cv(lang, cv_data, profile_slug)
+                set_cached_cv(lang, cv_data, profile_slug, version)
 
             return cv_data
 
@@ -83,77 +234,128 @@ def cv_cache(profile_slug="default"):
 def get_cv_data_hash(cv_data):
     """
     Generate a hash of CV data to detect changes.
-    When data changes, the hash changes, invalidating the cached PDF.
+    Part of the PDF content hash (see ``get_pdf_hash``).
     """
     # Convert to JSON string and hash it
     data_str = json.dumps(cv_data, sort_keys=True, default=str)
     return hashlib.md5(data_str.encode()).hexdigest()
 
 
-def get_pdf_cache_key(lang, data_hash):
-    """Generate cache key for PDF"""
-    return f"cv_pdf:{lang}:{data_hash}"
+def _render_fingerprint():
+    """Hash of the CV template and stylesheet, so a redeploy that changes them gets new PDFs."""
+    global _fingerprint
+    if _fingerprint is None:
+        backend_dir = os.path.dirname(os.path.dirname(__file__))
+        digest = hashlib.md5()
+        for path in (("templates", "cv.html"), ("static", "styles", "cv.css")):
+            try:
+                with open(os.path.join(backend_dir, *path), "rb") as f:
+                    digest.update(f.read())
+            except FileNotFoundError:
+                pass
+        _fingerprint = digest.hexdigest()
+    return _fingerprint
 
 
-def get_cached_pdf(lang, cv_data):
+def get_pdf_hash(lang, cv_data, version=None):
+    """
+    Content address of the PDFs rendered from ``cv_data`` in ``lang``: a
+    hash of the document, template and stylesheet. Hashing the document is
+    the expensive part, so it is done once per CV version per worker.
+    """
+    key = (lang, version)
+    if version is not None:
+        data_hash = _pdf_hashes.get(key)
+        if data_hash is not None:
+            return data_hash
+    data_hash = hashlib.md5(f"{get_cv_data_hash(cv_data)}:{_render_fingerprint()}".encode()).hexdigest()
+    if version is not None:
+        _pdf_hashes.set(key, data_hash)
+    return data_hash
+
+
+def get_cached_pdf(lang, data_hash, variant="public"):
     """
-    Get cached PDF bytes if available and CV data hasn't changed.
-    
+    Get the stored PDF for a content hash (see ``get_pdf_hash``).
+
     Returns:
-        tuple: (pdf_bytes, cache_hit) - pdf_bytes is None if cache miss
-    """
-    data_hash = get_cv_data_hash(cv_data)
-    key = get_pdf_cache_key(lang, data_hash)
-    
-    if key in _pdf_cache:
-        pdf_bytes, timestamp = _pdf_cache[key]
-        if datetime.now() - timestamp < _pdf_cache_ttl:
-            return pdf_bytes, True
-        else:
-            # Expired, remove from cache
-            del _pdf_cache[key]
-    
-    return None, False
+        tuple: (pdf_path, cache_hit) - pdf_path is None if cache miss
+    """
+    from backend.services import pdf_store
+
+    try:
+        path = pdf_store.get_pdf(data_hash, lang, variant)
+    except ValueError:
+        return None, False  # Language not usable in a file name; not stored
+    return path, path is not None
 
 
-def set_cached_pdf(lang, cv_data, pdf_bytes):
+def set_cached_pdf(lang, data_hash, pdf_bytes, variant="public"):
     """
-    Store generated PDF in cache.
-    
+    Store generated PDF in the disk store shared by all workers.
+
     Args:
         lang: Language code
-        cv_data: The CV data dict (used to generate hash key)
-        pdf_bytes: The PDF bytes to cache
+        data_hash: Content hash the PDF was rendered from
+        pdf_bytes: The PDF bytes (or BytesIO) to cache
+        variant: "public" or "private" (contact details stripped)
+
+    Returns:
+        The stored file's path, or None if it could not be stored
     """
-    data_hash = get_cv_data_hash(cv_data)
-    key = get_pdf_cache_key(lang, data_hash)
-    
-    # Store the bytes value, not the BytesIO object
-    if hasattr(pdf_bytes, 'getvalue'):
-        pdf_bytes = pdf_bytes.getvalue()
-    
-    _pdf_cache[key] = (pdf_bytes, datetime.now())
+    from backend.services import pdf_store
+
+    try:
+        return pdf_store.put_pdf(data_hash, lang, pdf_bytes, variant)
+    except (ValueError, OSError) as e:
+        logger.warning(f"Failed to store PDF for lang={lang}: {e}")
+        return None
 
 
 def invalidate_pdf_cache():
-    """Invalidate all cached PDFs"""
-    global _pdf_cache
-    _pdf_cache = {}
+    """Invalidate all cached PDFs (deletes the disk store and the finished PDF jobs)"""
+    from backend.services import pdf_store
+    from backend.services.pdf_jobs import clear_finished_jobs
+
+    _pdf_hashes.clear()
+    pdf_store.clear()
+    clear_finished_jobs()
+
+
+def invalidate_local_cv_cache():
+    """Empty this worker's CV copies and PDF hashes"""
+    _cache.clear()
+    _pdf_hashes.clear()
 
 
 def invalidate_all_cv_cache():
-    """Invalidate both CV data cache and PDF cache"""
-    global _cache, _pdf_cache
-    _cache = {}
-    _pdf_cache = {}
+    """
+    Invalidate the CV data cache on every worker: the local copies are
+    dropped and the CV epoch is bumped, which retires the shared entries
+    (and other workers' copies) on their next lookup. Stored PDFs are left
+    alone; new data hashes to new PDF names.
+    """
+    from flask import has_app_context
+    from backend.services.cache_service import cache
+
+    invalidate_local_cv_cache()
+    if not has_app_context():
+        return
+    try:
+        # Never expires: an epoch that fell back to 0 could revive retired entries
+        cache.set(EPOCH_KEY, (cache.get(EPOCH_KEY) or 0) + 1, timeout=0)
+    except Exception as e:
+        logger.warning(f"Failed to bump CV cache epoch: {e}")
 
 
 def get_cache_stats():
     """Get cache statistics for monitoring"""
+    from backend.services.pdf_store import get_store_stats
+    from backend.services.pdf_pool import get_renderer_stats
+
     return {
         "cv_data_entries": len(_cache),
-        "pdf_entries": len(_pdf_cache),
         "cv_data_ttl_hours": _cache_ttl.total_seconds() / 3600,
-        "pdf_ttl_hours": _pdf_cache_ttl.total_seconds() / 3600,
+        **get_store_stats(),
+        "pdf_renderer": get_renderer_stats(),
     }
-
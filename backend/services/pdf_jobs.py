@@ -0,0 +1,297 @@
+"""
+PDF Job Service
+
+Renders CV PDFs off the request threads. ``submit_pdf_job`` returns at
+once with a job whose id is the PDF's content address
+(``<hash>-<lang>-<variant>``, see ``cv_cache.get_pdf_hash``), so identical
+requests attach to the same job, on any worker. Jobs run on a bounded
+thread pool; the finished PDF lands in the shared disk store
+(``pdf_store``) and is downloaded from there by id.
+
+Job state lives in small JSON files in ``PDF_JOB_DIR`` (next to the PDFs),
+so a status poll can land on any worker on the machine, with or without
+Redis. A state file is written to a temporary name and renamed into place;
+a job is claimed by creating its ``.lock`` file with ``O_EXCL``, so only
+one worker renders it. A job stuck ``running`` for longer than
+``PDF_JOB_TIMEOUT`` (its worker died) counts as failed and is started
+again on the next submit.
+"""
+
+import os
+import re
+import json
+import time
+import logging
+import tempfile
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+from backend.services.pdf_store import PDF_STORE_DIR
+
+logger = logging.getLogger(__name__)
+
+PDF_JOB_WORKERS = int(os.getenv("PDF_JOB_WORKERS", 2))
+PDF_JOB_MAX_QUEUED = int(os.getenv("PDF_JOB_MAX_QUEUED", 20))  # Per worker, including running
+PDF_JOB_TIMEOUT = 180  # seconds; longer than the 60s microservice call plus retries
+PDF_JOB_TTL = 3600  # seconds job state is kept after the last update
+
+PDF_JOB_DIR = os.getenv("PDF_JOB_DIR") or os.path.join(PDF_STORE_DIR, "jobs")
+
+_SAFE_ID = re.compile(r"^[A-Za-z0-9_-]+$")
+
+_executor = None
+_active = set()  # Job ids queued or running in this worker
+_lock = threading.Lock()
+
+
+class PDFJobQueueFull(Exception):
+    """Raised when this worker already has ``PDF_JOB_MAX_QUEUED`` jobs in flight."""
+
+
+def _executor_instance():
+    global _executor
+    if _executor is None:
+        _executor = ThreadPoolExecutor(max_workers=PDF_JOB_WORKERS, thread_name_prefix="pdf-job")
+    return _executor
+
+
+def job_id(data_hash, lang, variant):
+    """Job id of a PDF: the same content address as its file in the store."""
+    return f"{data_hash}-{lang}-{variant}"
+
+
+def parse_job_id(job_id):
+    """``(data_hash, lang, variant)`` of a job or file id; ValueError if malformed."""
+    data_hash, _, rest = job_id.partition("-")
+    lang, _, variant = rest.rpartition("-")
+    if not data_hash or not lang or variant not in ("public", "private"):
+        raise ValueError(f"Invalid PDF id: {job_id!r}")
+    return data_hash, lang, variant
+
+
+def _job_path(job_id, suffix=".json"):
+    if not _SAFE_ID.match(job_id or ""):
+        raise ValueError(f"Invalid PDF job id: {job_id!r}")
+    return os.path.join(PDF_JOB_DIR, f"{job_id}{suffix}")
+
+
+def get_job(job_id):
+    """Job state (a dict) shared by every worker, or None when unknown or expired."""
+    try:
+        path = _job_path(job_id)
+        with open(path, encoding="utf-8") as f:
+            job = json.load(f)
+            expired = time.time() - os.fstat(f.fileno()).st_mtime > PDF_JOB_TTL
+    except (ValueError, OSError):
+        return None  # Unknown id, not written yet, or unreadable
+    if expired:
+        try:
+            os.unlink(path)
+        except OSError:
+            pass
+        return None
+    if job["status"] in ("queued", "running"):
+        since = job["started_at"] or job["created_at"]
+        if time.time() - since > PDF_JOB_TIMEOUT:
+            job = {**job, "status": "failed", "error": "Timed out"}
+    return job
+
+
+def _save_job(job):
+    """Write the job's state file atomically (readers never see a partial file)."""
+    path = _job_path(job["id"])
+    os.makedirs(PDF_JOB_DIR, exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(dir=PDF_JOB_DIR, prefix=".tmp-", suffix=".json")
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            json.dump(job, f)
+        os.replace(tmp_path, path)
+    except BaseException:
+        try:
+            os.unlink(tmp_path)
+        except OSError:
+            pass
+        raise
+
+
+def _claim(job_id):
+    """
+    Take the render of ``job_id`` for this worker; False if another worker
+    holds it. A claim older than ``PDF_JOB_TIMEOUT`` belongs to a worker
+    that died and is taken over.
+    """
+    path = _job_path(job_id, ".lock")
+    os.makedirs(PDF_JOB_DIR, exist_ok=True)
+    for _ in range(2):
+        try:
+            os.close(os.open(path, os.O_CREAT | os.O_EXCL | os.O_WRONLY, 0o600))
+            return True
+        except FileExistsError:
+            try:
+                if time.time() - os.stat(path).st_mtime <= PDF_JOB_TIMEOUT:
+                    return False
+                os.unlink(path)
+            except FileNotFoundError:
+                pass  # Released meanwhile; try again
+    return False
+
+
+def _refresh_claim(job_id):
+    """Restart the claim's clock when a queued job starts rendering."""
+    try:
+        os.utime(_job_path(job_id, ".lock"))
+    except OSError:
+        pass
+
+
+def _release(job_id):
+    try:
+        os.unlink(_job_path(job_id, ".lock"))
+    except FileNotFoundError:
+        pass
+
+
+def ensure_pdf(lang, variant="public"):
+    """
+    Render the current CV in ``lang`` / ``variant`` into the PDF store unless
+    it is already there. Needs a request context (the template builds URLs).
+
+    Returns ``(status, data_hash)``: status is "HIT", "MISS" (rendered now)
+    or "NO-DATA" (no profile; ``data_hash`` is None).
+    """
+    from backend.routes.cv import build_cv_from_models, _strip_contact_info
+    from backend.services.pdf_service import PDFService
+    from backend.services.cv_cache import get_cached_pdf, set_cached_pdf, get_cv_version, get_pdf_hash
+
+    version = get_cv_version()
+    cv_data = build_cv_from_models(lang)
+    if not cv_data:
+        return "NO-DATA", None
+    data_hash = get_pdf_hash(lang, cv_data, version)
+    _, cache_hit = get_cached_pdf(lang, data_hash, variant)
+    if cache_hit:
+        return "HIT", data_hash
+    if variant == "private":
+        cv_data = _strip_contact_info(cv_data)
+    pdf_bytes = PDFService().generate_cv_pdf(cv_data, lang)
+    if set_cached_pdf(lang, data_hash, pdf_bytes, variant) is None:
+        raise RuntimeError("PDF could not be stored")
+    return "MISS", data_hash
+
+
+def _run_job(app, job):
+    job = {**job, "status": "running", "started_at": time.time()}
+    _refresh_claim(job["id"])
+    # Rendering uses render_template, which needs a request context
+    with app.test_request_context(f"/cv/pdf?lang={job['lang']}"):
+        try:
+            _save_job(job)
+            status, data_hash = ensure_pdf(job["lang"], job["variant"])
+            if status == "NO-DATA":
+                raise RuntimeError("CV data not found")
+            # Data saved after the job was queued renders under a newer hash
+            job.update(status="done", file_id=job_id(data_hash, job["lang"], job["variant"]))
+        except Exception as e:
+            logger.error(f"PDF job {job['id']} failed: {e}")
+            job.update(status="failed", error=str(e))
+        finally:
+            job["finished_at"] = time.time()
+            job["render_ms"] = round((job["finished_at"] - job["started_at"]) * 1000, 1)
+            try:
+                _save_job(job)
+            except Exception as e:
+                logger.error(f"Failed to save PDF job {job['id']}: {e}")
+            _release(job["id"])
+            with _lock:
+                _active.discard(job["id"])
+    logger.info(f"PDF job {job['id']} {job['status']} in {job['render_ms']}ms")
+
+
+def submit_pdf_job(app, lang, variant, data_hash):
+    """
+    Start rendering the PDF of ``data_hash`` in ``lang`` / ``variant``, or
+    attach to the job already doing it. Returns the job state.
+
+    If the PDF is already in the store the job is ``done`` straight away.
+    Raises ``PDFJobQueueFull`` when this worker's pool is saturated and
+    ``ValueError`` for a language that cannot be part of a file name.
+    """
+    from backend.services.cv_cache import get_cached_pdf
+    from backend.services.pdf_store import pdf_path
+
+    pdf_path(data_hash, lang, variant)  # ValueError if the parts cannot name a file
+    jid = job_id(data_hash, lang, variant)
+    now = time.time()
+
+    if get_cached_pdf(lang, data_hash, variant)[1]:
+        return done_job(jid, lang, variant, now)
+
+    existing = get_job(jid)
+    if existing and existing["status"] in ("queued", "running"):
+        return existing
+
+    job = {
+        "id": jid, "lang": lang, "variant": variant, "status": "queued", "file_id": None,
+        "created_at": now, "started_at": None, "finished_at": None, "render_ms": None, "error": None,
+    }
+    with _lock:
+        if jid in _active:
+            return get_job(jid) or job
+        if len(_active) >= PDF_JOB_MAX_QUEUED:
+            raise PDFJobQueueFull()
+        # Claim the job across workers; the holder may not have written its state yet
+        if not _claim(jid):
+            current = get_job(jid)
+            return current if current and current["status"] in ("queued", "running") else job
+        _active.add(jid)
+    try:
+        _save_job(job)
+    except Exception:
+        _release(jid)
+        with _lock:
+            _active.discard(jid)
+        raise
+
+    _executor_instance().submit(_run_job, app, job)
+    return job
+
+
+def done_job(job_id, lang, variant, now=None):
+    """State of a job whose PDF is already in the store (saved, so polls see it too)."""
+    now = now or time.time()
+    job = {
+        "id": job_id, "lang": lang, "variant": variant, "status": "done", "file_id": job_id,
+        "created_at": now, "started_at": now, "finished_at": now, "render_ms": 0.0, "error": None,
+    }
+    try:
+        _save_job(job)
+    except OSError as e:
+        logger.warning(f"Failed to save PDF job {job_id}: {e}")
+    return job
+
+
+def clear_finished_jobs():
+    """Forget done and failed jobs (their PDFs may be gone); running jobs are kept."""
+    try:
+        names = os.listdir(PDF_JOB_DIR)
+    except FileNotFoundError:
+        return 0
+    removed = 0
+    for name in names:
+        if not name.endswith(".json") or name.startswith(".tmp-"):
+            continue
+        job = get_job(name[:-len(".json")])
+        if job and job["status"] in ("queued", "running"):
+            continue
+        try:
+            os.unlink(os.path.join(PDF_JOB_DIR, name))
+            removed += 1
+        except FileNotFoundError:
+            pass
+    return removed
+
+
+def get_job_stats():
+    """Jobs in flight in this worker, for monitoring."""
+    with _lock:
+        return {"active": len(_active), "workers": PDF_JOB_WORKERS, "max_queued": PDF_JOB_MAX_QUEUED}
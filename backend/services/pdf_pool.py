@@ -0,0 +1,290 @@
+"""
+PDF Renderer Pool
+
+Keeps ``PDF_RENDER_PROCESSES`` WeasyPrint renderer processes running for
+local PDF generation. Each process imports WeasyPrint once, parses
+``cv.css`` (with the web font import) into a stylesheet, and renders a
+small page to load the fonts; after that it takes render jobs over a pipe.
+A render then skips the imports, stylesheet parsing and font downloads
+and runs outside the web worker's GIL.
+
+Processes are started with ``spawn`` since the web worker has threads. A
+process that crashes or overruns ``PDF_RENDER_TIMEOUT`` is killed and
+replaced. Each gunicorn worker owns its pool; a forked child starts its
+own.
+"""
+
+import os
+import re
+import time
+import queue
+import atexit
+import logging
+import threading
+import multiprocessing
+
+logger = logging.getLogger(__name__)
+
+PDF_RENDER_PROCESSES = int(os.getenv("PDF_RENDER_PROCESSES", 2))  # 0 renders in the request thread
+PDF_RENDER_TIMEOUT = int(os.getenv("PDF_RENDER_TIMEOUT", 60))  # seconds per render
+
+BACKEND_DIR = os.path.dirname(os.path.dirname(__file__))
+
+# Stylesheets the workers load up front; the rendered HTML's links to them are dropped
+_PRELOADED_LINK_RE = re.compile(r'<link[^>]*href="[^"]*(?:cv\.css|fonts\.googleapis\.com/css2[^"]*)"[^>]*>')
+
+_pool = None
+_pool_lock = threading.Lock()
+
+
+class PDFRenderError(Exception):
+    """Raised when a pool process fails to render, dies or times out."""
+
+
+def create_weasyprint_renderer():
+    """
+    Parse ``cv.css`` (with the web font import) and return a WeasyPrint
+    render function, ``render(html_string, inline_css=False) -> bytes``.
+
+    The pool processes and the in-thread path both render through this, so
+    a page gets the same styles either way. ``inline_css``: the HTML
+    already carries its styles (the microservice fallback).
+    """
+    from weasyprint import CSS, HTML
+    from weasyprint.text.fonts import FontConfiguration
+    from backend.services.pdf_service import load_cv_css
+
+    font_config = FontConfiguration()
+    stylesheet = CSS(string=load_cv_css(), base_url=BACKEND_DIR, font_config=font_config)
+
+    def render(html_string, inline_css=False):
+        stylesheets = []
+        if not inline_css:
+            html_string = _PRELOADED_LINK_RE.sub("", html_string)
+            stylesheets = [stylesheet]
+        html = HTML(string=html_string, base_url=BACKEND_DIR)
+        return html.write_pdf(stylesheets=stylesheets, font_config=font_config)
+
+    return render
+
+
+def _weasyprint_renderer():
+    """Set up WeasyPrint in a pool process and return its warmed-up render function."""
+    render = create_weasyprint_renderer()
+    render("<html><body><p>Warm-up</p></body></html>")  # Loads Pango and the fonts
+    return render
+
+
+def _worker_main(conn, renderer_factory):
+    """Pool process: set up the renderer, then answer render jobs until the pipe closes."""
+    try:
+        render = renderer_factory()
+    except Exception as e:
+        conn.send(("error", f"Renderer setup failed: {e}"))
+        return
+    conn.send(("ready", os.getpid()))
+    while True:
+        try:
+            html_string, inline_css = conn.recv()
+        except (EOFError, OSError):
+            return
+        try:
+            conn.send(("ok", render(html_string, inline_css)))
+        except Exception as e:
+            conn.send(("error", f"{type(e).__name__}: {e}"))
+
+
+class _Worker:
+    def __init__(self, ctx, renderer_factory):
+        self.conn, child_conn = ctx.Pipe()
+        self.process = ctx.Process(
+            target=_worker_main, args=(child_conn, renderer_factory), name="pdf-renderer", daemon=True
+        )
+        self.process.start()
+        child_conn.close()
+        self.ready = False
+        self.broken = False  # Dead, stuck or out of step with its pipe; must be replaced
+
+    def call(self, message, timeout):
+        """Send ``message`` (None to only wait for setup) and return the reply payload."""
+        if not self.ready:
+            status, payload = self._receive(timeout)
+            if status != "ready":
+                self.broken = True
+                raise PDFRenderError(payload)
+            self.ready = True
+        if message is None:
+            return None
+        self.conn.send(message)
+        status, payload = self._receive(timeout)
+        if status != "ok":
+            raise PDFRenderError(payload)
+        return payload
+
+    def _receive(self, timeout):
+        try:
+            if self.conn.poll(timeout):
+                return self.conn.recv()
+        except (EOFError, OSError):
+            self.broken = True
+            raise PDFRenderError("Renderer process died")
+        self.broken = True
+        raise PDFRenderError(f"Renderer timed out after {timeout}s")
+
+    def stop(self):
+        try:
+            self.conn.close()
+        except OSError:
+            pass
+        if self.process.is_alive():
+            self.process.kill()
+        self.process.join(timeout=5)
+
+
+class RendererPool:
+    """
+    Fixed-size pool of renderer processes; ``render`` waits up to ``timeout``
+    for a free one. A slot whose process could not be (re)started is retried
+    on the next render.
+    """
+
+    def __init__(self, size, renderer_factory=_weasyprint_renderer, timeout=PDF_RENDER_TIMEOUT):
+        self.size = size
+        self.timeout = timeout
+        self.renderer_factory = renderer_factory
+        self.pid = os.getpid()
+        self._ctx = multiprocessing.get_context("spawn")
+        self._idle = queue.Queue()
+        self._workers = set()
+        self._lock = threading.Lock()
+        self._closed = False
+        self.renders = 0
+        self.restarts = 0
+        self._missing = size  # Slots without a process
+        self._refill()
+
+    def _refill(self):
+        """Start processes for the empty slots; a slot that fails to start stays empty."""
+        with self._lock:
+            missing, self._missing = self._missing, 0
+        for _ in range(missing):
+            try:
+                worker = _Worker(self._ctx, self.renderer_factory)
+            except Exception as e:
+                logger.error(f"Failed to start a PDF renderer process: {e}")
+                with self._lock:
+                    self._missing += 1
+                continue
+            with self._lock:
+                self._workers.add(worker)
+            self._idle.put(worker)
+
+    def _replace(self, worker):
+        worker.stop()
+        with self._lock:
+            self._workers.discard(worker)
+            self.restarts += 1
+            if self._closed:
+                return
+            self._missing += 1
+        self._refill()
+
+    def render(self, html_string, inline_css=False):
+        """PDF bytes of ``html_string``. ``inline_css``: the HTML already carries its styles."""
+        if self._closed:
+            raise PDFRenderError("Renderer pool is closed")
+        if self._missing:
+            self._refill()
+            if not self._workers:
+                raise PDFRenderError("No renderer process could be started")
+        try:
+            worker = self._idle.get(timeout=self.timeout)
+        except queue.Empty:
+            raise PDFRenderError(f"No renderer process free after {self.timeout}s")
+        try:
+            pdf_bytes = worker.call((html_string, inline_css), self.timeout)
+        except PDFRenderError as e:
+            if worker.broken:
+                logger.warning(f"Replacing PDF renderer process {worker.process.pid}: {e}")
+                self._replace(worker)
+            else:
+                self._idle.put(worker)  # The page failed; the process is fine
+            raise
+        except BaseException:
+            self._replace(worker)  # The pipe may hold a half-read reply
+            raise
+        self._idle.put(worker)
+        self.renders += 1
+        return pdf_bytes
+
+    def wait_ready(self, timeout=None):
+        """Block until every process has finished its setup. Returns the time taken in ms."""
+        timeout = timeout or self.timeout
+        started = time.perf_counter()
+        workers = []
+        try:
+            for _ in range(self.size - self._missing):
+                workers.append(self._idle.get(timeout=timeout))
+            for worker in workers:
+                worker.call(None, timeout)
+        except queue.Empty:
+            raise PDFRenderError(f"Renderer processes not free after {timeout}s")
+        finally:
+            for worker in workers:
+                if worker.broken:
+                    self._replace(worker)
+                else:
+                    self._idle.put(worker)
+        return round((time.perf_counter() - started) * 1000, 1)
+
+    def close(self):
+        with self._lock:
+            self._closed = True
+            workers = list(self._workers)
+            self._workers.clear()
+        for worker in workers:
+            worker.stop()
+
+    def stats(self):
+        return {
+            "processes": self.size,
+            "idle": self._idle.qsize(),
+            "renders": self.renders,
+            "restarts": self.restarts,
+        }
+
+
+def get_renderer_pool():
+    """This process's renderer pool, started on first use; None when disabled."""
+    global _pool
+    if PDF_RENDER_PROCESSES <= 0:
+        return None
+    pool = _pool
+    if pool is not None and pool.pid == os.getpid():
+        return pool
+    with _pool_lock:
+        if _pool is None or _pool.pid != os.getpid():
+            # A pool inherited across fork belongs to the parent
+            _pool = RendererPool(PDF_RENDER_PROCESSES)
+            logger.info(f"Started {PDF_RENDER_PROCESSES} PDF renderer processes")
+        return _pool
+
+
+def shutdown_renderer_pool():
+    """Stop this process's renderer processes."""
+    global _pool
+    with _pool_lock:
+        pool, _pool = _pool, None
+    if pool is not None and pool.pid == os.getpid():
+        pool.close()
+
+
+def get_renderer_stats():
+    """Pool counters, for monitoring."""
+    pool = _pool
+    if pool is None or pool.pid != os.getpid():
+        return {"processes": 0, "configured": PDF_RENDER_PROCESSES}
+    return {**pool.stats(), "configured": PDF_RENDER_PROCESSES}
+
+
+atexit.register(shutdown_renderer_pool)
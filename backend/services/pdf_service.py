@@ -3,7 +3,9 @@ PDF generation service for CV/Resume.
 
 Supports two modes:
 1. Microservice mode (production): Calls external PDF service (GCP Cloud Run)
-2. Local mode (development): Uses WeasyPrint directly
+2. Local mode (development): Uses WeasyPrint, in a pool of warm renderer
+   processes (see pdf_pool) or, with PDF_RENDER_PROCESSES=0, in the
+   request thread
 """
 
 from io import BytesIO
@@ -19,13 +21,26 @@ PDF_SERVICE_URL = os.getenv("PDF_SERVICE_URL")
 
 # Try to import WeasyPrint for local fallback
 try:
-    from weasyprint import HTML
+    from weasyprint import HTML  # noqa: F401 (availability check; rendering is in pdf_pool)
     WEASYPRINT_AVAILABLE = True
 except (OSError, ImportError) as e:
     WEASYPRINT_AVAILABLE = False
     WEASYPRINT_ERROR = str(e)
 
 
+FONT_IMPORT = "@import url('https://fonts.googleapis.com/css2?family=Inter:wght@300;400;500;600;700;800&display=swap');\n"
+
+
+def load_cv_css():
+    """The CV stylesheet with the web font import, or "" if it is missing."""
+    backend_dir = os.path.dirname(os.path.dirname(__file__))
+    css_path = os.path.join(backend_dir, "static", "styles", "cv.css")
+    if not os.path.exists(css_path):
+        return ""
+    with open(css_path, 'r', encoding='utf-8') as f:
+        return FONT_IMPORT + f.read()
+
+
 class PDFService:
     """Service for generating PDFs from HTML templates"""
 
@@ -65,23 +80,12 @@ class PDFService:
 
     def _prepare_html(self, cv_data, lang):
         """Prepare HTML and CSS content for PDF generation"""
-        # Get absolute paths for static files
-        backend_dir = os.path.dirname(os.path.dirname(__file__))
-        static_dir = os.path.join(backend_dir, "static")
-        css_path = os.path.join(static_dir, "styles", "cv.css")
-
         # Render HTML template with CV data
         from flask import render_template
         html_string = render_template("cv.html", cv_data=cv_data, lang=lang)
 
         # Load CSS
-        css_content = ""
-        if os.path.exists(css_path):
-            with open(css_path, 'r', encoding='utf-8') as f:
-                css_content = f.read()
-
-            font_import = "@import url('https://fonts.googleapis.com/css2?family=Inter:wght@300;400;500;600;700;800&display=swap');\n"
-            css_content = font_import + css_content
+        css_content = load_cv_css()
 
         return html_string, css_content
 
@@ -130,15 +134,15 @@ class PDFService:
         """Generate PDF locally using WeasyPrint"""
         if not WEASYPRINT_AVAILABLE:
             raise RuntimeError(f"WeasyPrint not available: {WEASYPRINT_ERROR}")
-        
-        backend_dir = os.path.dirname(os.path.dirname(__file__))
-        html = HTML(string=html_string, base_url=backend_dir)
-        
-        pdf_bytes = BytesIO()
-        html.write_pdf(pdf_bytes)
-        pdf_bytes.seek(0)
-        
-        return pdf_bytes
+
+        from backend.services.pdf_pool import get_renderer_pool, create_weasyprint_renderer
+        pool = get_renderer_pool()
+        if pool is not None:
+            # Warm process with the stylesheet and fonts already loaded
+            return BytesIO(pool.render(html_string))
+
+        # Same stylesheet as the pool, parsed for this render
+        return BytesIO(create_weasyprint_renderer()(html_string))
 
     def _generate_locally_with_css(self, html_string, css_content, lang):
         """Generate PDF locally with pre-injected CSS"""
@@ -146,12 +150,10 @@ class PDFService:
             raise RuntimeError(f"WeasyPrint not available: {WEASYPRINT_ERROR}")
         
         # CSS should already be injected in html_string
-        backend_dir = os.path.dirname(os.path.dirname(__file__))
-        html = HTML(string=html_string, base_url=backend_dir)
-        
-        pdf_bytes = BytesIO()
-        html.write_pdf(pdf_bytes)
-        pdf_bytes.seek(0)
-        
-        return pdf_bytes
+        from backend.services.pdf_pool import get_renderer_pool, create_weasyprint_renderer
+        pool = get_renderer_pool()
+        if pool is not None:
+            return BytesIO(pool.render(html_string, inline_css=True))
+
+        return BytesIO(create_weasyprint_renderer()(html_string, inline_css=True))
 
@@ -0,0 +1,126 @@
+"""
+PDF Store Service
+
+Content-addressed store of rendered CV PDFs on local disk, shared by every
+worker on the machine and kept across restarts. A PDF's file name is the
+hash of what it was rendered from (see ``cv_cache.get_pdf_hash``) plus its
+language and variant, so a file never needs invalidating: changed data
+simply maps to a new name, and old files age out.
+
+Files are written to a temporary name and renamed into place, so readers
+never see a partial PDF. Hits bump the file's mtime; when the store grows
+past ``PDF_STORE_MAX_BYTES`` the least recently used files are deleted.
+"""
+
+import os
+import re
+import hashlib
+import logging
+import tempfile
+
+logger = logging.getLogger(__name__)
+
+PDF_STORE_DIR = os.getenv("PDF_STORE_DIR") or os.path.join(
+    tempfile.gettempdir(),
+    "portfolio-pdf-" + hashlib.blake2b(os.getenv("DATABASE_URL", "").encode(), digest_size=6).hexdigest(),
+)
+PDF_STORE_MAX_BYTES = int(os.getenv("PDF_STORE_MAX_BYTES", 100 * 1024 * 1024))
+
+_SAFE_PART = re.compile(r"^[A-Za-z0-9_-]+$")
+
+
+def pdf_path(data_hash, lang, variant="public"):
+    """Path of the PDF for ``data_hash`` in ``lang`` / ``variant`` (it may not exist)."""
+    for part in (data_hash, lang, variant):
+        if not _SAFE_PART.match(part or ""):
+            raise ValueError(f"Invalid PDF store key part: {part!r}")
+    return os.path.join(PDF_STORE_DIR, f"{data_hash}-{lang}-{variant}.pdf")
+
+
+def get_pdf(data_hash, lang, variant="public"):
+    """Path of the stored PDF, or None on a miss. A hit counts as a use for LRU eviction."""
+    path = pdf_path(data_hash, lang, variant)
+    try:
+        os.utime(path)
+    except FileNotFoundError:
+        return None
+    return path
+
+
+def put_pdf(data_hash, lang, pdf_bytes, variant="public"):
+    """Store a PDF atomically and return its path; evicts old files if over budget."""
+    path = pdf_path(data_hash, lang, variant)
+    if hasattr(pdf_bytes, "getvalue"):
+        pdf_bytes = pdf_bytes.getvalue()
+
+    os.makedirs(PDF_STORE_DIR, exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(dir=PDF_STORE_DIR, prefix=".tmp-", suffix=".pdf")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(pdf_bytes)
+        os.replace(tmp_path, path)
+    except BaseException:
+        try:
+            os.unlink(tmp_path)
+        except OSError:
+            pass
+        raise
+
+    evict(keep=path)
+    return path
+
+
+def _entries():
+    """``(mtime, size, path)`` of every stored PDF (temporary files excluded)."""
+    entries = []
+    try:
+        with os.scandir(PDF_STORE_DIR) as it:
+            for entry in it:
+                if entry.name.endswith(".pdf") and not entry.name.startswith(".tmp-"):
+                    try:
+                        stat = entry.stat()
+                    except FileNotFoundError:
+                        continue  # Evicted by another worker meanwhile
+                    entries.append((stat.st_mtime, stat.st_size, entry.path))
+    except FileNotFoundError:
+        pass
+    return entries
+
+
+def evict(max_bytes=None, keep=None):
+    """Delete least recently used PDFs until the store fits in ``max_bytes``. Returns the count."""
+    if max_bytes is None:
+        max_bytes = PDF_STORE_MAX_BYTES
+    entries = sorted(_entries())
+    total = sum(size for _, size, _ in entries)
+    removed = 0
+    for _, size, path in entries:
+        if total <= max_bytes:
+            break
+        if path == keep:
+            continue
+        try:
+            os.unlink(path)
+        except FileNotFoundError:
+            pass
+        total -= size
+        removed += 1
+    if removed:
+        logger.info(f"PDF store evicted {removed} files ({total / 1024 / 1024:.1f}MB left)")
+    return removed
+
+
+def clear():
+    """Delete every stored PDF."""
+    return evict(max_bytes=-1)
+
+
+def get_store_stats():
+    """File count and size of the store, for monitoring."""
+    entries = _entries()
+    return {
+        "pdf_entries": len(entries),
+        "pdf_bytes": sum(size for _, size, _ in entries),
+        "pdf_max_bytes": PDF_STORE_MAX_BYTES,
+        "pdf_dir": PDF_STORE_DIR,
+    }
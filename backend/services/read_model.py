@@ -0,0 +1,601 @@
+"""
+Read Model Service
+
+Keeps an immutable, per-language snapshot of every public portfolio entity
+in process memory. The public API reads from the snapshot instead of the
+database, so steady-state requests need zero DB round trips.
+
+Each language view is built on first use, loading only the translations
+of that language and its fallback chain (``TRANSLATION_FALLBACKS``), so
+adding languages does not grow what every build pulls from the database.
+The snapshot is replaced atomically whenever the entity caches are
+invalidated (see ``invalidate_entities_cache``). Each snapshot remembers
+the cache generations it was built under, so invalidations made by other
+workers are picked up on the next read.
+"""
+
+import os
+import logging
+import threading
+import time
+from collections import defaultdict
+from datetime import datetime, timezone
+from dataclasses import dataclass, field, replace
+from types import MappingProxyType, SimpleNamespace
+
+from sqlalchemy import desc, select, union
+from sqlalchemy.orm import Session, defer, joinedload, load_only, selectinload
+
+from backend import db
+from backend.services.cache_service import ENTITY_TYPES, generation_stamp, generation_bumped_at
+from backend.services.serializers import (
+    serialize_project, serialize_project_text, serialize_card_text, serialize_project_url,
+    serialize_project_image, serialize_experience, serialize_experience_text, serialize_education,
+    serialize_education_text, serialize_skill, serialize_skill_text, serialize_certification,
+    serialize_certification_text, serialize_profile, serialize_profile_text, serialize_tag,
+)
+
+logger = logging.getLogger(__name__)
+
+# Safety net: rebuild even without an explicit invalidation after this long
+SNAPSHOT_TTL = 3600  # seconds
+
+# Fields of a project payload, plus the card-only ``thumbnail``
+PROJECT_FIELDS = (
+    "id", "slug", "category", "urls", "title", "subtitle", "summary", "description", "content",
+    "tags", "images", "desktop_image", "mobile_image", "preview_video", "created_at", "thumbnail",
+)
+
+# Project fields list cards need; ``build_card_view`` loads only these
+CARD_FIELDS = (
+    "id", "slug", "category", "title", "subtitle", "summary", "tags", "thumbnail", "created_at",
+)
+
+# Languages tried, in order, when an entity lacks the requested one
+TRANSLATION_FALLBACKS = tuple(
+    lang.strip() for lang in os.getenv("TRANSLATION_FALLBACKS", "es,en").split(",") if lang.strip()
+)
+
+# Entity types behind each section's Last-Modified
+SECTION_TYPES = {
+    "projects": ("project", "tag"),
+    "experience": ("experience", "tag"),
+    "education": ("education",),
+    "skills": ("skill", "skill_category"),
+    "certifications": ("certification",),
+    "profile": ("profile",),
+    "tags": ("project", "experience", "tag"),
+}
+
+# How ``build_view`` reads entities: "core" (flat Core SELECTs) or "orm"
+READ_MODEL_LOADER = os.getenv("READ_MODEL_LOADER", "core")
+
+_snapshot = None
+_snapshot_lock = threading.Lock()
+
+
+@dataclass(frozen=True)
+class LanguageView:
+    """API-ready payloads for a single language."""
+
+    projects: tuple
+    projects_by_slug: MappingProxyType
+    experience: tuple
+    education: tuple
+    skills: tuple
+    certifications: tuple
+    profile: dict
+    tags: MappingProxyType  # tag slug -> {"tag", "projects", "experience"} (see ``_build_tag_index``)
+    tag_facets: tuple  # Usage counts per tag, most used first
+    last_modified: MappingProxyType  # section name -> latest updated_at
+    project_modified: MappingProxyType  # project slug -> latest updated_at
+
+
+@dataclass(frozen=True)
+class CardView:
+    """Lean project list for a single language (``CARD_FIELDS`` only)."""
+
+    projects: tuple
+    last_modified: object  # Latest updated_at behind the cards
+
+
+@dataclass(frozen=True)
+class Snapshot:
+    """Language views, built lazily, plus build metadata."""
+
+    languages: frozenset  # Languages with at least one translation
+    built_at: float
+    stamp: tuple = None  # Cache generations the snapshot was built under
+    views: dict = field(default_factory=dict)  # lang -> LanguageView (None = unknown language)
+    cards: dict = field(default_factory=dict)  # lang -> CardView
+    _lock: threading.Lock = field(default_factory=threading.Lock, repr=False, compare=False)
+
+    def _lazy(self, store, lang, build):
+        key = lang if lang in self.languages else None
+        value = store.get(key)
+        if value is None:
+            with self._lock:
+                value = store.get(key)
+                if value is None:
+                    value = store[key] = build(key)
+        return value
+
+    def view(self, lang):
+        """Return the view for ``lang``; unknown languages share the fallback view."""
+        return self._lazy(self.views, lang, build_view)
+
+    def card_view(self, lang):
+        """Return the project cards for ``lang``, loaded without the heavy columns."""
+        return self._lazy(self.cards, lang, build_card_view)
+
+
+def get_read_model():
+    """Return the current snapshot, building it if missing or expired."""
+    global _snapshot
+
+    stamp = generation_stamp(*ENTITY_TYPES)
+
+    def current(snapshot):
+        return (
+            snapshot is not None
+            and (stamp is None or snapshot.stamp == stamp)
+            and time.time() - snapshot.built_at < SNAPSHOT_TTL
+        )
+
+    snapshot = _snapshot
+    if current(snapshot):
+        return snapshot
+
+    with _snapshot_lock:
+        # Another thread may have rebuilt it while we waited for the lock
+        snapshot = _snapshot
+        if not current(snapshot):
+            # Stamp read before loading: a bump during the build forces another one
+            snapshot = replace(build_snapshot(), stamp=stamp)
+            _snapshot = snapshot
+        return snapshot
+
+
+def get_view(lang):
+    """Shortcut for ``get_read_model().view(lang)``."""
+    return get_read_model().view(lang)
+
+
+def get_card_view(lang):
+    """Shortcut for ``get_read_model().card_view(lang)``."""
+    return get_read_model().card_view(lang)
+
+
+def get_last_modified(section, slug=None, lang=None):
+    """Latest ``updated_at`` behind a section, or behind one project, in ``lang``."""
+    view = get_view(lang)
+    if slug is not None:
+        return view.project_modified.get(slug)
+    return view.last_modified.get(section)
+
+
+def invalidate_read_model():
+    """Drop the snapshot; the next reader rebuilds it from the database."""
+    global _snapshot
+    _snapshot = None
+
+
+def language_chain(lang):
+    """``lang`` followed by the configured fallbacks, without duplicates."""
+    return tuple(dict.fromkeys(code for code in (lang, *TRANSLATION_FALLBACKS) if code))
+
+
+# ============================================
+# Snapshot construction
+# ============================================
+
+def _pick_translation(translations, chain):
+    """First translation following the language ``chain`` (None if none loaded)."""
+    by_lang = {t.lang: t for t in translations}
+    return next((by_lang[lang] for lang in chain if lang in by_lang), None)
+
+
+def _latest(*objects):
+    """Most recent created_at/updated_at across ``objects`` (None if unknown)."""
+    stamps = [
+        stamp
+        for obj in objects
+        for stamp in (getattr(obj, "updated_at", None), getattr(obj, "created_at", None))
+        if stamp is not None
+    ]
+    return max(stamps, default=None)
+
+
+def _bumped_at(entity_types):
+    """Last invalidation of ``entity_types`` as a naive UTC datetime, like ``updated_at``."""
+    bumped = generation_bumped_at(*entity_types)
+    if bumped is None:
+        return None
+    return datetime.fromtimestamp(bumped, timezone.utc).replace(tzinfo=None)
+
+
+def _later(*stamps):
+    return max((stamp for stamp in stamps if stamp is not None), default=None)
+
+
+def _thumbnail(images):
+    """Featured (else first) image's thumbnail, for list cards."""
+    image = next((img for img in images if img.is_featured), images[0] if images else None)
+    return (image.thumbnail_url or image.url) if image else None
+
+
+def _project_payload(p, trans):
+    # Sort images by order
+    images = sorted(p.images, key=lambda x: x.order)
+
+    payload = serialize_project(p)
+    payload.update(serialize_project_text(trans) if trans else _EMPTY_PROJECT_TEXT)
+    payload["urls"] = [serialize_project_url(url) for url in sorted(p.urls or [], key=lambda x: x.order)]
+    payload["tags"] = [t.name for t in p.tags]
+    payload["images"] = [serialize_project_image(img) for img in images]
+    # Backward compatibility fields
+    payload["desktop_image"] = images[0].url if images else None
+    payload["mobile_image"] = images[1].url if len(images) > 1 else None
+    # Preview video (gif or video type)
+    payload["preview_video"] = next((img.url for img in images if img.type in ['video', 'gif']), None)
+    return payload
+
+
+_EMPTY_PROJECT_TEXT = {"title": "", "subtitle": "", "summary": "", "description": "", "content": {}}
+
+
+def _build_view(lang, chain, projects, experiences, educations, skills, certifications, profile):
+    project_list = []
+    projects_by_slug = {}
+    tagged = []  # (section, tags, payload) for the tag index
+    for p in projects:
+        trans = _pick_translation(p.translations, chain)
+        payload = _project_payload(p, trans)
+        projects_by_slug[p.slug] = payload
+        if trans:
+            project_list.append(payload)
+            tagged.append(("projects", p.tags, payload))
+
+    experience_list = []
+    for e in experiences:
+        trans = _pick_translation(e.translations, chain)
+        if trans:
+            payload = serialize_experience(e)
+            payload.update(serialize_experience_text(trans))
+            payload["tags"] = [t.name for t in e.tags]
+            experience_list.append(payload)
+            tagged.append(("experience", e.tags, payload))
+
+    education_list = []
+    for e in educations:
+        trans = _pick_translation(e.translations, chain)
+        if trans:
+            payload = serialize_education(e)
+            payload.update(serialize_education_text(trans))
+            payload["courses"] = [c.name for c in sorted(e.courses, key=lambda x: x.order)]
+            education_list.append(payload)
+
+    skill_list = []
+    for s in skills:
+        trans = _pick_translation(s.translations, chain)
+        if trans:
+            cat_name = None
+            if s.skill_category:
+                cat_trans = _pick_translation(s.skill_category.translations, chain)
+                cat_name = cat_trans.name if cat_trans else s.skill_category.slug
+            payload = serialize_skill(s)
+            payload.update(serialize_skill_text(trans))
+            payload["category"] = cat_name
+            skill_list.append(payload)
+
+    certification_list = []
+    for c in certifications:
+        trans = _pick_translation(c.translations, chain)
+        if trans:
+            payload = serialize_certification(c)
+            payload.update(serialize_certification_text(trans))
+            certification_list.append(payload)
+
+    profile_payload = None
+    if profile:
+        trans = _pick_translation(profile.translations, chain)
+        profile_payload = serialize_profile(profile)
+        profile_payload.update(
+            serialize_profile_text(trans) if trans else {"role": "", "tagline": "", "bio": ""}
+        )
+
+    # A deleted row (or image, URL or tag link) leaves no updated_at behind,
+    # so the time of the last invalidation is taken into account as well
+    bumped = {name: _bumped_at(types) for name, types in SECTION_TYPES.items()}
+    project_modified = {
+        p.slug: _later(_latest(p, *p.translations, *p.images, *p.urls, *p.tags), bumped["projects"])
+        for p in projects
+    }
+    sections = {
+        "projects": list(project_modified.values()),
+        "experience": [_latest(e, *e.translations, *e.tags) for e in experiences],
+        "education": [_latest(e, *e.translations, *e.courses) for e in educations],
+        "skills": [_latest(s, *s.translations) for s in skills],
+        "certifications": [_latest(c, *c.translations) for c in certifications],
+        "profile": [_latest(profile, *profile.translations)] if profile else [],
+    }
+    last_modified = {name: _later(*stamps, bumped[name]) for name, stamps in sections.items()}
+    # Tag pages list projects and experience; tag rows are already in both stamps
+    last_modified["tags"] = _later(last_modified["projects"], last_modified["experience"], bumped["tags"])
+    tags, tag_facets = _build_tag_index(tagged)
+
+    return LanguageView(
+        projects=tuple(project_list),
+        projects_by_slug=MappingProxyType(projects_by_slug),
+        experience=tuple(experience_list),
+        education=tuple(education_list),
+        skills=tuple(skill_list),
+        certifications=tuple(certification_list),
+        profile=profile_payload,
+        tags=tags,
+        tag_facets=tag_facets,
+        last_modified=MappingProxyType(last_modified),
+        project_modified=MappingProxyType(project_modified),
+    )
+
+
+def _build_tag_index(tagged):
+    """
+    Tag -> entity index from ``(section, tags, payload)`` triples, in view
+    order. Each entry holds the tag and the payloads of the projects and
+    experience using it; the facets count them per section.
+    """
+    index = {}
+    for section, tags, payload in tagged:
+        for tag in tags:
+            entry = index.get(tag.slug)
+            if entry is None:
+                entry = index[tag.slug] = {"tag": serialize_tag(tag), "projects": [], "experience": []}
+            entry[section].append(payload)
+
+    facets = []
+    for entry in index.values():
+        entry["projects"] = tuple(entry["projects"])
+        entry["experience"] = tuple(entry["experience"])
+        counts = {"projects": len(entry["projects"]), "experience": len(entry["experience"])}
+        facets.append({**entry["tag"], "counts": counts, "total": sum(counts.values())})
+    facets.sort(key=lambda f: (-f["total"], f["name"].lower(), f["slug"]))
+
+    return MappingProxyType(index), tuple(facets)
+
+
+def build_snapshot():
+    """Find the languages in use; views are built on first access (see ``build_view``)."""
+    from backend.models.project import ProjectTranslation
+    from backend.models.experience import ExperienceTranslation
+    from backend.models.education import EducationTranslation
+    from backend.models.skill import SkillTranslation, SkillCategoryTranslation
+    from backend.models.certification import CertificationTranslation
+    from backend.models.profile import ProfileTranslation
+
+    translation_models = (
+        ProjectTranslation, ExperienceTranslation, EducationTranslation, SkillTranslation,
+        SkillCategoryTranslation, CertificationTranslation, ProfileTranslation,
+    )
+    with Session(db.engine) as session:
+        langs = session.scalars(union(*(select(m.lang) for m in translation_models))).all()
+
+    return Snapshot(languages=frozenset(langs), built_at=time.time())
+
+
+def _load_orm(session, chain):
+    """Public entities as ORM objects, collections filtered to the ``chain`` languages."""
+    from backend.models.project import Project, ProjectTranslation
+    from backend.models.experience import Experience, ExperienceTranslation
+    from backend.models.education import Education, EducationTranslation
+    from backend.models.skill import Skill, SkillTranslation, SkillCategory, SkillCategoryTranslation
+    from backend.models.certification import Certification, CertificationTranslation
+    from backend.models.profile import Profile, ProfileTranslation
+
+    def translations(relationship, model):
+        return selectinload(relationship.and_(model.lang.in_(chain)))
+
+    # selectinload issues one query per collection, so rows grow linearly with
+    # the data; joinedload multiplied translations x images x tags x urls
+    projects = session.query(Project).options(
+        translations(Project.translations, ProjectTranslation),
+        selectinload(Project.images),
+        selectinload(Project.tags),
+        selectinload(Project.urls)
+    ).order_by(Project.created_at.desc().nulls_last(), desc(Project.id)).all()
+
+    experiences = session.query(Experience).options(
+        translations(Experience.translations, ExperienceTranslation),
+        selectinload(Experience.tags)
+    ).order_by(desc(Experience.start_date)).all()
+
+    educations = session.query(Education).options(
+        translations(Education.translations, EducationTranslation),
+        selectinload(Education.courses)
+    ).order_by(desc(Education.start_date)).all()
+
+    skills = session.query(Skill).options(
+        translations(Skill.translations, SkillTranslation),
+        joinedload(Skill.skill_category).selectinload(
+            SkillCategory.translations.and_(SkillCategoryTranslation.lang.in_(chain))
+        )
+    ).order_by(Skill.order).all()
+
+    certifications = session.query(Certification).options(
+        translations(Certification.translations, CertificationTranslation)
+    ).order_by(desc(Certification.issue_date)).all()
+
+    profile = session.query(Profile).options(
+        translations(Profile.translations, ProfileTranslation)
+    ).first()  # Assuming single profile
+
+    return projects, experiences, educations, skills, certifications, profile
+
+
+def _load_core(session, chain):
+    """
+    The entities ``_load_orm`` returns, read with flat Core SELECTs (one per
+    table) and stitched into plain namespaces with the same attributes.
+    Skips ORM hydration, the identity map and attribute instrumentation.
+    """
+    from backend.models.project import Project, ProjectImage, ProjectTranslation, project_tags
+    from backend.models.project_url import ProjectURL
+    from backend.models.experience import Experience, ExperienceTranslation, experience_tags
+    from backend.models.education import Education, EducationTranslation, Course
+    from backend.models.skill import Skill, SkillTranslation, SkillCategory, SkillCategoryTranslation
+    from backend.models.certification import Certification, CertificationTranslation
+    from backend.models.profile import Profile, ProfileTranslation
+    from backend.models.tag import Tag
+
+    def rows(statement):
+        return [SimpleNamespace(**row) for row in session.execute(statement).mappings()]
+
+    def grouped(model, parent_key, *where):
+        """Rows of ``model`` by parent id, in primary key order."""
+        by_parent = defaultdict(list)
+        for row in rows(select(model.__table__).where(*where).order_by(model.id)):
+            by_parent[getattr(row, parent_key)].append(row)
+        return by_parent
+
+    def translations(model, parent_key):
+        return grouped(model, parent_key, model.lang.in_(chain))
+
+    def tags(secondary, parent_key):
+        by_parent = defaultdict(list)
+        statement = select(secondary.c[parent_key].label("_parent"), Tag.__table__).join(
+            Tag.__table__, Tag.id == secondary.c.tag_id
+        ).order_by(secondary.c[parent_key], Tag.id)
+        for row in session.execute(statement).mappings():
+            row = dict(row)
+            by_parent[row.pop("_parent")].append(SimpleNamespace(**row))
+        return by_parent
+
+    def attach(parents, **children):
+        for parent in parents:
+            for name, by_parent in children.items():
+                setattr(parent, name, by_parent.get(parent.id, []))
+        return parents
+
+    projects = attach(
+        rows(select(Project.__table__).order_by(Project.created_at.desc().nulls_last(), desc(Project.id))),
+        translations=translations(ProjectTranslation, "project_id"),
+        images=grouped(ProjectImage, "project_id"),
+        tags=tags(project_tags, "project_id"),
+        urls=grouped(ProjectURL, "project_id"),
+    )
+    for p in projects:
+        p.urls.sort(key=lambda x: x.order)  # Project.urls is ordered by ``order``
+
+    experiences = attach(
+        rows(select(Experience.__table__).order_by(desc(Experience.start_date))),
+        translations=translations(ExperienceTranslation, "experience_id"),
+        tags=tags(experience_tags, "experience_id"),
+    )
+
+    educations = attach(
+        rows(select(Education.__table__).order_by(desc(Education.start_date))),
+        translations=translations(EducationTranslation, "education_id"),
+        courses=grouped(Course, "education_id"),
+    )
+
+    categories = {
+        c.id: c for c in attach(
+            rows(select(SkillCategory.__table__)),
+            translations=translations(SkillCategoryTranslation, "category_id"),
+        )
+    }
+    skills = attach(
+        rows(select(Skill.__table__).order_by(Skill.order)),
+        translations=translations(SkillTranslation, "skill_id"),
+    )
+    for s in skills:
+        s.skill_category = categories.get(s.category_id)
+
+    certifications = attach(
+        rows(select(Certification.__table__).order_by(desc(Certification.issue_date))),
+        translations=translations(CertificationTranslation, "certification_id"),
+    )
+
+    profile = next(iter(rows(select(Profile.__table__).limit(1))), None)  # Assuming single profile
+    if profile:
+        profile.translations = rows(
+            select(ProfileTranslation.__table__)
+            .where(ProfileTranslation.profile_id == profile.id, ProfileTranslation.lang.in_(chain))
+            .order_by(ProfileTranslation.id)
+        )
+
+    return projects, experiences, educations, skills, certifications, profile
+
+
+_LOADERS = {"core": _load_core, "orm": _load_orm}
+
+
+def build_view(lang):
+    """
+    Load every public entity with only the translations in ``lang``'s
+    fallback chain and build its view (``lang`` None = fallbacks only).
+
+    ``READ_MODEL_LOADER`` picks how entities are read: ``core`` (default)
+    with flat Core SELECTs, or ``orm`` through the ORM. Both produce the
+    same view. Either way a private session is used, so nothing ends up in
+    the request's identity map.
+    """
+    started = time.perf_counter()
+    chain = language_chain(lang)
+
+    with Session(db.engine) as session:
+        entities = _LOADERS[READ_MODEL_LOADER](session, chain)
+        view = _build_view(lang, chain, *entities)
+
+    logger.info(
+        f"Read model view {lang or 'fallback'} built in "
+        f"{(time.perf_counter() - started) * 1000:.1f}ms "
+        f"({len(entities[0])} projects, languages: {list(chain)}, loader: {READ_MODEL_LOADER})"
+    )
+    return view
+
+
+def build_card_view(lang):
+    """
+    Load the project list for cards: ``CARD_FIELDS`` only, with the heavy
+    translation columns (description, content, cv_description) deferred
+    and image metadata reduced to what the thumbnail needs.
+    """
+    from backend.models.project import Project, ProjectImage, ProjectTranslation
+    from backend.models.tag import Tag
+
+    chain = language_chain(lang)
+
+    with Session(db.engine) as session:
+        projects = session.query(Project).options(
+            load_only(Project.id, Project.slug, Project.category,
+                      Project.created_at, Project.updated_at),
+            selectinload(Project.translations.and_(ProjectTranslation.lang.in_(chain))).options(
+                defer(ProjectTranslation.description),
+                defer(ProjectTranslation.content),
+                defer(ProjectTranslation.cv_description),
+            ),
+            selectinload(Project.images).load_only(
+                ProjectImage.url, ProjectImage.thumbnail_url, ProjectImage.order,
+                ProjectImage.is_featured, ProjectImage.created_at, ProjectImage.updated_at,
+            ),
+            selectinload(Project.tags).load_only(Tag.name, Tag.created_at, Tag.updated_at),
+        ).order_by(Project.created_at.desc().nulls_last(), desc(Project.id)).all()
+
+        cards = []
+        for p in projects:
+            trans = _pick_translation(p.translations, chain)
+            if not trans:
+                continue
+            card = serialize_project(p)
+            card.update(serialize_card_text(trans))
+            card["tags"] = [t.name for t in p.tags]
+            card["thumbnail"] = _thumbnail(sorted(p.images, key=lambda x: x.order))
+            cards.append(card)
+
+        last_modified = _later(
+            *(_latest(p, *p.translations, *p.images, *p.tags) for p in projects),
+            _bumped_at(SECTION_TYPES["projects"]),
+        )
+
+    return CardView(projects=tuple(cards), last_modified=last_modified)
@@ -0,0 +1,353 @@
+"""
+Search Index Service
+
+In-memory inverted index over the public projects, experience and skills
+of each language, built from the read model views (titles, subtitles,
+summaries, descriptions and tag names). Text is accent-folded and
+lower-cased, and each language's stopwords are dropped. Results are ranked
+with BM25 over field-weighted term frequencies and come back with
+highlighted snippets.
+
+An index follows its read model view: when an invalidation replaces the
+view, the next search re-indexes only the documents whose text changed and
+drops the ones that disappeared. It does so on a copy that is swapped in
+when complete, so searches running meanwhile keep a consistent index.
+"""
+
+import re
+import html
+import math
+import heapq
+import time
+import logging
+import threading
+import unicodedata
+from bisect import bisect_left
+
+logger = logging.getLogger(__name__)
+
+# Relative weight of a term occurrence in each field
+FIELD_WEIGHTS = {"title": 3.0, "tags": 2.0, "subtitle": 2.0, "summary": 1.5, "description": 1.0}
+
+# Fields tried, in order, for the snippet
+SNIPPET_FIELDS = ("summary", "description", "subtitle", "tags")
+SNIPPET_LENGTH = 160
+
+SEARCH_TYPES = ("project", "experience", "skill")
+MAX_PREFIX_EXPANSIONS = 20
+
+# BM25 parameters
+K1 = 1.2
+B = 0.75
+
+STOPWORDS = {
+    "en": frozenset(
+        "a an and are as at be by for from has have in is it its of on or that the this to was "
+        "were with".split()
+    ),
+    "es": frozenset(
+        "a al como con de del el en es esta este la las lo los mas o para pero por que se sin "
+        "su sus un una y".split()
+    ),
+}
+
+_TOKEN_RE = re.compile(r"\w+")
+_TAG_RE = re.compile(r"<[^>]+>")
+
+_indexes = {}  # lang (None = fallback view) -> SearchIndex
+_indexes_lock = threading.Lock()
+
+
+def _fold_char(c):
+    base = "".join(ch for ch in unicodedata.normalize("NFKD", c) if not unicodedata.combining(ch))
+    return (base or c).lower()[:1] or c
+
+
+class _FoldTable(dict):
+    """``str.translate`` table filled on demand: code point -> folded character."""
+
+    def __missing__(self, codepoint):
+        folded = self[codepoint] = _fold_char(chr(codepoint))
+        return folded
+
+
+_fold_table = _FoldTable()
+
+
+def fold(text):
+    """Lower-case and strip accents, keeping one character per input character."""
+    if text.isascii():
+        return text.lower()
+    return text.translate(_fold_table)
+
+
+def tokenize(text, stopwords=frozenset()):
+    """Folded tokens of ``text``, without ``stopwords``."""
+    return [t for t in _TOKEN_RE.findall(fold(text)) if t not in stopwords]
+
+
+def _plain(text):
+    """Text with HTML tags and entities removed (descriptions are stored as HTML)."""
+    if not text:
+        return ""
+    return " ".join(html.unescape(_TAG_RE.sub(" ", text)).split())
+
+
+def documents_from_view(view):
+    """Searchable documents of a read model view: key -> (meta, fields)."""
+    docs = {}
+    for p in view.projects:
+        docs[("project", p["slug"])] = ({"type": "project", "slug": p["slug"], "title": p["title"]}, {
+            "title": p["title"], "subtitle": p["subtitle"], "summary": p["summary"],
+            "description": _plain(p["description"]), "tags": ", ".join(p["tags"]),
+        })
+    for e in view.experience:
+        docs[("experience", e["slug"])] = ({"type": "experience", "slug": e["slug"], "title": e["title"]}, {
+            "title": e["title"], "subtitle": e["company"],
+            "description": _plain(e["description"]), "tags": ", ".join(e["tags"]),
+        })
+    for s in view.skills:
+        docs[("skill", s["slug"])] = ({"type": "skill", "slug": s["slug"], "title": s["name"]}, {
+            "title": s["name"], "subtitle": s["category"], "description": _plain(s["description"]),
+        })
+    return docs
+
+
+class SearchIndex:
+    """
+    Inverted index for one language; ``sync`` it with documents, then
+    ``search``. An index being searched must not be synced: sync a
+    ``copy`` (or use ``synced``) and swap it in instead.
+    """
+
+    def __init__(self, lang):
+        self.lang = lang
+        self.stopwords = STOPWORDS.get(lang, frozenset())
+        self.source = None  # The read model view last synced from
+        self.docs = {}  # key -> (meta, fields, folded fields, terms, length)
+        self.postings = {}  # term -> {key: weighted term frequency}
+        self.total_length = 0
+        self._vocabulary = None  # Sorted terms, for prefix matching
+        self._shared = frozenset()  # Terms whose postings are still shared with the original
+
+    def copy(self):
+        """
+        Copy that can be synced while this index is searched. Postings are
+        copied on first write, so syncing a few documents stays cheap.
+        """
+        index = SearchIndex.__new__(SearchIndex)
+        index.__dict__.update(self.__dict__)
+        index.docs = dict(self.docs)
+        index.postings = dict(self.postings)
+        index._shared = frozenset(self.postings)
+        return index
+
+    def synced(self, documents):
+        """``(index, changes)``: a synced copy, or this index when nothing changed."""
+        index = self.copy()
+        changes = index.sync(documents)
+        return (index if any(changes.values()) else self), changes
+
+    def _posting(self, term):
+        """Writable postings of ``term`` (copied first if still shared)."""
+        posting = self.postings.get(term)
+        if posting is None:
+            posting = self.postings[term] = {}
+        elif term in self._shared:
+            posting = self.postings[term] = dict(posting)
+            self._shared = self._shared - {term}
+        return posting
+
+    def _add(self, key, meta, fields):
+        folded = {name: fold(text or "") for name, text in fields.items()}
+        terms = {}
+        for name, text in folded.items():
+            weight = FIELD_WEIGHTS[name]
+            for token in _TOKEN_RE.findall(text):
+                if token not in self.stopwords:
+                    terms[token] = terms.get(token, 0.0) + weight
+        length = sum(terms.values())
+        for term, tf in terms.items():
+            self._posting(term)[key] = tf
+        self.docs[key] = (meta, fields, folded, terms, length)
+        self.total_length += length
+
+    def _remove(self, key):
+        meta, fields, _, terms, length = self.docs.pop(key)
+        for term in terms:
+            posting = self._posting(term)
+            del posting[key]
+            if not posting:
+                del self.postings[term]
+        self.total_length -= length
+
+    def sync(self, documents):
+        """
+        Make the index match ``documents`` (key -> (meta, fields)), touching
+        only added, changed and removed documents. Returns their counts.
+        """
+        added = updated = removed = 0
+        for key in [k for k in self.docs if k not in documents]:
+            self._remove(key)
+            removed += 1
+        for key, (meta, fields) in documents.items():
+            current = self.docs.get(key)
+            if current is not None:
+                if current[0] == meta and current[1] == fields:
+                    continue
+                self._remove(key)
+                updated += 1
+            else:
+                added += 1
+            self._add(key, meta, fields)
+        if added or updated or removed:
+            self._vocabulary = None
+        return {"added": added, "updated": updated, "removed": removed}
+
+    def _expand(self, prefix):
+        if self._vocabulary is None:
+            self._vocabulary = sorted(self.postings)
+        vocabulary = self._vocabulary
+        start = bisect_left(vocabulary, prefix)
+        expansions = []
+        for term in vocabulary[start:start + MAX_PREFIX_EXPANSIONS + 1]:
+            if not term.startswith(prefix):
+                break
+            if term != prefix:
+                expansions.append(term)
+        return expansions[:MAX_PREFIX_EXPANSIONS]
+
+    def search(self, query, types=None, limit=20):
+        """
+        Ranked matches for ``query``: every token must match; the last one
+        also matches as a prefix (search-as-you-type). Returns
+        ``(total, results)``.
+        """
+        tokens = tokenize(query, self.stopwords)
+        if not tokens or not self.docs:
+            return 0, []
+
+        n = len(self.docs)
+        average_length = self.total_length / n or 1.0
+
+        scores = None
+        matched = set()  # Terms to highlight
+        for i, token in enumerate(tokens):
+            candidates = [(token, 1.0)]
+            if i == len(tokens) - 1 and not query[-1:].isspace() and len(token) > 1:
+                candidates += [(term, 0.8) for term in self._expand(token)]
+
+            token_scores = {}
+            for term, boost in candidates:
+                posting = self.postings.get(term)
+                if not posting:
+                    continue
+                idf = math.log(1 + (n - len(posting) + 0.5) / (len(posting) + 0.5))
+                for key, tf in posting.items():
+                    if scores is not None and key not in scores:
+                        continue
+                    length = self.docs[key][4]
+                    score = boost * idf * tf * (K1 + 1) / (tf + K1 * (1 - B + B * length / average_length))
+                    if score > token_scores.get(key, 0.0):
+                        token_scores[key] = score
+                matched.add(term)
+
+            if scores is None:
+                scores = token_scores
+            else:
+                scores = {key: scores[key] + score for key, score in token_scores.items()}
+            if not scores:
+                return 0, []
+
+        if types:
+            scores = {key: score for key, score in scores.items() if key[0] in types}
+        top = heapq.nsmallest(limit, scores.items(), key=lambda item: (-item[1], item[0]))
+
+        pattern = term_pattern(matched)
+        results = []
+        for key, score in top:
+            meta, fields, folded, _, _ = self.docs[key]
+            results.append({
+                **meta,
+                "score": round(score, 4),
+                "highlight": highlight(fields["title"] or "", pattern, folded["title"]),
+                "snippet": snippet(fields, pattern, folded),
+            })
+        return len(scores), results
+
+
+def term_pattern(terms):
+    """Regex matching any of ``terms`` as a whole token of folded text."""
+    alternatives = "|".join(re.escape(t) for t in sorted(terms, key=len, reverse=True))
+    return re.compile(rf"(?<!\w)(?:{alternatives})(?!\w)")
+
+
+def highlight(text, pattern, folded=None):
+    """HTML-escaped ``text`` with the tokens ``pattern`` matches wrapped in ``<mark>``."""
+    if folded is None:
+        folded = fold(text)
+    parts, last = [], 0
+    for match in pattern.finditer(folded):
+        parts.append(html.escape(text[last:match.start()]))
+        parts.append(f"<mark>{html.escape(text[match.start():match.end()])}</mark>")
+        last = match.end()
+    parts.append(html.escape(text[last:]))
+    return "".join(parts)
+
+
+def snippet(fields, pattern, folded, length=SNIPPET_LENGTH):
+    """Highlighted excerpt around the first match in the snippet fields (None if none match)."""
+    for name in SNIPPET_FIELDS:
+        text = fields.get(name) or ""
+        first = pattern.search(folded.get(name, ""))
+        if first is None:
+            continue
+        start = max(0, first.start() - length // 3)
+        if start:
+            space = text.find(" ", start)
+            start = space + 1 if 0 <= space < first.start() else start
+        end = min(len(text), start + length)
+        if end < len(text):
+            space = text.rfind(" ", first.end(), end)
+            end = space if space > 0 else end
+        excerpt = highlight(text[start:end], pattern, folded[name][start:end])
+        return f"{'…' if start else ''}{excerpt}{'…' if end < len(text) else ''}"
+    return None
+
+
+def get_search_index(lang):
+    """The index for ``lang``, synced with the current read model view."""
+    from backend.services.read_model import get_read_model
+
+    model = get_read_model()
+    key = lang if lang in model.languages else None
+    view = model.view(key)
+
+    index = _indexes.get(key)
+    if index is not None and index.source is view:
+        return index
+
+    with _indexes_lock:
+        index = _indexes.get(key) or SearchIndex(key)
+        if index.source is not view:
+            # Synced on a copy: other threads may be searching ``index`` right now
+            started = time.perf_counter()
+            index, changes = index.synced(documents_from_view(view))
+            index.source = view
+            _indexes[key] = index
+            logger.info(
+                f"Search index {key or 'fallback'} synced in "
+                f"{(time.perf_counter() - started) * 1000:.1f}ms: {changes}"
+            )
+    return index
+
+
+def search(query, lang, types=None, limit=20):
+    """Search the ``lang`` index; see ``SearchIndex.search``."""
+    return get_search_index(lang).search(query, types=types, limit=limit)
+
+
+def clear_search_indexes():
+    """Forget every index (they rebuild from scratch on the next search)."""
+    with _indexes_lock:
+        _indexes.clear()
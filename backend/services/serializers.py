@@ -0,0 +1,237 @@
+"""
+Entity Serializers
+
+Model -> dict converters shared by the public read model, the admin data
+views and the backup export. Each serializer is compiled once, from a
+field list, into a plain function returning a dict literal, instead of
+building dicts by hand in every caller or walking ``__table__.columns``
+with ``getattr``.
+"""
+
+from operator import attrgetter
+
+from sqlalchemy import Date, DateTime, Time, inspect
+
+
+def iso(value):
+    """ISO string for dates and datetimes; anything else unchanged."""
+    return value.isoformat() if hasattr(value, "isoformat") else value
+
+
+def by_order(obj):
+    return obj.order
+
+
+def compile_serializer(*fields, name="serialize"):
+    """
+    Compile ``fields`` into ``serialize(obj) -> dict``.
+
+    A field is an attribute name, ``(key, attribute)`` or
+    ``(key, attribute, convert)``.
+
+    Loaded column values are read straight from the instance ``__dict__``,
+    skipping the ORM attribute descriptors. If one is missing there
+    (deferred or expired) the function falls back to plain attribute
+    access, which loads it.
+    """
+    namespace = {}
+    fast, slow = [], []
+    for i, field in enumerate(fields):
+        key, attr, *convert = (field, field) if isinstance(field, str) else field
+        if not attr.isidentifier():
+            raise ValueError(f"Not an attribute name: {attr!r}")
+        fast_value, slow_value = f"d[{attr!r}]", f"obj.{attr}"
+        if convert:
+            namespace[f"_convert{i}"] = convert[0]
+            fast_value, slow_value = f"_convert{i}({fast_value})", f"_convert{i}({slow_value})"
+        fast.append(f"{key!r}: {fast_value}")
+        slow.append(f"{key!r}: {slow_value}")
+
+    source = (
+        f"def {name}(obj):\n"
+        f"    d = obj.__dict__\n"
+        f"    try:\n"
+        f"        return {{{', '.join(fast)}}}\n"
+        f"    except KeyError:\n"
+        f"        return {{{', '.join(slow)}}}\n"
+    )
+    exec(compile(source, f"<serializer {name}>", "exec"), namespace)
+    return namespace[name]
+
+
+def compile_nested(serializer, **relations):
+    """
+    Extend ``serializer`` with list fields, each given as
+    ``key=(attribute, item_serializer)`` or
+    ``key=(attribute, item_serializer, sort_key)``.
+    """
+    relations = tuple(
+        (key, attrgetter(attr), item, rest[0] if rest else None)
+        for key, (attr, item, *rest) in relations.items()
+    )
+
+    def serialize(obj):
+        d = serializer(obj)
+        for key, get, item, sort_key in relations:
+            children = get(obj) or ()
+            if sort_key:
+                children = sorted(children, key=sort_key)
+            d[key] = [item(child) for child in children]
+        return d
+
+    return serialize
+
+
+def columns_of(model, convert_dates=True):
+    """Fields for every column of ``model``; dates become ISO strings unless told not to."""
+    return tuple(
+        (c.name, c.name, iso) if convert_dates and isinstance(c.type, (Date, DateTime, Time)) else c.name
+        for c in model.__table__.columns
+    )
+
+
+# ============================================
+# Public API (read model)
+# ============================================
+
+# The read model merges each entity's fields with its picked translation's
+
+serialize_project = compile_serializer("id", "slug", "category", ("created_at", "created_at", iso))
+serialize_project_text = compile_serializer("title", "subtitle", "summary", "description", "content")
+# Card text only; the other translation columns are deferred in ``build_card_view``
+serialize_card_text = compile_serializer("title", "subtitle", "summary")
+serialize_project_url = compile_serializer(("type", "url_type"), "url", "label", "order")
+serialize_project_image = compile_serializer(
+    "url", "type", "caption", "order", "thumbnail_url", "alt_text", "width", "height", "is_featured"
+)
+
+serialize_experience = compile_serializer(
+    "id", "slug", "location", ("startDate", "start_date"), ("endDate", "end_date"), "current"
+)
+# Title holds the company name and subtitle the job role in the DB
+serialize_experience_text = compile_serializer(("company", "title"), ("title", "subtitle"), "description")
+
+serialize_education = compile_serializer(
+    "id", "slug", "institution", "location", ("startDate", "start_date"), ("endDate", "end_date"), "current"
+)
+serialize_education_text = compile_serializer("title", "subtitle", "description")
+
+serialize_skill = compile_serializer("id", "slug", "icon_url", "proficiency", "category_id")
+serialize_skill_text = compile_serializer("name", "description")
+
+serialize_certification = compile_serializer(
+    "id", "slug", "issuer", ("issueDate", "issue_date"), ("expiryDate", "expiry_date"),
+    ("url", "credential_url"),
+)
+serialize_certification_text = compile_serializer("title", "description")
+
+serialize_profile = compile_serializer("name", "email", "location", "avatar_url", ("social", "social_links"))
+serialize_profile_text = compile_serializer("role", "tagline", "bio")
+
+serialize_tag = compile_serializer("slug", "name", "category")
+
+
+# ============================================
+# Backup export
+# ============================================
+
+_tag_name = compile_serializer("name")
+
+BACKUP_SERIALIZERS = {
+    "projects": compile_nested(
+        compile_serializer("id", "slug", "category", "is_featured_cv", ("created_at", "created_at", iso)),
+        translations=("translations", compile_serializer(
+            "lang", "title", "subtitle", "description", "summary", "content", "cv_description"
+        )),
+        urls=("urls", compile_serializer("url_type", "url", "order")),
+        images=("images", compile_serializer(
+            "url", "type", "alt_text", "width", "height", "is_featured", "order"
+        )),
+        tags=("tags", compile_serializer("name", "slug")),
+    ),
+    "experiences": compile_nested(
+        compile_serializer(
+            "id", "slug", "company", "location",
+            ("start_date", "start_date", iso), ("end_date", "end_date", iso), "current",
+        ),
+        translations=("translations", compile_serializer("lang", "title", "description")),
+        tags=("tags", _tag_name),
+    ),
+    "education": compile_nested(
+        compile_serializer(
+            "id", "slug", "institution", "location",
+            ("start_date", "start_date", iso), ("end_date", "end_date", iso), "current",
+        ),
+        courses=("courses", compile_serializer("name", "order")),
+        translations=("translations", compile_serializer("lang", "title", "description")),
+    ),
+    "skill_categories": compile_nested(
+        compile_serializer("id", "slug", "order"),
+        translations=("translations", compile_serializer("lang", "name")),
+    ),
+    "skills": compile_nested(
+        compile_serializer(
+            "id", "slug", "category_id", "proficiency", "icon_url",
+            "is_visible_cv", "is_visible_portfolio", "order",
+        ),
+        translations=("translations", compile_serializer("lang", "name", "description")),
+    ),
+    "certifications": compile_nested(
+        compile_serializer(
+            "id", "slug", "issuer",
+            ("issue_date", "issue_date", iso), ("expiry_date", "expiry_date", iso), "credential_url",
+        ),
+        translations=("translations", compile_serializer("lang", "title", "description")),
+    ),
+    "profile": compile_nested(
+        compile_serializer("id", "name", "email", "location", "social_links"),
+        translations=("translations", compile_serializer("lang", "role", "tagline", "bio")),
+    ),
+}
+
+
+# ============================================
+# Admin data views
+# ============================================
+
+_admin_serializers = {}
+
+
+def admin_serializer(model):
+    """
+    Serializer for the admin UI: every column of ``model`` (dates as ISO
+    strings) plus its translations, tags, images, courses and urls when it
+    has them. Compiled on first use per model, once the mappers are configured.
+    """
+    serializer = _admin_serializers.get(model)
+    if serializer is not None:
+        return serializer
+
+    relationships = inspect(model).relationships
+
+    def raw_columns(name):
+        return compile_serializer(*columns_of(relationships[name].mapper.class_, convert_dates=False))
+
+    relations = {}
+    if "translations" in relationships:
+        relations["translations"] = ("translations", raw_columns("translations"))
+    if "tags" in relationships:
+        relations["tags"] = ("tags", compile_serializer("id", "name", "slug"))
+    if "images" in relationships:
+        relations["images"] = ("images", raw_columns("images"))
+    if "courses" in relationships:
+        relations["courses"] = ("courses", attrgetter("name"), by_order)
+    if "urls" in relationships:
+        relations["urls"] = ("urls", raw_columns("urls"), by_order)
+
+    serializer = _admin_serializers[model] = compile_nested(
+        compile_serializer(*columns_of(model)), **relations
+    )
+    return serializer
+
+
+def serialize_admin(obj):
+    """Admin UI dict for any model row (None for None)."""
+    if obj is None:
+        return None
+    return admin_serializer(type(obj))(obj)
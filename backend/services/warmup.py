@@ -0,0 +1,248 @@
+"""
+Cache Warm-up Service
+
+Rebuilds the cached public API responses (every endpoint x language x
+project category, plus each project page) in a small background thread
+pool, and pre-renders every CV PDF variant (language x public/private) in
+a separate one, so the first visitor after a deploy or an admin save does
+not pay the cold cost.
+
+Warm-up runs once per worker at startup and again after every
+``invalidate_entities_cache()``, limited to the views that depend on the
+invalidated entity types. Runs triggered while one is in progress are
+merged into a single follow-up run.
+
+Without Redis each worker caches on its own, so a save only warms the
+worker that handled it. ``watch_other_workers`` has every other worker
+notice the bump in the shared generation file and warm itself too.
+"""
+
+import os
+import time
+import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+logger = logging.getLogger(__name__)
+
+WARMUP_ENABLED = os.getenv("CACHE_WARMUP", "true").lower() == "true"
+WARMUP_CONCURRENCY = int(os.getenv("CACHE_WARMUP_CONCURRENCY", 2))
+WARMUP_LANGS = ("es", "en")
+
+# CV PDFs are pre-rendered in their own pool so slow renders never hold up the API warm-up
+PDF_VARIANTS = ("public", "private")
+PDF_PRERENDER_CONCURRENCY = int(os.getenv("PDF_PRERENDER_CONCURRENCY", 1))
+
+# Marks warm-up requests so the rate limiter leaves them alone
+WARMUP_ENVIRON_KEY = "portfolio.warmup"
+
+# List endpoints that only vary by language
+_SIMPLE_VIEWS = (
+    "get_experience", "get_education", "get_skills", "get_certifications", "get_profile",
+    "get_bundle", "get_tags",
+)
+
+_state_lock = threading.Lock()
+_running = False
+_pending = None  # Entity types queued while a run is in progress (empty set = all)
+_last_report = None
+
+
+def _dependent_views(entity_types):
+    from backend.services.cache_service import ENTITY_TYPES, get_dependents
+
+    return {
+        view
+        for entity_type in (entity_types or ENTITY_TYPES)
+        for view in get_dependents(entity_type)["views"]
+    }
+
+
+def warmup_targets(app, entity_types=()):
+    """
+    URLs to request for the views depending on ``entity_types`` (all if empty).
+
+    Must run inside an app context; reads categories and project and tag
+    slugs from the read model, building it if needed.
+    """
+    from flask import url_for
+    from backend.services.read_model import get_read_model
+
+    views = _dependent_views(entity_types)
+    fallback = get_read_model().view(None)
+    projects = fallback.projects_by_slug.values()
+    categories = sorted({p["category"] for p in projects if p["category"]})
+
+    targets = []
+    with app.test_request_context():
+        for lang in WARMUP_LANGS:
+            if "get_projects" in views:
+                targets.append(url_for("api.get_projects", lang=lang))
+                targets.append(url_for("api.get_projects", lang=lang, view="card"))
+                targets.extend(url_for("api.get_projects", lang=lang, category=c) for c in categories)
+            if "get_project" in views:
+                targets.extend(url_for("api.get_project", slug=p["slug"], lang=lang) for p in projects)
+            if "get_tag" in views:
+                targets.extend(url_for("api.get_tag", slug=slug, lang=lang) for slug in fallback.tags)
+            targets.extend(url_for(f"api.{view}", lang=lang) for view in _SIMPLE_VIEWS if view in views)
+    return targets
+
+
+def _warm_url(app, url):
+    with app.test_request_context(
+        url,
+        headers={"Accept-Encoding": "gzip, br"},
+        environ_base={WARMUP_ENVIRON_KEY: True},
+    ):
+        response = app.full_dispatch_request()
+        if response.status_code >= 500:
+            raise RuntimeError(f"HTTP {response.status_code}")
+        return response.headers.get("X-Cache")
+
+
+def _warm_pdf(app, variant_key):
+    from backend.services.pdf_jobs import ensure_pdf
+
+    lang, variant = variant_key
+    # Rendering uses render_template, which needs a request context
+    with app.test_request_context(f"/cv/pdf?lang={lang}"):
+        return ensure_pdf(lang, variant)[0]
+
+
+def _pdf_target(lang, variant):
+    return f"/cv/pdf?lang={lang}" + ("&private=1" if variant == "private" else "")
+
+
+def run_warmup(app, entity_types=(), reason="manual"):
+    """
+    Warm every cache depending on ``entity_types`` (all if empty) and
+    return a report. Blocks until done; see ``schedule_warmup``.
+    """
+    from backend.services.cache_service import CV_SECTIONS
+
+    global _last_report
+    started = time.perf_counter()
+
+    with app.app_context():
+        tasks = [(url, _warm_url, url) for url in warmup_targets(app, entity_types)]
+    pdf_tasks = []
+    if not entity_types or any(t in CV_SECTIONS for t in entity_types):
+        # Public PDFs first: they are the ones visitors download
+        pdf_tasks = [
+            (_pdf_target(lang, variant), _warm_pdf, (lang, variant))
+            for variant in PDF_VARIANTS for lang in WARMUP_LANGS
+        ]
+
+    def timed(task):
+        name, warm, arg = task
+        task_started = time.perf_counter()
+        try:
+            status, error = warm(app, arg), None
+        except Exception as e:
+            status, error = "ERROR", str(e)
+        return {
+            "target": name,
+            "status": status,
+            "error": error,
+            "ms": round((time.perf_counter() - task_started) * 1000, 1),
+        }
+
+    with ThreadPoolExecutor(
+        max_workers=PDF_PRERENDER_CONCURRENCY, thread_name_prefix="pdf-prerender"
+    ) as pdf_pool, ThreadPoolExecutor(
+        max_workers=WARMUP_CONCURRENCY, thread_name_prefix="cache-warmup"
+    ) as pool:
+        pdf_futures = [pdf_pool.submit(timed, task) for task in pdf_tasks]
+        results = list(pool.map(timed, tasks))
+        pdf_results = [future.result() for future in pdf_futures]
+
+    pdf_variants = {
+        f"{lang}/{variant}": {"status": result["status"], "ms": result["ms"]}
+        for (_, _, (lang, variant)), result in zip(pdf_tasks, pdf_results)
+    }
+    results += pdf_results
+    failed = [r for r in results if r["error"]]
+    report = {
+        "reason": reason,
+        "entity_types": sorted(entity_types),
+        "targets": len(results),
+        "failed": len(failed),
+        "seconds": round(time.perf_counter() - started, 3),
+        "finished_at": time.time(),
+        "slowest": sorted(results, key=lambda r: r["ms"], reverse=True)[:5],
+        "pdf_variants": pdf_variants,
+        "errors": failed,
+    }
+    _last_report = report
+    logger.info(
+        f"Cache warm-up ({reason}) finished in {report['seconds']}s: "
+        f"{len(results) - len(failed)}/{len(results)} targets warmed"
+    )
+    if pdf_variants:
+        logger.info("CV PDF pre-render: " + ", ".join(
+            f"{name} {v['status']} {v['ms']}ms" for name, v in pdf_variants.items()
+        ))
+    for result in failed:
+        logger.warning(f"Cache warm-up failed for {result['target']}: {result['error']}")
+    return report
+
+
+def schedule_warmup(app, entity_types=(), reason="invalidation"):
+    """
+    Run ``run_warmup`` in a background thread and return immediately.
+
+    If a run is already in progress the request is queued; queued requests
+    are merged and run once the current run finishes.
+    """
+    global _running, _pending
+
+    if not WARMUP_ENABLED:
+        return False
+
+    with _state_lock:
+        if _running:
+            if _pending is None:
+                _pending = set(entity_types)
+            elif _pending and entity_types:
+                _pending |= set(entity_types)
+            else:
+                _pending = set()  # Someone asked for everything
+            return True
+        _running = True
+
+    def worker(entity_types, reason):
+        global _running, _pending
+
+        while True:
+            try:
+                run_warmup(app, tuple(entity_types), reason)
+            except Exception as e:
+                logger.error(f"Cache warm-up ({reason}) crashed: {e}")
+            with _state_lock:
+                if _pending is None:
+                    _running = False
+                    return
+                entity_types, reason, _pending = _pending, "queued", None
+
+    threading.Thread(
+        target=worker, args=(entity_types, reason), name="cache-warmup", daemon=True
+    ).start()
+    return True
+
+
+def watch_other_workers(app):
+    """
+    Warm this worker's caches after saves handled by other workers (only
+    needed without Redis, see ``cache_service.watch_generation_file``).
+    Returns True if the watch is running.
+    """
+    from backend.services.cache_service import watch_generation_file
+
+    if not WARMUP_ENABLED:
+        return False
+    return watch_generation_file(lambda entity_types: schedule_warmup(app, entity_types, reason="other worker"))
+
+
+def get_last_warmup_report():
+    """Report of the most recent warm-up in this worker (None if none ran yet)."""
+    return _last_report
@@ -458,13 +458,177 @@ function addUrlRow() {
   container.appendChild(div);
 }
 
-// Data variables - populated by inline script in HTML
-const projects = window.projects || [];
-const experiences = window.experiences || [];
-const education = window.education || [];
-const skills = window.skills || [];
-const skill_categories = window.skill_categories || [];
-const certifications = window.certifications || [];
+// Data variables - filled page by page from /admin/data/<type>
+const projects = [];
+const experiences = [];
+const education = [];
+const skills = [];
+const skill_categories = [];
+const certifications = [];
+window.skill_categories = skill_categories;
+
+const PAGE_SIZE = window.ADMIN_PAGE_SIZE || 50;
+
+// type -> rows loaded so far, cursor of the next page, and how to draw the list
+const listings = {
+  'project': { items: projects, render: renderProjects },
+  'experience': { items: experiences, render: renderExperiences },
+  'education': { items: education, render: renderEducation },
+  'certification': { items: certifications, render: renderCertifications },
+  'skill': { items: skills, render: renderSkills },
+  'skill-category': { items: skill_categories, render: renderSkills },
+};
+
+async function loadPage(type) {
+  const listing = listings[type];
+  if (listing.loading || listing.done) return;
+  listing.loading = true;
+  const more = document.getElementById(`more-${type}`);
+  if (more) more.disabled = true;
+
+  try {
+    const cursor = listing.cursor ? `&cursor=${encodeURIComponent(listing.cursor)}` : '';
+    const res = await fetch(`/admin/data/${type}?limit=${PAGE_SIZE}${cursor}`);
+    const page = await res.json();
+    if (!res.ok) throw new Error(page.message || `Error loading ${type}`);
+
+    listing.items.push(...page.items);
+    listing.cursor = page.next_cursor;
+    listing.done = !page.next_cursor;
+    listing.render();
+    if (more) more.classList.toggle('hidden', listing.done);
+    return true;
+  } catch (e) {
+    showToast(e.message, 'error');
+    return false;
+  } finally {
+    listing.loading = false;
+    if (more) more.disabled = false;
+  }
+}
+
+async function loadAll(type) {
+  while (!listings[type].done) {
+    if (!(await loadPage(type))) break; // Failed; the toast says why
+  }
+}
+
+function escapeHtml(value) {
+  return String(value ?? '').replace(/[&<>"']/g, c => (
+    { '&': '&amp;', '<': '&lt;', '>': '&gt;', '"': '&quot;', "'": '&#39;' }[c]
+  ));
+}
+
+function esTranslation(item) {
+  return (item.translations || []).find(t => t.lang === 'es');
+}
+
+function listItem(type, item, onclick, title, subtitle) {
+  return `
+    <div class="list-item" onclick="${onclick}(this.dataset.id)" data-id="${item.id}" style="cursor: pointer;">
+      <div class="item-info">
+        <h3>${escapeHtml(title)}</h3>
+        <p>${subtitle}</p>
+      </div>
+      <div class="item-actions">
+        <button class="action-btn delete"
+          onclick="event.stopPropagation(); deleteItem('${type}', this.closest('.list-item').dataset.id)"><i
+            class="fas fa-trash"></i></button>
+      </div>
+    </div>`;
+}
+
+function categoryGroup(summary, items, open) {
+  return `
+    <details class="category-group" ${open ? 'open' : ''}>
+      <summary
+        style="margin: 1.5rem 0 0.5rem; color: var(--accent); font-size: 0.9rem; text-transform: uppercase; letter-spacing: 0.05em; cursor: pointer; outline: none; user-select: none;">
+        ${summary}
+      </summary>
+      <div class="list-group">${items.join('')}</div>
+    </details>`;
+}
+
+function renderProjects() {
+  const groups = {};
+  projects.forEach(p => (groups[p.category || ''] = groups[p.category || ''] || []).push(p));
+  document.getElementById('list-project').innerHTML = Object.keys(groups).sort().map(category => {
+    const items = groups[category].map(p => {
+      const trans = esTranslation(p);
+      return listItem('project', p, 'editProject', trans ? trans.title : p.slug, escapeHtml(p.category || ''));
+    });
+    const summary = `${escapeHtml(category || 'Uncategorized')} <span style="font-size: 0.8em; opacity: 0.7; margin-left: 0.5rem;">(${items.length})</span>`;
+    return categoryGroup(summary, items, false);
+  }).join('');
+}
+
+function dateRange(item) {
+  return `${escapeHtml(item.start_date || '')} - ${escapeHtml(item.end_date || 'Present')}`;
+}
+
+// Pages arrive in display order (by date, latest first), so rows are shown as loaded
+function renderExperiences() {
+  document.getElementById('list-experience').innerHTML = experiences.map(e => {
+    const trans = esTranslation(e);
+    const role = escapeHtml(trans ? trans.subtitle : 'No Role');
+    return listItem('experience', e, 'editExperience', trans ? trans.title : 'No Company', `${role} • ${dateRange(e)}`);
+  }).join('');
+}
+
+function renderEducation() {
+  document.getElementById('list-education').innerHTML = education.map(e => {
+    const trans = esTranslation(e);
+    const degree = escapeHtml(trans ? trans.title : '');
+    return listItem('education', e, 'editEducation', e.institution, `${degree} • ${dateRange(e)}`);
+  }).join('');
+}
+
+function renderCertifications() {
+  document.getElementById('list-certification').innerHTML = certifications.map(c => {
+    const trans = esTranslation(c);
+    const issued = `${escapeHtml(c.issuer || '')} • ${escapeHtml(c.issue_date || '')}`;
+    return listItem('certification', c, 'editCertification', trans ? trans.title : c.slug, issued);
+  }).join('');
+}
+
+function skillItem(s) {
+  const trans = esTranslation(s);
+  let detail = `${escapeHtml(s.proficiency)}%`;
+  if (s.category_id) {
+    if (!s.is_visible_cv) detail += '<span style="color: var(--danger); font-size: 0.8em; margin-left: 0.5rem;">(Hidden in CV)</span>';
+    if (!s.is_visible_portfolio) detail += '<span style="color: var(--danger); font-size: 0.8em; margin-left: 0.5rem;">(Hidden in Portfolio)</span>';
+  }
+  return listItem('skill', s, 'editSkill', trans ? trans.name : s.slug, detail);
+}
+
+function renderSkills() {
+  // Grouped by category, so drawn once both listings are complete
+  if (!listings['skill'].done || !listings['skill-category'].done) return;
+  const byOrder = (a, b) => (a.order ?? 0) - (b.order ?? 0) || a.id - b.id;
+  const sorted = [...skills].sort(byOrder);
+
+  const groups = skill_categories.map(category => {
+    const trans = esTranslation(category);
+    const summary = `${escapeHtml(trans ? trans.name : category.slug)}
+        <button class="action-btn" style="margin-left: 0.5rem; font-size: 0.8em; padding: 0.2rem;"
+          onclick="event.preventDefault(); event.stopPropagation(); editSkillCategory(this.dataset.id)"
+          data-id="${category.id}"><i class="fas fa-edit"></i></button>
+        <button class="action-btn delete" style="margin-left: 0.2rem; font-size: 0.8em; padding: 0.2rem;"
+          onclick="event.preventDefault(); event.stopPropagation(); deleteItem('skill-category', this.dataset.id)"
+          data-id="${category.id}"><i class="fas fa-trash"></i></button>`;
+    return categoryGroup(summary, sorted.filter(s => s.category_id === category.id).map(skillItem), true);
+  });
+  const uncategorized = sorted.filter(s => !s.category_id);
+  if (uncategorized.length) groups.push(categoryGroup('Uncategorized', uncategorized.map(skillItem), true));
+  document.getElementById('list-skill').innerHTML = groups.join('');
+}
+
+document.addEventListener('DOMContentLoaded', () => {
+  ['project', 'experience', 'education', 'certification'].forEach(loadPage);
+  // The skill form lists every category, and skills are grouped under them
+  loadAll('skill-category');
+  loadAll('skill');
+});
 
 function editProject(id) { openModal('project', projects.find(p => p.id == id)); }
 
@@ -1,14 +1,19 @@
 import pytest
 import os
+import tempfile
 from datetime import date
 
 # Force SQLite before any app imports
 os.environ["DATABASE_URL"] = "sqlite:///:memory:"
 os.environ["RATELIMIT_ENABLED"] = "False"
+os.environ["CACHE_WARMUP"] = "false"  # Tests warm caches explicitly
+os.environ["PDF_STORE_DIR"] = tempfile.mkdtemp(prefix="portfolio-test-pdf-")
 
-from backend.app import app as flask_app
+from backend.app import app as flask_app, limiter
 from backend import db as _db
-from backend.services.cache_service import cache
+from backend.services.cache_service import cache, clear_local_cache
+from backend.services.read_model import invalidate_read_model
+from backend.services.cv_cache import invalidate_all_cv_cache, invalidate_pdf_cache
 from sqlalchemy.pool import StaticPool
 
 
@@ -39,14 +44,23 @@ def app():
 
 @pytest.fixture(autouse=True)
 def setup_db(app):
-    """Create tables before each test, drop after. Clear cache to avoid stale responses."""
+    """Create tables before each test, drop after. Clear caches to avoid stale responses."""
     with app.app_context():
         cache.clear()
+        clear_local_cache()
+        invalidate_read_model()
+        invalidate_all_cv_cache()
+        invalidate_pdf_cache()
+        limiter.reset()  # Per-minute limits would otherwise carry over between tests
         _db.create_all()
         yield
         _db.session.remove()
         _db.drop_all()
         cache.clear()
+        clear_local_cache()
+        invalidate_read_model()
+        invalidate_all_cv_cache()
+        invalidate_pdf_cache()
 
 
 @pytest.fixture
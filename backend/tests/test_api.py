@@ -1,4 +1,5 @@
 """Tests for all public API endpoints."""
+import json
 
 
 def test_health_check(client):
@@ -42,6 +43,186 @@ def test_get_projects_en(client, seed_data):
     assert data[0]["title"] == "Test Project"
 
 
+def test_get_projects_card_view(client, seed_data):
+    from backend.services.read_model import CARD_FIELDS
+
+    full = client.get("/api/projects?lang=en")
+    card = client.get("/api/projects?lang=en&view=card")
+    assert card.status_code == 200
+    data = card.get_json()
+    assert set(data[0]) == set(CARD_FIELDS)
+    assert data[0]["title"] == "Test Project"
+    assert data[0]["thumbnail"]
+    assert len(card.data) < len(full.data)
+
+
+def test_get_projects_fields(client, seed_data):
+    data = client.get("/api/projects?lang=en&fields=slug,title").get_json()
+    assert data == [{"slug": "test-project", "title": "Test Project"}]
+
+    # A field outside the card set comes from the full payload
+    full = client.get("/api/projects?lang=en&fields=slug,thumbnail,urls").get_json()
+    card = client.get("/api/projects?lang=en&view=card").get_json()
+    assert full[0]["thumbnail"] == card[0]["thumbnail"]
+    assert len(full[0]["urls"]) == 1
+
+
+def test_get_projects_projection_cached_separately(client, seed_data):
+    client.get("/api/projects?lang=en")
+    assert client.get("/api/projects?lang=en&view=card").headers["X-Cache"] == "MISS"
+    assert client.get("/api/projects?lang=en&fields=title,slug").headers["X-Cache"] == "MISS"
+    assert client.get("/api/projects?lang=en&fields=slug,title").headers["X-Cache"] == "HIT"
+
+
+def test_get_projects_unknown_field(client, seed_data):
+    response = client.get("/api/projects?fields=slug,password")
+    assert response.status_code == 400
+    assert response.get_json()["details"]["unknown"] == ["password"]
+    assert client.get("/api/projects?view=tiny").status_code == 400
+
+
+def _add_projects(count):
+    from datetime import datetime
+    from backend import db
+    from backend.models.project import Project, ProjectTranslation
+
+    for i in range(count):
+        # Pairs share a timestamp so the id tie-breaker is exercised
+        project = Project(slug=f"paged-{i}", category="project", created_at=datetime(2024, 1, 1 + i // 2))
+        project.translations.append(ProjectTranslation(lang="en", title=f"Paged {i}", content={}))
+        db.session.add(project)
+    db.session.commit()
+
+
+def test_get_projects_keyset_pages(client, app):
+    with app.app_context():
+        _add_projects(7)
+
+    everything = [p["slug"] for p in client.get("/api/projects?lang=en").get_json()]
+    seen, cursor = [], ""
+    while True:
+        response = client.get(f"/api/projects?lang=en&view=card&limit=3&cursor={cursor}")
+        page = response.get_json()
+        assert len(page["items"]) <= 3
+        seen.extend(p["slug"] for p in page["items"])
+        if not page["next_cursor"]:
+            break
+        cursor = page["next_cursor"]
+
+    assert seen == everything
+    assert client.get(f"/api/projects?lang=en&view=card&limit=3&cursor={cursor}").headers["X-Cache"] == "HIT"
+
+
+def test_get_projects_pages_with_null_created_at(client, app):
+    """A project without ``created_at`` sorts last, as the page key expects, and is paged once."""
+    from backend import db
+    from backend.models.project import Project
+
+    with app.app_context():
+        _add_projects(4)
+        db.session.query(Project).filter_by(slug="paged-1").update({"created_at": None})
+        db.session.commit()
+
+    everything = client.get("/api/projects?lang=en").get_json()
+    keys = [(p["created_at"] or "", p["id"]) for p in everything]
+    assert keys == sorted(keys, reverse=True)
+    assert everything[-1]["slug"] == "paged-1"
+
+    seen, cursor = [], ""
+    while True:
+        page = client.get(f"/api/projects?lang=en&view=card&limit=1&cursor={cursor}").get_json()
+        seen.extend(p["slug"] for p in page["items"])
+        if not page["next_cursor"]:
+            break
+        cursor = page["next_cursor"]
+    assert seen == [p["slug"] for p in everything]
+
+
+def test_get_projects_invalid_page_args(client, seed_data):
+    assert client.get("/api/projects?limit=0").status_code == 400
+    assert client.get("/api/projects?limit=ten").status_code == 400
+    assert client.get("/api/projects?cursor=not-a-cursor").status_code == 400
+
+
+def test_admin_data_pages_in_display_order(client, app):
+    """Experience pages follow start_date (latest first, undated last), the order the list shows."""
+    from datetime import date
+    from backend import db
+    from backend.models.experience import Experience
+
+    starts = [date(2020, 1, 1), None, date(2023, 1, 1), date(2021, 1, 1), None, date(2023, 1, 1)]
+    with app.app_context():
+        for i, start in enumerate(starts):
+            db.session.add(Experience(slug=f"exp-{i}", start_date=start))
+        db.session.commit()
+    with client.session_transaction() as session:
+        session["user_email"] = "admin@example.com"
+        session["user_role"] = "admin"
+
+    seen, cursor = [], ""
+    while True:
+        page = client.get(f"/admin/data/experience?limit=2&cursor={cursor}").get_json()
+        seen.extend(e["slug"] for e in page["items"])
+        if not page["next_cursor"]:
+            break
+        cursor = page["next_cursor"]
+    assert seen == ["exp-5", "exp-2", "exp-3", "exp-0", "exp-4", "exp-1"]
+
+
+def test_tampered_cursor(client, app):
+    """Well-formed cursors holding the wrong types are rejected, not compared."""
+    import base64
+    import json as _json
+
+    with app.app_context():
+        _add_projects(3)
+    with client.session_transaction() as session:
+        session["user_email"] = "admin@example.com"
+        session["user_role"] = "admin"
+
+    def cursor(values):
+        return base64.urlsafe_b64encode(_json.dumps(values).encode()).decode().rstrip("=")
+
+    for values in ([1, "x"], ["x", 1], [[], 1], ["2024-01-01T00:00:00", True]):
+        assert client.get(f"/api/projects?limit=1&cursor={cursor(values)}").status_code == 400
+        assert client.get(f"/admin/data/project?limit=1&cursor={cursor(values)}").status_code == 400
+    # Valid in shape, but an int does not compare with the timestamps
+    assert client.get(f"/api/projects?limit=1&cursor={cursor([5, 1])}").status_code == 400
+    assert client.get(f"/admin/data/project?limit=1&cursor={cursor([5, 1])}").status_code == 400
+    assert client.get(f"/admin/data/skill-category?limit=1&cursor={cursor(['2024-01-01', 1])}").status_code == 400
+
+
+def test_admin_data_pages(client, app):
+    with app.app_context():
+        _add_projects(5)
+    with client.session_transaction() as session:
+        session["user_email"] = "admin@example.com"
+        session["user_role"] = "admin"
+
+    first = client.get("/admin/data/project?limit=2").get_json()
+    assert [p["slug"] for p in first["items"]] == ["paged-4", "paged-3"]
+    assert first["items"][0]["translations"][0]["title"] == "Paged 4"
+
+    second = client.get(f"/admin/data/project?limit=2&cursor={first['next_cursor']}").get_json()
+    third = client.get(f"/admin/data/project?limit=2&cursor={second['next_cursor']}").get_json()
+    assert [p["slug"] for p in second["items"] + third["items"]] == ["paged-2", "paged-1", "paged-0"]
+    assert third["next_cursor"] is None
+
+    assert client.get("/admin/data/secrets").status_code == 400
+
+
+def test_admin_home_pages_lists_in(client, seed_data):
+    """The admin page renders only the profile; entity lists come from /admin/data."""
+    with client.session_transaction() as session:
+        session["user_email"] = "admin@example.com"
+        session["user_role"] = "admin"
+
+    page = client.get("/admin?ready=true").get_data(as_text=True)
+    assert 'id="list-project"' in page
+    assert "Test Project" not in page and "Proyecto Test" not in page
+    assert 'value="Test User"' in page
+
+
 def test_get_project_by_slug(client, seed_data):
     response = client.get("/api/projects/test-project?lang=en")
     assert response.status_code == 200
@@ -116,6 +297,22 @@ def test_get_skills_en(client, seed_data):
     assert data[0]["category"] == "Languages"
 
 
+
+def test_get_skills_category_falls_back(client, app, seed_data):
+    """A category without the skill's language uses the fallback chain, like the skill itself."""
+    from backend import db
+    from backend.models.skill import Skill, SkillTranslation
+
+    with app.app_context():
+        skill = Skill.query.filter_by(slug="python").one()
+        skill.translations.append(SkillTranslation(lang="fr", name="Python", description="Langage"))
+        db.session.commit()
+
+    data = client.get("/api/skills?lang=fr").get_json()
+    assert data[0]["description"] == "Langage"
+    assert data[0]["category"] == "Lenguajes"
+
+
 # --- Certifications ---
 
 def test_get_certifications(client, seed_data):
@@ -168,3 +365,298 @@ def test_404_api_error_format(client):
     assert data["error"] is True
     assert data["status"] == 404
     assert "message" in data
+
+
+# --- Response cache ---
+
+def test_cached_response_hit_and_miss(client, seed_data):
+    first = client.get("/api/projects?lang=en")
+    second = client.get("/api/projects?lang=en")
+    assert first.headers["X-Cache"] == "MISS"
+    assert second.headers["X-Cache"] == "HIT"
+    assert first.data == second.data
+
+
+def test_cached_response_precompressed_variants(client, seed_data):
+    import gzip
+    import brotli
+
+    plain = client.get("/api/projects?lang=en").get_json()
+
+    gz = client.get("/api/projects?lang=en", headers={"Accept-Encoding": "gzip"})
+    assert gz.headers["Content-Encoding"] == "gzip"
+    assert gz.headers["Vary"] == "Accept-Encoding"
+    assert json.loads(gzip.decompress(gz.data)) == plain
+
+    br = client.get("/api/projects?lang=en", headers={"Accept-Encoding": "gzip, br"})
+    assert br.headers["Content-Encoding"] == "br"
+    assert json.loads(brotli.decompress(br.data)) == plain
+
+
+def test_cached_response_small_body_uncompressed(client):
+    response = client.get("/api/projects?lang=es", headers={"Accept-Encoding": "gzip, br"})
+    assert "Content-Encoding" not in response.headers
+    assert response.get_json() == []
+
+
+def test_etag_not_modified(client, seed_data):
+    first = client.get("/api/projects/test-project?lang=en")
+    etag = first.headers["ETag"]
+    assert etag.startswith('"') and not etag.startswith('W/')
+    assert "Last-Modified" in first.headers
+
+    second = client.get("/api/projects/test-project?lang=en", headers={"If-None-Match": etag})
+    assert second.status_code == 304
+    assert second.data == b""
+    assert second.headers["ETag"] == etag
+
+
+def test_etag_matches_across_encodings(client, seed_data):
+    etag = client.get("/api/projects?lang=en").headers["ETag"]
+    response = client.get("/api/projects?lang=en",
+                          headers={"If-None-Match": etag, "Accept-Encoding": "gzip"})
+    assert response.status_code == 304
+    assert response.headers["ETag"].endswith(':gzip"')
+
+
+def test_if_modified_since(client, seed_data):
+    last_modified = client.get("/api/skills?lang=en").headers["Last-Modified"]
+    response = client.get("/api/skills?lang=en", headers={"If-Modified-Since": last_modified})
+    assert response.status_code == 304
+
+    response = client.get("/api/skills?lang=en",
+                          headers={"If-Modified-Since": "Mon, 01 Jan 2001 00:00:00 GMT"})
+    assert response.status_code == 200
+
+
+def test_last_modified_moves_on_delete(client, seed_data, monkeypatch):
+    """Deleting a row moves Last-Modified forward although no remaining row changed."""
+    import time
+    from datetime import datetime
+    from sqlalchemy import update
+    from backend import db
+    from backend.models.project import Project, ProjectTranslation, ProjectImage
+    from backend.models.project_url import ProjectURL
+    from backend.models.tag import Tag
+    from backend.services import read_model
+    from backend.services.cache_service import bump_generation, generation_bumped_at, invalidate_entities_cache
+
+    before = time.time()
+    bump_generation("tag")
+    assert generation_bumped_at("tag") >= before - 1
+
+    # Only the recorded bump time is controlled; the rows are aged in the database
+    old = datetime(2020, 1, 1)
+    bumped_at = {"at": old.timestamp()}
+    monkeypatch.setattr(read_model, "generation_bumped_at", lambda *types: bumped_at["at"])
+    for model in (Project, ProjectTranslation, ProjectImage, ProjectURL, Tag):
+        db.session.execute(update(model).values(created_at=old, updated_at=old))
+    db.session.commit()
+    invalidate_entities_cache("project")
+    last_modified = client.get("/api/projects?lang=en").headers["Last-Modified"]
+    assert client.get("/api/projects?lang=en", headers={"If-Modified-Since": last_modified}).status_code == 304
+
+    db.session.delete(seed_data["project"].images[0])
+    db.session.commit()
+    bumped_at["at"] = datetime(2021, 1, 1).timestamp()
+    invalidate_entities_cache("project")
+    response = client.get("/api/projects?lang=en", headers={"If-Modified-Since": last_modified})
+    assert response.status_code == 200
+    assert response.get_json()[0]["images"] == []
+
+
+def test_etag_changes_after_update(client, seed_data):
+    from backend import db
+    from backend.services.cache_service import invalidate_entities_cache
+
+    etag = client.get("/api/projects?lang=en").headers["ETag"]
+    seed_data["project"].category = "work"
+    db.session.commit()
+    invalidate_entities_cache()
+
+    response = client.get("/api/projects?lang=en", headers={"If-None-Match": etag})
+    assert response.status_code == 200
+    assert response.headers["ETag"] != etag
+
+
+def test_not_found_has_no_etag(client, seed_data):
+    response = client.get("/api/projects/nonexistent", headers={"If-None-Match": "*"})
+    assert response.status_code == 404
+    assert "ETag" not in response.headers
+
+
+# --- Bundle ---
+
+def test_bundle_matches_single_endpoints(client, seed_data):
+    response = client.get("/api/bundle?lang=en")
+    assert response.status_code == 200
+    data = response.get_json()
+    assert data["lang"] == "en"
+    for section in ("profile", "experience", "education", "skills", "certifications", "projects"):
+        assert data[section] == client.get(f"/api/{section}?lang=en").get_json(), section
+    assert response.headers["ETag"]
+
+
+def test_bundle_include(client, seed_data):
+    response = client.get("/api/bundle?lang=es&include=skills,profile")
+    data = response.get_json()
+    assert set(data) == {"lang", "skills", "profile"}
+
+    # Section order does not matter for the cache key
+    same = client.get("/api/bundle?lang=es&include=profile,skills")
+    assert same.headers["X-Cache"] == "HIT"
+
+
+def test_bundle_unknown_section(client, seed_data):
+    response = client.get("/api/bundle?include=skills,secrets")
+    assert response.status_code == 400
+    assert response.get_json()["details"]["unknown"] == ["secrets"]
+
+
+def test_bundle_invalidated_by_any_section(client, seed_data):
+    from backend.services.cache_service import invalidate_entities_cache
+
+    client.get("/api/bundle?lang=en")
+    invalidate_entities_cache("certification")
+    assert client.get("/api/bundle?lang=en").headers["X-Cache"] == "MISS"
+
+
+def test_get_tags(client, seed_data):
+    from backend import db
+    from backend.models.tag import Tag
+
+    flask = Tag(name="Flask", slug="flask")
+    seed_data["experience"].tags.extend([seed_data["tag"], flask])
+    db.session.commit()
+
+    response = client.get("/api/tags?lang=en")
+    assert response.status_code == 200
+    assert response.headers["Last-Modified"]
+    data = response.get_json()
+    assert data["total"] == 2
+    assert [(t["slug"], t["counts"], t["total"]) for t in data["tags"]] == [
+        ("python", {"projects": 1, "experience": 1}, 2),
+        ("flask", {"projects": 0, "experience": 1}, 1),
+    ]
+
+
+def test_get_tag(client, seed_data):
+    from backend.services.read_model import CARD_FIELDS
+
+    response = client.get("/api/tags/python?lang=en")
+    assert response.status_code == 200
+    data = response.get_json()
+    assert data["tag"] == {"slug": "python", "name": "Python", "category": None}
+    assert [p["slug"] for p in data["projects"]] == ["test-project"]
+    assert set(data["projects"][0]) == set(CARD_FIELDS)
+    assert data["experience"] == []
+
+    assert client.get("/api/tags/rust?lang=en").status_code == 404
+
+
+def test_tag_index_follows_admin_saves(client, seed_data):
+    from backend import db
+    from backend.services.cache_service import invalidate_entities_cache
+
+    assert client.get("/api/tags/python?lang=en").get_json()["experience"] == []
+
+    seed_data["experience"].tags.append(seed_data["tag"])
+    db.session.commit()
+    invalidate_entities_cache("experience")
+
+    response = client.get("/api/tags/python?lang=en")
+    assert response.headers["X-Cache"] == "MISS"
+    assert [e["slug"] for e in response.get_json()["experience"]] == ["test-exp"]
+    assert client.get("/api/tags?lang=en").get_json()["tags"][0]["counts"]["experience"] == 1
+
+
+# --- JSON provider ---
+
+def _provider_sample():
+    import uuid
+    from decimal import Decimal
+    from datetime import date, datetime
+
+    return {
+        "b": [date(2024, 1, 2), datetime(2024, 1, 2, 3, 4, 5)],
+        "a": {"price": Decimal("9.99"), "id": uuid.UUID(int=1), "text": "Año, café"},
+        "n": (1, 2.5, None, True),
+    }
+
+
+def test_json_provider_matches_flask_default(app):
+    from flask.json.provider import DefaultJSONProvider
+
+    sample = _provider_sample()
+    fast, default = app.json.dumps(sample), DefaultJSONProvider(app).dumps(sample)
+    assert json.loads(fast) == json.loads(default)
+    assert fast.index('"a"') < fast.index('"b"')  # Keys sorted like Flask's provider
+    assert json.loads(fast)["b"][0] == "Tue, 02 Jan 2024 00:00:00 GMT"
+    assert json.loads(app.json.dumps({"raw": b"\x00\xff"})) == {"raw": "AP8="}
+
+
+def test_json_provider_without_orjson(app, monkeypatch):
+    from backend.utils import json_provider
+
+    fast = app.json.dumps(_provider_sample())
+    monkeypatch.setattr(json_provider, "orjson", None)
+    assert json.loads(app.json.dumps(_provider_sample())) == json.loads(fast)
+    assert app.json.loads('{"a": [1]}') == {"a": [1]}
+    with app.test_request_context():
+        assert app.json.response({"a": 1}).get_json() == {"a": 1}
+
+
+def test_api_response_uses_provider(client, seed_data):
+    response = client.get("/api/projects?lang=es")
+    assert response.data.endswith(b"]\n")
+    assert "Subtítulo".encode() in response.data  # UTF-8, not \u escapes
+
+
+# --- Search ---
+
+def test_search_ranks_and_folds_accents(client, seed_data):
+    response = client.get("/api/search?q=subtitulo&lang=es")
+    assert response.status_code == 200
+    data = response.get_json()
+    assert data["total"] == 1
+    result = data["results"][0]
+    assert (result["type"], result["slug"]) == ("project", "test-project")
+    assert result["snippet"] == "<mark>Subtítulo</mark>"
+
+    # Title matches outrank tag and description matches
+    results = client.get("/api/search?q=python&lang=en").get_json()["results"]
+    assert [(r["type"], r["slug"]) for r in results] == [("skill", "python"), ("project", "test-project")]
+    assert results[0]["highlight"] == "<mark>Python</mark>"
+
+
+def test_search_prefix_and_types(client, seed_data):
+    data = client.get("/api/search?q=test+pro&lang=en").get_json()
+    assert [r["slug"] for r in data["results"]] == ["test-project"]
+    assert data["results"][0]["highlight"] == "<mark>Test</mark> <mark>Project</mark>"
+
+    data = client.get("/api/search?q=pyth&lang=en&type=skill").get_json()
+    assert [r["type"] for r in data["results"]] == ["skill"]
+
+    assert client.get("/api/search?q=pyth+&lang=en").get_json()["total"] == 0
+
+
+def test_search_follows_updates(client, seed_data):
+    from backend import db
+    from backend.services.cache_service import invalidate_entities_cache
+
+    assert client.get("/api/search?q=kubernetes&lang=en").get_json()["total"] == 0
+
+    trans = next(t for t in seed_data["project"].translations if t.lang == "en")
+    trans.summary = "Deployed on Kubernetes"
+    db.session.commit()
+    invalidate_entities_cache("project")
+
+    data = client.get("/api/search?q=kubernetes&lang=en").get_json()
+    assert data["total"] == 1
+    assert data["results"][0]["snippet"] == "Deployed on <mark>Kubernetes</mark>"
+
+
+def test_search_invalid_args(client, seed_data):
+    assert client.get("/api/search?q=&lang=en").status_code == 400
+    assert client.get("/api/search?q=python&type=course").status_code == 400
+    assert client.get("/api/search?q=python&limit=0").status_code == 400
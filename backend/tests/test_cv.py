@@ -91,3 +91,125 @@ def test_cv_view_no_data(client):
     """Test /cv endpoint with no profile data."""
     response = client.get("/cv?lang=es")
     assert response.status_code == 404
+
+
+def _wait_for_job(client, status_url, timeout=5):
+    import time
+
+    deadline = time.time() + timeout
+    while True:
+        job = client.get(status_url).get_json()
+        if job["status"] not in ("queued", "running") or time.time() > deadline:
+            return job
+        time.sleep(0.01)
+
+
+def test_cv_pdf_jobs(client, seed_data, monkeypatch):
+    """Async PDF jobs: identical requests share a job, the result is downloaded by hash."""
+    import io
+    import threading
+    from backend.services import pdf_service
+
+    release = threading.Event()
+    renders = []
+
+    class FakePDFService:
+        def generate_cv_pdf(self, cv_data, lang="es"):
+            renders.append(lang)
+            release.wait(5)
+            return io.BytesIO(b"%PDF-1.7 job")
+
+    monkeypatch.setattr(pdf_service, "PDFService", FakePDFService)
+
+    first = client.post("/cv/pdf/jobs", json={"lang": "en"})
+    second = client.post("/cv/pdf/jobs?lang=en")
+    assert first.status_code == second.status_code == 202
+    job = first.get_json()
+    assert second.get_json()["job_id"] == job["job_id"]
+    assert job["download_url"] is None
+
+    release.set()
+    job = _wait_for_job(client, job["status_url"])
+    assert job["status"] == "done", job
+    assert renders == ["en"]
+
+    download = client.get(job["download_url"])
+    assert download.status_code == 200
+    assert download.data == b"%PDF-1.7 job"
+    assert "CV_Test_User_en.pdf" in download.headers["Content-Disposition"]
+
+    # Already rendered: done at once, no new render
+    again = client.post("/cv/pdf/jobs", json={"lang": "en"})
+    assert again.status_code == 200
+    assert again.get_json()["download_url"] == job["download_url"]
+    assert renders == ["en"]
+
+
+def test_cv_pdf_jobs_across_workers(client, seed_data, monkeypatch):
+    """Job state and claims are files, so any worker sees them without Redis."""
+    import os
+    from backend.services import pdf_jobs, pdf_service
+    from backend.services.cv_cache import set_cached_pdf
+
+    class FakePDFService:
+        def generate_cv_pdf(self, cv_data, lang="es"):
+            raise AssertionError("Claimed by another worker; must not render here")
+
+    monkeypatch.setattr(pdf_service, "PDFService", FakePDFService)
+
+    # Learn the job id; this render fails and its state is dropped
+    job_id = client.post("/cv/pdf/jobs", json={"lang": "es"}).get_json()["job_id"]
+    assert _wait_for_job(client, f"/cv/pdf/jobs/{job_id}")["status"] == "failed"
+    os.unlink(pdf_jobs._job_path(job_id))
+
+    # Another worker claims the job and writes its state
+    assert pdf_jobs._claim(job_id)
+    pdf_jobs._save_job({**pdf_jobs.done_job(job_id, "es", "public"), "status": "running", "file_id": None})
+
+    response = client.post("/cv/pdf/jobs", json={"lang": "es"})
+    assert response.status_code == 202
+    assert response.get_json()["status"] == "running"
+
+    # It finishes; a poll here sees the result
+    data_hash, lang, variant = pdf_jobs.parse_job_id(job_id)
+    set_cached_pdf(lang, data_hash, b"%PDF-1.7 other", variant)
+    pdf_jobs.done_job(job_id, lang, variant)
+    pdf_jobs._release(job_id)
+    assert client.get(f"/cv/pdf/jobs/{job_id}").get_json()["status"] == "done"
+
+    # State lost: the id is the PDF's address, so a stored PDF still reports done
+    os.unlink(pdf_jobs._job_path(job_id))
+    polled = client.get(f"/cv/pdf/jobs/{job_id}")
+    assert polled.status_code == 200
+    assert polled.get_json()["download_url"]
+
+
+def test_cv_pdf_jobs_errors(client, seed_data):
+    assert client.get("/cv/pdf/jobs/nope-en-public").status_code == 404
+    assert client.get("/cv/pdf/files/nope.pdf").status_code == 404
+
+
+def test_cv_unknown_languages_share_the_fallback(client, seed_data, monkeypatch):
+    """Made-up languages are served the fallback CV and add no cache entries."""
+    import io
+    from backend.services import cv_cache, pdf_service
+
+    class FakePDFService:
+        def generate_cv_pdf(self, cv_data, lang="es"):
+            return io.BytesIO(b"%PDF-1.7 fallback")
+
+    monkeypatch.setattr(pdf_service, "PDFService", FakePDFService)
+
+    assert client.get("/cv?lang=en").status_code == 200
+    for i in range(20):
+        assert client.get(f"/cv?lang=zz{i}").status_code == 200
+    assert sorted(key.rsplit(":", 1)[1] for key in cv_cache._cache.keys()) == ["en", "es"]
+
+    job = client.post("/cv/pdf/jobs", json={"lang": "../en"}).get_json()
+    assert job["lang"] == "es"
+    assert _wait_for_job(client, job["status_url"])["status"] == "done"
+
+    monkeypatch.setattr(cv_cache._cache, "max_entries", 2)
+    for version in range(5):
+        cv_cache.set_cached_cv("es", {"basics": {}}, version=str(version))
+    assert len(cv_cache._cache) == 2
@@ -59,24 +59,115 @@ def test_cv_cache_set_get(app):
 def test_cv_pdf_cache(app):
     """Test PDF cache set and get operations."""
     from backend.services.cv_cache import (
-        get_cached_pdf, set_cached_pdf, invalidate_all_cv_cache
+        get_cached_pdf, set_cached_pdf, invalidate_all_cv_cache, get_cv_version, get_pdf_hash
     )
 
     with app.app_context():
         invalidate_all_cv_cache()
 
         cv_data = {"basics": {"name": "Test"}}
+        data_hash = get_pdf_hash("en", cv_data, get_cv_version())
         pdf_bytes = b"%PDF-1.4 fake content"
 
-        set_cached_pdf("en", cv_data, pdf_bytes)
-        cached, hit = get_cached_pdf("en", cv_data)
+        path = set_cached_pdf("en", data_hash, pdf_bytes)
+        cached, hit = get_cached_pdf("en", data_hash)
         assert hit is True
-        assert cached == pdf_bytes
+        assert cached == path
+        with open(cached, "rb") as f:
+            assert f.read() == pdf_bytes
 
-        # Different data should miss
-        different_data = {"basics": {"name": "Changed"}}
-        cached2, hit2 = get_cached_pdf("en", different_data)
-        assert hit2 is False
+        # Other variants and data miss; unchanged data keeps its PDF across versions
+        assert get_cached_pdf("en", data_hash, "private") == (None, False)
+        assert get_cached_pdf("en", get_pdf_hash("en", {"basics": {"name": "Changed"}})) == (None, False)
+        invalidate_all_cv_cache()
+        assert get_pdf_hash("en", cv_data, get_cv_version()) == data_hash
+
+        # Language codes that cannot be file names are just not stored
+        assert set_cached_pdf("../en", data_hash, pdf_bytes) is None
+        assert get_cached_pdf("../en", data_hash) == (None, False)
+
+
+def test_pdf_store_lru_eviction(app):
+    """The store deletes the least recently used PDFs once over its byte budget."""
+    import os
+    from backend.services import pdf_store
+
+    old = pdf_store.put_pdf("a" * 32, "en", b"%PDF" + b"0" * 96)
+    used = pdf_store.put_pdf("b" * 32, "en", b"%PDF" + b"1" * 96)
+    os.utime(old, (1, 1))
+    os.utime(used, (2, 2))
+    assert pdf_store.get_pdf("b" * 32, "en") == used  # Hit marks it as recently used
+    newest = pdf_store.put_pdf("c" * 32, "en", b"%PDF" + b"2" * 96)
+    os.utime(newest, (3, 3))
+
+    assert pdf_store.evict(max_bytes=250) == 1
+    assert pdf_store.get_pdf("a" * 32, "en") is None
+    assert pdf_store.get_store_stats()["pdf_entries"] == 2
+    assert not [n for n in os.listdir(pdf_store.PDF_STORE_DIR) if n.startswith(".tmp-")]
+
+
+def test_cv_pdf_served_from_store(client, seed_data, monkeypatch):
+    """/cv/pdf renders once per variant and then streams the stored file."""
+    import io
+    from backend.services import pdf_store
+    from backend.routes import cv
+
+    renders = []
+
+    class FakePDFService:
+        def generate_cv_pdf(self, cv_data, lang="es"):
+            renders.append(cv_data["basics"]["email"])
+            return io.BytesIO(b"%PDF-1.7 " + cv_data["basics"]["email"].encode())
+
+    monkeypatch.setattr(cv, "PDFService", FakePDFService)
+
+    first = client.get("/cv/pdf?lang=en")
+    second = client.get("/cv/pdf?lang=en")
+    private = client.get("/cv/pdf?lang=en&private=1")
+    assert first.status_code == second.status_code == private.status_code == 200
+    assert first.data == second.data == b"%PDF-1.7 test@example.com"
+    assert private.data == b"%PDF-1.7 "
+    assert renders == ["test@example.com", ""]
+    assert second.headers["ETag"] != private.headers["ETag"]
+    assert pdf_store.get_store_stats()["pdf_entries"] == 2
+
+
+def test_cv_document_shared_cache(client, seed_data, monkeypatch):
+    """Built CVs come from the shared cache, also for a worker with an empty local copy."""
+    import pytest
+    from backend.services import cv_cache
+    from backend.services.cache_service import invalidate_entities_cache
+    from backend.routes.cv import build_cv_from_models
+
+    cv = build_cv_from_models("en")
+    assert build_cv_from_models("en") is cv  # Worker copy
+
+    cv_cache.invalidate_local_cv_cache()  # Another worker: only the shared entry is left
+    monkeypatch.setattr(cv_cache, "set_cached_cv", lambda *a, **k: pytest.fail("CV rebuilt"))
+    assert build_cv_from_models("en") == cv
+    monkeypatch.undo()
+
+    # Projects are not in the CV; skills are
+    version = cv_cache.get_cv_version()
+    invalidate_entities_cache("project")
+    assert cv_cache.get_cv_version() == version
+    invalidate_entities_cache("skill")
+    assert cv_cache.get_cv_version() != version
+    assert cv_cache.get_cached_cv("en") is None
+
+
+def test_cv_cache_save_during_build(app):
+    """A document built while a save lands is filed under the version it was built from."""
+    from backend.services import cv_cache
+    from backend.services.cache_service import invalidate_entities_cache
+
+    @cv_cache.cv_cache(profile_slug="race")
+    def build(lang):
+        invalidate_entities_cache("skill")  # An admin save while reading the database
+        return {"basics": {"name": "Old data"}}
+
+    build("en")
+    assert cv_cache.get_cached_cv("en", "race") is None
 
 
 def test_cv_cache_invalidation(app):
@@ -119,3 +210,596 @@ def test_check_cache_health(app):
     with app.app_context():
         result = check_cache_health()
         assert result is True
+
+
+def test_read_model_serves_misses_without_db(client, seed_data):
+    """Once built, the read model answers cache misses with zero queries."""
+    from sqlalchemy import event
+    from backend import db
+
+    client.get("/api/projects?lang=en")  # Builds the snapshot and the "en" view
+
+    statements = []
+
+    def count(conn, cursor, statement, *args):
+        statements.append(statement)
+
+    event.listen(db.engine, "before_cursor_execute", count)
+    try:
+        for path in ("/api/projects?lang=en", "/api/experience?lang=en",
+                     "/api/skills?lang=en", "/api/profile?lang=en"):
+            assert client.get(path).status_code == 200
+    finally:
+        event.remove(db.engine, "before_cursor_execute", count)
+
+    assert statements == []
+
+
+def test_read_model_rebuilt_on_invalidation(client, seed_data):
+    """invalidate_entities_cache() swaps in a fresh snapshot."""
+    from backend import db
+    from backend.services.read_model import get_read_model
+    from backend.services.cache_service import invalidate_entities_cache
+
+    before = get_read_model()
+    seed_data["project"].category = "work"
+    db.session.commit()
+
+    # Still the old snapshot until invalidated
+    assert get_read_model() is before
+
+    invalidate_entities_cache()
+    after = get_read_model()
+    assert after is not before
+    assert after.view("en").projects[0]["category"] == "work"
+
+
+def test_read_model_unknown_lang_falls_back(app, seed_data):
+    """Unknown languages use the TRANSLATION_FALLBACKS chain (es first)."""
+    from backend.services.read_model import get_read_model
+
+    view = get_read_model().view("fr")
+    assert view.projects[0]["title"] == "Proyecto Test"
+    assert view.skills[0]["category"] == "Lenguajes"
+
+
+def test_read_model_loads_only_language_chain(app, seed_data):
+    """A view loads its language plus the fallbacks, never other translations."""
+    from sqlalchemy import event
+    from backend import db
+    from backend.models.project import ProjectTranslation
+    from backend.services.read_model import get_read_model
+
+    seed_data["project"].translations.append(
+        ProjectTranslation(lang="fr", title="Projet Test", summary="Résumé")
+    )
+    db.session.commit()
+
+    params = []
+
+    def capture(conn, cursor, statement, parameters, *args):
+        if "FROM project_translations" in statement:
+            params.extend(parameters)
+
+    event.listen(db.engine, "before_cursor_execute", capture)
+    try:
+        view = get_read_model().view("en")
+    finally:
+        event.remove(db.engine, "before_cursor_execute", capture)
+
+    assert "en" in params and "fr" not in params
+    assert view.projects[0]["title"] == "Test Project"
+    assert get_read_model().view("fr").projects[0]["title"] == "Projet Test"
+
+
+def test_read_model_core_loader_matches_orm(app, seed_data, monkeypatch):
+    """The Core loader builds exactly the views the ORM loader does."""
+    from datetime import datetime
+    from backend import db
+    from backend.models.project import Project, ProjectTranslation, ProjectImage
+    from backend.models.project_url import ProjectURL
+    from backend.models.skill import Skill, SkillTranslation
+    from backend.models.tag import Tag
+    from backend.services import read_model
+
+    # A Spanish-only project with several images, urls and tags, and a skill without a category
+    extra = Project(slug="solo-es", category="work", created_at=datetime(2020, 1, 1))
+    extra.translations.append(ProjectTranslation(lang="es", title="Solo", content={"k": [1, 2]}))
+    for order, url_type in ((2, "demo"), (0, "github"), (1, "docs")):
+        extra.images.append(ProjectImage(url=f"https://example.com/{order}.gif", type="gif", order=order))
+        extra.urls.append(ProjectURL(url_type=url_type, url=f"https://example.com/{order}", order=order))
+    extra.tags.extend([seed_data["project"].tags[0], Tag(name="SQL", slug="sql")])
+    skill = Skill(slug="git", order=5)
+    skill.translations.append(SkillTranslation(lang="en", name="Git"))
+    db.session.add_all([extra, skill])
+    db.session.commit()
+
+    def views(loader):
+        monkeypatch.setattr(read_model, "READ_MODEL_LOADER", loader)
+        built = [read_model.build_view(lang) for lang in ("en", "es", "fr", None)]
+        return [
+            app.json.dumps({
+                "sections": [v.projects, v.experience, v.education, v.skills, v.certifications, v.profile],
+                "by_slug": dict(v.projects_by_slug),
+                "last_modified": dict(v.last_modified),
+                "project_modified": dict(v.project_modified),
+                "tag_facets": v.tag_facets,
+            })
+            for v in built
+        ]
+
+    assert views("core") == views("orm")
+
+
+def test_cache_response_single_flight(app):
+    """Concurrent misses for one key run the view only once."""
+    import threading
+    import time
+    from flask import jsonify
+    from backend.services.cache_service import cache_response
+
+    calls = []
+    release = threading.Event()
+
+    @cache_response(timeout=60, key_func=lambda: "test:single-flight")
+    def slow_view():
+        calls.append(1)
+        release.wait(5)
+        return jsonify({"ok": True})
+
+    statuses = []
+
+    def request_it():
+        with app.test_request_context("/api/single-flight"):
+            response = slow_view()
+            statuses.append((response.status_code, response.headers["X-Cache"]))
+
+    threads = [threading.Thread(target=request_it) for _ in range(5)]
+    for t in threads:
+        t.start()
+    time.sleep(0.2)  # Let followers queue up behind the leader
+    release.set()
+    for t in threads:
+        t.join(5)
+
+    assert len(calls) == 1
+    assert sorted(statuses) == [(200, "COALESCED")] * 4 + [(200, "MISS")]
+
+
+def test_cache_response_uncacheable_not_shared(app):
+    """Server errors are returned as-is and never cached."""
+    from flask import jsonify
+    from backend.services.cache_service import cache_response, _versioned_lookup
+
+    @cache_response(timeout=60, key_func=lambda: "test:error")
+    def failing_view():
+        return jsonify({"error": True}), 503
+
+    with app.test_request_context("/api/error"):
+        assert failing_view().status_code == 503
+        assert _versioned_lookup("test:error", ())[1] is None
+
+
+def _age_cache_entry(key, seconds):
+    from backend.services.cache_service import cache, _versioned_lookup
+
+    key, entry = _versioned_lookup(key, ())
+    entry["created"] -= seconds
+    cache.set(key, entry)
+
+
+def test_cache_response_stale_while_revalidate(app):
+    """Past the soft TTL the stale body is served and refreshed in the background."""
+    import time
+    from flask import jsonify
+    from backend.services.cache_service import cache_response, _versioned_lookup
+
+    calls = []
+
+    @cache_response(timeout=3600, soft_timeout=60, key_func=lambda: "test:swr")
+    def view():
+        calls.append(1)
+        return jsonify({"version": len(calls)})
+
+    with app.test_request_context("/api/swr"):
+        assert view().headers["X-Cache"] == "MISS"
+        _age_cache_entry("test:swr", 120)
+
+        stale = view()
+        assert stale.headers["X-Cache"] == "STALE"
+        assert stale.get_json() == {"version": 1}
+
+    deadline = time.monotonic() + 5
+    while time.monotonic() < deadline and _versioned_lookup("test:swr", ())[1]["created"] < time.time() - 60:
+        time.sleep(0.02)
+
+    with app.test_request_context("/api/swr"):
+        fresh = view()
+        assert fresh.headers["X-Cache"] == "HIT"
+        assert fresh.get_json() == {"version": 2}
+    assert len(calls) == 2
+
+
+def test_cache_response_stale_if_error(app):
+    """A database OperationalError falls back to the last good body."""
+    from flask import jsonify
+    from sqlalchemy.exc import OperationalError
+    from backend.services.cache_service import cache_response
+
+    database_up = [True]
+
+    @cache_response(timeout=60, key_func=lambda: "test:stale-if-error")
+    def view():
+        if not database_up[0]:
+            raise OperationalError("SELECT 1", {}, Exception("database is asleep"))
+        return jsonify({"ok": True})
+
+    with app.test_request_context("/api/stale-if-error"):
+        view()
+        _age_cache_entry("test:stale-if-error", 120)
+        database_up[0] = False
+
+        response = view()
+        assert response.status_code == 200
+        assert response.headers["X-Cache"] == "STALE-IF-ERROR"
+        assert response.get_json() == {"ok": True}
+
+
+def test_generation_bump_invalidates_dependents(app):
+    """Bumping an entity type only misses responses that depend on it."""
+    from flask import jsonify
+    from backend.services.cache_service import cache_response, bump_generation
+
+    @cache_response(timeout=60, key_func=lambda: "test:skills", depends_on=("skill",))
+    def skills_view():
+        return jsonify([])
+
+    @cache_response(timeout=60, key_func=lambda: "test:projects", depends_on=("project",))
+    def projects_view():
+        return jsonify([])
+
+    with app.test_request_context("/api/generations"):
+        skills_view(), projects_view()
+        bump_generation("skill")
+        assert skills_view().headers["X-Cache"] == "MISS"
+        assert projects_view().headers["X-Cache"] == "HIT"
+
+        bump_generation()  # Global generation invalidates everything
+        assert skills_view().headers["X-Cache"] == "MISS"
+        assert projects_view().headers["X-Cache"] == "MISS"
+
+
+def test_unknown_entity_type_rejected(app):
+    import pytest
+    from backend.services.cache_service import bump_generation, cache_response
+
+    with pytest.raises(ValueError):
+        bump_generation("widget")
+    with pytest.raises(ValueError):
+        cache_response(depends_on=("widget",))
+
+
+def test_dependency_map(app):
+    """Entity types map to the API views and CV sections built from them."""
+    from backend.services.cache_service import get_dependents
+
+    skill = get_dependents("skill")
+    assert "get_skills" in skill["views"]
+    assert "get_projects" not in skill["views"]
+    assert "skills" in skill["cv_sections"]
+
+    project = get_dependents("project")
+    assert {"get_projects", "get_project"} <= set(project["views"])
+    assert project["cv_sections"] == []
+
+
+def test_scoped_invalidation(client, seed_data):
+    """Invalidating one entity type keeps unrelated responses and the CV cached."""
+    from backend.services.cache_service import invalidate_entities_cache
+    from backend.services.cv_cache import set_cached_cv, get_cached_cv
+
+    client.get("/api/projects?lang=en"), client.get("/api/skills?lang=en")
+    set_cached_cv("en", {"basics": {"name": "Test"}})
+
+    invalidate_entities_cache("project")
+    assert client.get("/api/projects?lang=en").headers["X-Cache"] == "MISS"
+    assert client.get("/api/skills?lang=en").headers["X-Cache"] == "HIT"
+    assert get_cached_cv("en") is not None
+
+    invalidate_entities_cache("skill")
+    assert client.get("/api/skills?lang=en").headers["X-Cache"] == "MISS"
+    assert client.get("/api/projects?lang=en").headers["X-Cache"] == "HIT"
+    assert get_cached_cv("en") is None
+
+
+def test_l1_serves_hits_without_backend(app, monkeypatch):
+    """Repeat hits come from the worker's L1 without touching the shared cache."""
+    from flask import jsonify
+    from backend.services import cache_service
+    from backend.services.cache_service import cache_response, get_cache_stats
+
+    @cache_response(timeout=60, key_func=lambda: "test:l1", depends_on=("skill",))
+    def view():
+        return jsonify({"ok": True})
+
+    with app.test_request_context("/api/l1"):
+        assert view().headers["X-Cache"] == "MISS"
+        before = get_cache_stats()
+
+        def unreachable(key):
+            raise AssertionError("L2 should not be read on an L1 hit")
+
+        monkeypatch.setattr(cache_service.cache, "get", unreachable)
+        assert view().headers["X-Cache"] == "HIT"
+        monkeypatch.undo()
+
+        assert get_cache_stats()["l1_hits"] == before["l1_hits"] + 1
+
+        cache_service.clear_local_cache()  # Next hit falls through to L2
+        assert view().headers["X-Cache"] == "HIT"
+        assert get_cache_stats()["l2_hits"] == before["l2_hits"] + 1
+
+
+def test_l1_lru_bounded_by_bytes(app):
+    """The L1 evicts least recently used entries and drops invalidated ones."""
+    import time
+    from backend.services.cache_service import _LocalLRU
+
+    def entry(size):
+        return {"body": b"x" * size, "gzip": None, "br": None, "created": time.time()}
+
+    lru = _LocalLRU(max_bytes=250)
+    lru.set("a", entry(100), ("skill",), 60)
+    lru.set("b", entry(100), ("project",), 60)
+    lru.get("a")
+    lru.set("c", entry(100), ("project",), 60)
+    assert lru.get("b") is None  # Least recently used
+    assert lru.get("a") is not None and lru.size == 200
+
+    lru.drop({"skill"})
+    assert lru.get("a") is None and lru.get("c") is not None
+
+    lru.set("big", entry(300), (), 60)  # Larger than the whole cache
+    assert lru.get("big") is None
+
+
+def test_invalidation_from_another_worker(client, seed_data):
+    """Without Redis, bumps made by another worker reach this one through the shared file."""
+    import pytest
+    from backend import db
+    from backend.services import cache_service
+    from backend.services.cv_cache import set_cached_cv, get_cached_cv
+
+    if cache_service._generation_file is None:
+        pytest.skip("Shared generation file needs fcntl")
+
+    # A second mapping of the same file stands in for the other worker
+    other_worker = cache_service._GenerationFile(
+        cache_service.GEN_FILE, cache_service._generation_file.names
+    )
+
+    assert client.get("/api/skills?lang=en").get_json()[0]["name"] == "Python"
+    client.get("/api/projects?lang=en")
+    set_cached_cv("en", {"basics": {"name": "Test"}})
+
+    # The other worker saves the skill and bumps its generation
+    seed_data["skill"].translations[1].name = "Python 3"
+    db.session.commit()
+    other_worker.bump(("skill",))
+
+    response = client.get("/api/skills?lang=en")
+    assert response.headers["X-Cache"] == "MISS"
+    assert response.get_json()[0]["name"] == "Python 3"  # Read model rebuilt too
+    assert client.get("/api/projects?lang=en").headers["X-Cache"] == "HIT"
+    assert get_cached_cv("en") is None
+
+
+def test_warmup_after_another_workers_save(app, monkeypatch):
+    """Without Redis, a worker warms itself for the types other workers bumped, not its own."""
+    import pytest
+    from backend.services import cache_service, warmup
+
+    if cache_service._generation_file is None:
+        pytest.skip("Shared generation file needs fcntl")
+
+    other_worker = cache_service._GenerationFile(
+        cache_service.GEN_FILE, cache_service._generation_file.names
+    )
+    cache_service._other_workers_bumps()  # Baseline
+
+    other_worker.bump(("skill", "tag"))
+    cache_service.bump_generation("project")  # This worker's own save
+    assert cache_service._other_workers_bumps() == {"skill", "tag"}
+    assert cache_service._other_workers_bumps() == set()
+    other_worker.bump((cache_service.GLOBAL_GENERATION,))
+    assert cache_service._other_workers_bumps() == {cache_service.GLOBAL_GENERATION}
+
+    # The watcher hands the types to a scoped warm-up of this worker
+    scheduled = []
+    monkeypatch.setattr(warmup, "WARMUP_ENABLED", True)
+    monkeypatch.setattr(cache_service, "watch_generation_file", lambda on_bump: on_bump(("skill",)) or True)
+    monkeypatch.setattr(warmup, "schedule_warmup", lambda app, types, reason: scheduled.append((types, reason)))
+    assert warmup.watch_other_workers(app)
+    assert scheduled == [(("skill",), "other worker")]
+
+
+def test_warmup_fills_api_caches(client, seed_data, monkeypatch):
+    """A warm-up run leaves every endpoint x language variant cached and reports timings."""
+    import io
+    from backend.services import pdf_service
+    from backend.services.warmup import run_warmup, warmup_targets, get_last_warmup_report
+
+    class FakePDFService:
+        def generate_cv_pdf(self, cv_data, lang="es"):
+            return io.BytesIO(b"%PDF-1.7")
+
+    monkeypatch.setattr(pdf_service, "PDFService", FakePDFService)
+
+    app = client.application
+    with app.app_context():
+        targets = warmup_targets(app)
+    assert "/api/projects?lang=en&category=project" in targets
+    assert "/api/projects/test-project?lang=es" in targets
+    assert "/api/profile?lang=en" in targets
+    assert "/api/tags/python?lang=en" in targets
+
+    report = run_warmup(app, reason="test")
+    assert report["failed"] == 0
+    assert report["targets"] == len(targets) + 4  # Plus every CV PDF variant
+    assert get_last_warmup_report() is report
+    assert set(report["pdf_variants"]) == {"es/public", "en/public", "es/private", "en/private"}
+    assert {v["status"] for v in report["pdf_variants"].values()} == {"MISS"}
+    assert client.get("/cv/pdf?lang=en&private=1").data == b"%PDF-1.7"  # Served from the store
+
+    for url in targets:
+        assert client.get(url).headers["X-Cache"] == "HIT", url
+
+    # Scoped runs only touch dependent views and skip the CV when unaffected
+    project_views = [t for t in targets if t.startswith(("/api/projects", "/api/bundle", "/api/tags"))]
+    assert run_warmup(app, ("project",))["targets"] == len(project_views)
+
+
+# --- Serializers ---
+
+def test_compiled_serializer(app):
+    from datetime import datetime
+    from backend.services.serializers import compile_serializer, iso
+
+    class Row:
+        pass
+
+    row = Row()
+    row.id, row.url_type, row.created_at = 7, "github", datetime(2024, 5, 1, 12, 30)
+    serialize = compile_serializer("id", ("type", "url_type"), ("created_at", "created_at", iso))
+    assert serialize(row) == {"id": 7, "type": "github", "created_at": "2024-05-01T12:30:00"}
+
+
+def test_serializer_loads_deferred_columns(app, seed_data):
+    """Columns missing from the instance dict fall back to attribute access."""
+    from sqlalchemy.orm import defer
+    from backend.models.project import ProjectTranslation
+    from backend.services.serializers import serialize_project_text, serialize_admin
+
+    with app.app_context():
+        trans = ProjectTranslation.query.options(defer(ProjectTranslation.description)).filter_by(lang="en").one()
+        assert "description" not in trans.__dict__
+        assert serialize_project_text(trans)["description"] == "<p>Description</p>"
+
+        admin_row = serialize_admin(trans.project)
+        assert admin_row["slug"] == "test-project"
+        assert isinstance(admin_row["created_at"], str)
+        assert {t["lang"] for t in admin_row["translations"]} == {"es", "en"}
+        assert admin_row["tags"] == [{"id": admin_row["tags"][0]["id"], "name": "Python", "slug": "python"}]
+
+
+def _fake_renderer():
+    """Pool renderer without WeasyPrint: echoes the HTML, fails or exits on request."""
+    import os
+
+    def render(html_string, inline_css=False):
+        if html_string == "fail":
+            raise ValueError("bad page")
+        if html_string == "exit":
+            os._exit(1)
+        return f"%PDF {html_string} {inline_css}".encode()
+
+    return render
+
+
+def test_renderer_pool():
+    """Pool processes render over their pipe and are replaced when they die."""
+    import pytest
+    from backend.services.pdf_pool import RendererPool, PDFRenderError
+
+    pool = RendererPool(1, renderer_factory=_fake_renderer, timeout=30)
+    try:
+        pool.wait_ready()
+        assert pool.render("<p>cv</p>") == b"%PDF <p>cv</p> False"
+        assert pool.render("<p>cv</p>", inline_css=True) == b"%PDF <p>cv</p> True"
+
+        # A failing page leaves the process in place; a crash replaces it
+        with pytest.raises(PDFRenderError, match="bad page"):
+            pool.render("fail")
+        assert pool.stats()["restarts"] == 0
+        with pytest.raises(PDFRenderError, match="died"):
+            pool.render("exit")
+        assert pool.render("again") == b"%PDF again False"
+        assert pool.stats() == {"processes": 1, "idle": 1, "renders": 3, "restarts": 1}
+    finally:
+        pool.close()
+
+
+def test_renderer_pool_busy_and_failed_restart(monkeypatch):
+    """No free process raises instead of blocking; a slot whose restart fails is kept."""
+    import pytest
+    from backend.services import pdf_pool
+    from backend.services.pdf_pool import RendererPool, PDFRenderError
+
+    pool = RendererPool(1, renderer_factory=_fake_renderer, timeout=30)
+    try:
+        pool.wait_ready()
+        busy = pool._idle.get()
+        pool.timeout = 0.1
+        with pytest.raises(PDFRenderError, match="No renderer process free"):
+            pool.render("<p>cv</p>")
+        pool._idle.put(busy)
+        pool.timeout = 30
+
+        # The replacement cannot start: the slot stays and is filled on the next render
+        start = pdf_pool._Worker
+        monkeypatch.setattr(pdf_pool, "_Worker", lambda *args: (_ for _ in ()).throw(OSError("spawn failed")))
+        with pytest.raises(PDFRenderError, match="died"):
+            pool.render("exit")
+        with pytest.raises(PDFRenderError, match="could be started"):
+            pool.render("<p>cv</p>")
+        monkeypatch.setattr(pdf_pool, "_Worker", start)
+        assert pool.render("<p>cv</p>") == b"%PDF <p>cv</p> False"
+        assert pool.stats()["idle"] == 1
+    finally:
+        pool.close()
+
+
+def test_search_index_sync_is_copy_on_write():
+    """Syncing never touches an index other threads are searching."""
+    import threading
+    from backend.services.search_index import SearchIndex
+
+    def documents(version, n=200):
+        return {
+            ("project", f"p{i}"): (
+                {"type": "project", "slug": f"p{i}", "title": f"Project {i}"},
+                {"title": f"Project {i}", "summary": f"pipeline data v{version} item{i % 7}"},
+            )
+            for i in range(n) if (i + version) % 3
+        }
+
+    original = SearchIndex("en")
+    original.sync(documents(0))
+    before = original.search("pipeline")
+    current = [original]
+    errors = []
+    done = threading.Event()
+
+    def reader():
+        while not done.is_set():
+            try:
+                current[0].search("pipe")
+                current[0].search("data item3")
+            except Exception as e:  # noqa: BLE001 - any error fails the test
+                errors.append(e)
+                return
+
+    readers = [threading.Thread(target=reader) for _ in range(4)]
+    for thread in readers:
+        thread.start()
+    for version in range(1, 40):
+        current[0], changes = current[0].synced(documents(version))
+        assert changes["added"] and changes["removed"]
+    done.set()
+    for thread in readers:
+        thread.join()
+
+    assert errors == []
+    assert original.search("pipeline") == before  # The original was never written
+    assert current[0].search("v39")[0] == len(documents(39))
+    assert current[0].synced(documents(39))[0] is current[0]  # No changes, no copy
@@ -0,0 +1,101 @@
+"""
+JSON Provider
+
+Flask JSON provider backed by orjson, which encodes the API payloads
+several times faster than the stdlib ``json`` module. Output is what
+Flask's default provider produces (sorted keys, RFC 822 dates, Decimal and
+UUID as strings), except that non-ASCII text is written as UTF-8 rather
+than ``\\uXXXX`` escapes. Bytes are encoded as base64 strings.
+
+Falls back to Flask's stdlib implementation when orjson is not installed,
+or for ``dumps`` arguments orjson cannot honour (a custom ``cls``, an
+indent other than 2, ...).
+"""
+
+import base64
+import dataclasses
+import decimal
+import uuid
+from datetime import date, time
+
+from flask.json.provider import DefaultJSONProvider
+from werkzeug.http import http_date
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional dependency
+    orjson = None
+
+# dumps() arguments orjson can reproduce; anything else goes to the stdlib
+_ORJSON_KWARGS = {"default", "ensure_ascii", "sort_keys", "indent", "separators"}
+_COMPACT_SEPARATORS = (None, (",", ":"))
+
+
+def _default(o):
+    """Types neither encoder handles natively, encoded as Flask's provider does (plus bytes)."""
+    if isinstance(o, date):
+        return http_date(o)
+    if isinstance(o, time):
+        return o.isoformat()
+    if isinstance(o, (decimal.Decimal, uuid.UUID)):
+        return str(o)
+    if isinstance(o, (bytes, bytearray, memoryview)):
+        return base64.b64encode(o).decode("ascii")
+    if dataclasses.is_dataclass(o) and not isinstance(o, type):
+        return dataclasses.asdict(o)
+    if hasattr(o, "__html__"):
+        return str(o.__html__())
+    raise TypeError(f"Object of type {type(o).__name__} is not JSON serializable")
+
+
+class FastJSONProvider(DefaultJSONProvider):
+    """``DefaultJSONProvider`` that encodes and decodes with orjson when available."""
+
+    default = staticmethod(_default)
+
+    def _orjson_option(self, sort_keys, indent):
+        # Dates are passed to ``default`` so they keep Flask's RFC 822 format
+        option = orjson.OPT_PASSTHROUGH_DATETIME | orjson.OPT_NON_STR_KEYS
+        if sort_keys:
+            option |= orjson.OPT_SORT_KEYS
+        if indent:
+            option |= orjson.OPT_INDENT_2
+        return option
+
+    def _can_use_orjson(self, kwargs):
+        return (
+            orjson is not None
+            and kwargs.keys() <= _ORJSON_KWARGS
+            and kwargs.get("indent") in (None, 2)
+            and kwargs.get("separators") in _COMPACT_SEPARATORS
+        )
+
+    def dumps_bytes(self, obj, **kwargs):
+        """Serialize ``obj`` to UTF-8 JSON bytes (``dumps`` without the str round trip)."""
+        if not self._can_use_orjson(kwargs):
+            return self.dumps(obj, **kwargs).encode()
+        return orjson.dumps(
+            obj,
+            default=kwargs.get("default", self.default),
+            option=self._orjson_option(kwargs.get("sort_keys", self.sort_keys), kwargs.get("indent")),
+        )
+
+    def dumps(self, obj, **kwargs):
+        if not self._can_use_orjson(kwargs):
+            return super().dumps(obj, **kwargs)
+        return self.dumps_bytes(obj, **kwargs).decode()
+
+    def loads(self, s, **kwargs):
+        if orjson is None or kwargs:
+            return super().loads(s, **kwargs)
+        return orjson.loads(s)
+
+    def response(self, *args, **kwargs):
+        if orjson is None:
+            return super().response(*args, **kwargs)
+
+        obj = self._prepare_response_obj(args, kwargs)
+        indent = 2 if (self.compact is None and self._app.debug) or self.compact is False else None
+        return self._app.response_class(
+            self.dumps_bytes(obj, indent=indent) + b"\n", mimetype=self.mimetype
+        )
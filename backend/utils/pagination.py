@@ -0,0 +1,141 @@
+"""
+Keyset Pagination Utilities
+
+Pages are addressed by an opaque cursor holding the sort key of the last
+item served, e.g. ``(created_at, id)``. The next page starts right after
+that key, so it costs the same no matter how deep it is and does not shift
+when items are added in front of it.
+"""
+
+import json
+import base64
+import binascii
+from datetime import date, datetime
+from bisect import bisect_left
+
+from sqlalchemy import Date, DateTime, and_, or_
+
+DEFAULT_PAGE_SIZE = 20
+MAX_PAGE_SIZE = 100
+
+
+class PaginationError(ValueError):
+    """Invalid ``limit`` or ``cursor`` query parameter."""
+
+
+def encode_cursor(key):
+    """Opaque, URL-safe cursor for a sort key tuple."""
+    values = [v.isoformat() if isinstance(v, date) else v for v in key]
+    raw = json.dumps(values, separators=(",", ":")).encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def _valid_sort_value(value):
+    """An ISO timestamp (or "" for none), an int, or None."""
+    if value is None or (isinstance(value, int) and not isinstance(value, bool)):
+        return True
+    if not isinstance(value, str):
+        return False
+    try:
+        return value == "" or bool(datetime.fromisoformat(value))
+    except ValueError:
+        return False
+
+
+def decode_cursor(cursor):
+    """Sort key list from ``encode_cursor``; raises PaginationError if malformed."""
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        values = json.loads(raw)
+    except (binascii.Error, ValueError):
+        raise PaginationError("Invalid cursor")
+    if not isinstance(values, list) or len(values) != 2:
+        raise PaginationError("Invalid cursor")
+    value, last_id = values
+    if not _valid_sort_value(value) or not isinstance(last_id, int) or isinstance(last_id, bool):
+        raise PaginationError("Invalid cursor")
+    return values
+
+
+def parse_page_args(args):
+    """
+    ``(limit, after)`` from request args. Both are None when the request
+    does not ask for a page; ``limit`` defaults to DEFAULT_PAGE_SIZE when
+    only a cursor is given.
+    """
+    limit = args.get("limit")
+    cursor = args.get("cursor")
+    if limit is None and not cursor:
+        return None, None
+
+    if limit is None:
+        limit = DEFAULT_PAGE_SIZE
+    else:
+        try:
+            limit = int(limit)
+        except ValueError:
+            raise PaginationError("limit must be an integer")
+        if not 1 <= limit <= MAX_PAGE_SIZE:
+            raise PaginationError(f"limit must be between 1 and {MAX_PAGE_SIZE}")
+
+    return limit, decode_cursor(cursor) if cursor else None
+
+
+def paginate_sequence(items, limit, after, key):
+    """
+    Page of ``items`` (sorted by ``key``, descending) following the key
+    ``after``. Returns ``(page, next_cursor)``; the start is found by
+    bisection, so deep pages cost the same as the first. Raises
+    PaginationError if ``after`` does not compare with the keys.
+    """
+    start = 0
+    if after is not None:
+        after = tuple(after)
+        try:
+            start = bisect_left(range(len(items)), True, key=lambda i: key(items[i]) < after)
+        except TypeError:
+            raise PaginationError("Invalid cursor")
+
+    page = list(items[start:start + limit])
+    has_more = start + limit < len(items)
+    return page, encode_cursor(key(page[-1])) if page and has_more else None
+
+
+def paginate_query(query, column, id_column, limit, after, descending=True):
+    """
+    Run ``query`` ordered by ``(column, id_column)`` from the key ``after``.
+    Rows whose ``column`` is NULL come last in either direction. Fetches one
+    extra row to know whether a next page exists. Returns
+    ``(rows, next_cursor)``.
+    """
+    if after is not None:
+        value, last_id = after
+        if isinstance(column.type, (Date, DateTime)):
+            parse = datetime.fromisoformat if isinstance(column.type, DateTime) else date.fromisoformat
+            if isinstance(value, str):
+                try:
+                    value = parse(value)
+                except ValueError:
+                    raise PaginationError("Invalid cursor")
+            elif value is not None:
+                raise PaginationError("Invalid cursor")
+        elif isinstance(value, str):
+            raise PaginationError("Invalid cursor")  # Integer sort columns (``order``)
+        after_id = id_column < last_id if descending else id_column > last_id
+        if value is None:
+            query = query.filter(column.is_(None), after_id)
+        else:
+            after_value = column < value if descending else column > value
+            query = query.filter(or_(after_value, and_(column == value, after_id), column.is_(None)))
+
+    if descending:
+        query = query.order_by(column.desc().nulls_last(), id_column.desc())
+    else:
+        query = query.order_by(column.asc().nulls_last(), id_column.asc())
+
+    rows = query.limit(limit + 1).all()
+    if len(rows) <= limit:
+        return rows, None
+    rows = rows[:limit]
+    last = rows[-1]
+    return rows, encode_cursor((getattr(last, column.key), getattr(last, id_column.key)))
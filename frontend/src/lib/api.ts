@@ -31,28 +31,53 @@ const EMPTY_PROFILE: Profile = {
   tagline: '',
 };
 
-export function fetchProfile(lang?: string) {
-  return fetchJSON<Profile>('/profile', lang, EMPTY_PROFILE);
+interface Bundle {
+  lang?: string;
+  profile?: Profile | null;
+  experience?: Experience[];
+  skills?: Skill[];
+  education?: Education[];
+  certifications?: Certification[];
+  projects?: Project[];
 }
 
-export function fetchExperience(lang?: string) {
-  return fetchJSON<Experience[]>('/experience', lang, []);
+// One /bundle request per language for the whole build, shared by every page
+const bundles = new Map<string, Promise<Bundle>>();
+
+export function fetchBundle(lang: string = 'es'): Promise<Bundle> {
+  let bundle = bundles.get(lang);
+  if (!bundle) {
+    bundle = fetchJSON<Bundle>('/bundle', lang, {}).then((data) => {
+      if (!data.lang) bundles.delete(lang); // Failed: let the next caller retry
+      return data;
+    });
+    bundles.set(lang, bundle);
+  }
+  return bundle;
+}
+
+export async function fetchProfile(lang?: string) {
+  return (await fetchBundle(lang)).profile ?? EMPTY_PROFILE;
+}
+
+export async function fetchExperience(lang?: string) {
+  return (await fetchBundle(lang)).experience ?? [];
 }
 
-export function fetchSkills(lang?: string) {
-  return fetchJSON<Skill[]>('/skills', lang, []);
+export async function fetchSkills(lang?: string) {
+  return (await fetchBundle(lang)).skills ?? [];
 }
 
-export function fetchEducation(lang?: string) {
-  return fetchJSON<Education[]>('/education', lang, []);
+export async function fetchEducation(lang?: string) {
+  return (await fetchBundle(lang)).education ?? [];
 }
 
-export function fetchCertifications(lang?: string) {
-  return fetchJSON<Certification[]>('/certifications', lang, []);
+export async function fetchCertifications(lang?: string) {
+  return (await fetchBundle(lang)).certifications ?? [];
 }
 
-export function fetchProjects(lang?: string) {
-  return fetchJSON<Project[]>('/projects', lang, []);
+export async function fetchProjects(lang?: string) {
+  return (await fetchBundle(lang)).projects ?? [];
 }
 
 /** Group skills by category name */
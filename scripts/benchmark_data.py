@@ -0,0 +1,133 @@
+"""
+Shared helpers for the benchmark scripts.
+
+Creates a throwaway SQLite database, boots the Flask app against it with
+rate limiting disabled and seeds a synthetic portfolio of configurable size.
+
+Usage (from another script):
+    from benchmark_data import setup_app, seed_synthetic_portfolio
+"""
+import os
+import random
+import sys
+import tempfile
+
+# Add parent directory to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+
+def setup_app():
+    """Point the app at a fresh SQLite file and return (app, db)."""
+    db_path = os.path.join(tempfile.mkdtemp(prefix="portfolio-bench-"), "bench.db")
+    os.environ["DATABASE_URL"] = f"sqlite:///{db_path}"
+    os.environ.pop("REDIS_URL", None)
+    os.environ.pop("PDF_SERVICE_URL", None)
+
+    import logging
+    from backend.app import app, limiter
+    from backend import db
+
+    limiter.enabled = False
+    logging.getLogger().setLevel(logging.WARNING)
+
+    with app.app_context():
+        db.create_all()
+    return app, db
+
+
+def seed_synthetic_portfolio(db, projects=20, images=4, tags=5, langs=("es", "en"),
+                             experiences=8, skills=30, certifications=6):
+    """Insert a synthetic portfolio. Must run inside an app context."""
+    from datetime import date, datetime, timedelta
+    from backend.models.profile import Profile, ProfileTranslation
+    from backend.models.project import Project, ProjectTranslation, ProjectImage
+    from backend.models.project_url import ProjectURL
+    from backend.models.experience import Experience, ExperienceTranslation
+    from backend.models.education import Education, EducationTranslation, Course
+    from backend.models.skill import Skill, SkillTranslation, SkillCategory, SkillCategoryTranslation
+    from backend.models.certification import Certification, CertificationTranslation
+    from backend.models.tag import Tag
+
+    rng = random.Random(42)
+    words = ("data pipeline lakehouse streaming warehouse latency cost model dashboard "
+             "quality schema partition batch realtime cluster query index migration "
+             "python spark kafka airflow dbt snowflake clickhouse fabric azure").split()
+
+    def text(n_words=90):
+        # Varied prose so compression ratios resemble real content
+        return " ".join(rng.choice(words) for _ in range(n_words)).capitalize() + "."
+
+    profile = Profile(slug="bench-profile", name="Bench User", email="bench@example.com",
+                      location={"city": "Madrid", "country": "Spain", "phone": "+34 600"},
+                      social_links={"github": "https://github.com/bench",
+                                    "linkedin": "https://linkedin.com/in/bench"})
+    for lang in langs:
+        profile.translations.append(ProfileTranslation(
+            lang=lang, role=f"Data Engineer ({lang})", tagline="Pipelines", bio=text()))
+    db.session.add(profile)
+
+    tag_pool = [Tag(name=f"Tag {i}", slug=f"tag-{i}") for i in range(max(tags * 4, 1))]
+    db.session.add_all(tag_pool)
+
+    base = datetime(2024, 1, 1)
+    for i in range(projects):
+        p = Project(slug=f"project-{i}", category=("project", "work", "study")[i % 3],
+                    is_featured_cv=i % 5 == 0, created_at=base + timedelta(hours=i))
+        for lang in langs:
+            p.translations.append(ProjectTranslation(
+                lang=lang, title=f"Project {i} ({lang})", subtitle="Subtitle",
+                summary=text(30), description=f"<p>{text()}</p>", cv_description=text(40),
+                content={"sections": [{"title": f"Section {n}", "body": text()}
+                                      for n in range(3)]}))
+        for n in range(images):
+            p.images.append(ProjectImage(
+                url=f"https://cdn.example.com/p{i}/{n}.png", type="gif" if n == 1 else "image",
+                order=n, thumbnail_url=f"https://cdn.example.com/p{i}/{n}_t.png",
+                alt_text=f"Screenshot {n}", width=1280, height=720, is_featured=n == 0))
+        p.urls.append(ProjectURL(url_type="github", url=f"https://github.com/bench/p{i}", order=0))
+        p.urls.append(ProjectURL(url_type="live", url=f"https://p{i}.example.com", order=1))
+        p.tags.extend(tag_pool[(i + k) % len(tag_pool)] for k in range(tags))
+        db.session.add(p)
+
+    for i in range(experiences):
+        e = Experience(slug=f"exp-{i}", company=f"Company {i}", location="Remote",
+                       start_date=date(2015 + i % 10, 1 + i % 12, 1), current=i == 0)
+        for lang in langs:
+            e.translations.append(ExperienceTranslation(
+                lang=lang, title=f"Company {i}", subtitle="Data Engineer",
+                description="\n".join([text(25)] + [f"- {text(20)}" for _ in range(4)])))
+        e.tags.extend(tag_pool[(i + k) % len(tag_pool)] for k in range(3))
+        db.session.add(e)
+
+    edu = Education(slug="bench-edu", institution="Bench University", location="Madrid",
+                    start_date=date(2010, 9, 1), end_date=date(2014, 6, 1))
+    for lang in langs:
+        edu.translations.append(EducationTranslation(lang=lang, title="Degree", subtitle="CS"))
+    edu.courses.extend(Course(name=f"Course {n}", order=n) for n in range(6))
+    db.session.add(edu)
+
+    categories = []
+    for n, slug in enumerate(("languages", "data", "cloud", "spoken-languages")):
+        cat = SkillCategory(slug=slug, order=n)
+        for lang in langs:
+            cat.translations.append(SkillCategoryTranslation(lang=lang, name=f"{slug} ({lang})"))
+        categories.append(cat)
+    db.session.add_all(categories)
+    db.session.flush()
+
+    for i in range(skills):
+        s = Skill(slug=f"skill-{i}", proficiency=50 + i % 50, order=i,
+                  category_id=categories[i % len(categories)].id, icon_url=f"/svg/{i}.svg")
+        for lang in langs:
+            s.translations.append(SkillTranslation(lang=lang, name=f"Skill {i}", description="Fluent"))
+        db.session.add(s)
+
+    for i in range(certifications):
+        c = Certification(slug=f"cert-{i}", issuer="Issuer", issue_date=date(2020, 1 + i % 12, 1),
+                          credential_url=f"https://example.com/cert/{i}")
+        for lang in langs:
+            c.translations.append(CertificationTranslation(lang=lang, title=f"Cert {i}",
+                                                           description="Description"))
+        db.session.add(c)
+
+    db.session.commit()
@@ -0,0 +1,71 @@
+"""
+JSON encoding benchmark for the heaviest payloads.
+
+Encodes the ``/api/projects`` list, the full ``/api/bundle`` and the
+``/admin/backup`` export with Flask's default (stdlib ``json``) provider and
+with ``FastJSONProvider`` (orjson), using the arguments each endpoint
+uses, and reports the best time and output size.
+
+Usage:
+    python scripts/benchmark_json.py [projects] [repeats]
+"""
+import sys
+import time
+
+from benchmark_data import setup_app, seed_synthetic_portfolio
+
+
+def best_ms(encode, payload, repeats):
+    best, size = float("inf"), 0
+    for _ in range(repeats):
+        started = time.perf_counter()
+        size = len(encode(payload))
+        best = min(best, time.perf_counter() - started)
+    return best * 1000, size
+
+
+def main(projects=200, repeats=20):
+    from flask.json.provider import DefaultJSONProvider
+    from sqlalchemy.orm import selectinload
+    from backend.models.project import Project
+    from backend.services.read_model import build_view
+    from backend.services.serializers import BACKUP_SERIALIZERS
+    from backend.utils.json_provider import FastJSONProvider, orjson
+
+    app, db = setup_app()
+    with app.app_context():
+        seed_synthetic_portfolio(db, projects=projects)
+        view = build_view("en")
+        bundle = {
+            "lang": "en", "profile": view.profile, "experience": list(view.experience),
+            "education": list(view.education), "skills": list(view.skills),
+            "certifications": list(view.certifications), "projects": list(view.projects),
+        }
+        backup = {"projects": [
+            BACKUP_SERIALIZERS["projects"](p) for p in Project.query.options(
+                selectinload(Project.translations), selectinload(Project.urls),
+                selectinload(Project.images), selectinload(Project.tags),
+            )
+        ]}
+
+    compact = {"separators": (",", ":")}
+    pretty = {"indent": 2, "sort_keys": False, "ensure_ascii": False}
+    payloads = {
+        "/api/projects": (list(view.projects), compact),
+        "/api/bundle": (bundle, compact),
+        "/admin/backup": (backup, pretty),
+    }
+    providers = {"stdlib json": DefaultJSONProvider(app), "orjson": FastJSONProvider(app)}
+    if orjson is None:
+        print("orjson is not installed; both rows use the stdlib encoder\n")
+
+    print(f"{projects} projects, best of {repeats}\n")
+    print(f"{'payload':<15} {'provider':<12} {'encode':>9} {'size':>10}")
+    for name, (payload, kwargs) in payloads.items():
+        for label, provider in providers.items():
+            ms, size = best_ms(lambda p: provider.dumps(p, **kwargs), payload, repeats)
+            print(f"{name:<15} {label:<12} {ms:7.2f}ms {size / 1024:8.1f}KB")
+
+
+if __name__ == "__main__":
+    main(*(int(arg) for arg in sys.argv[1:3]))
@@ -0,0 +1,85 @@
+"""
+Eager-loading benchmark for the project list query.
+
+Seeds a large synthetic portfolio and loads every project with its
+translations, images, tags and URLs, once per loading strategy. For each
+strategy it reports the number of SQL statements, the rows the database
+returned for them and the best wall time.
+
+joinedload puts every collection into one query, so each project comes
+back as translations x images x tags x urls rows. selectinload runs one
+extra query per collection, so the rows grow linearly with the data.
+
+Usage:
+    python scripts/benchmark_loading.py [projects] [images] [tags]
+"""
+import sys
+import time
+
+from benchmark_data import setup_app, seed_synthetic_portfolio
+
+REPEATS = 5
+
+
+def strategies():
+    from sqlalchemy.orm import joinedload, selectinload, subqueryload
+    from backend.models.project import Project
+
+    relationships = (Project.translations, Project.images, Project.tags, Project.urls)
+    return {
+        "joinedload": [joinedload(r) for r in relationships],
+        "subqueryload": [subqueryload(r) for r in relationships],
+        "selectinload": [selectinload(r) for r in relationships],
+    }
+
+
+def capture_statements(engine):
+    """Record every statement sent to the database, with its parameters."""
+    from sqlalchemy import event
+
+    statements = []
+
+    def before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        statements.append((statement, parameters))
+
+    event.listen(engine, "before_cursor_execute", before_cursor_execute)
+    return statements, lambda: event.remove(engine, "before_cursor_execute", before_cursor_execute)
+
+
+def count_rows(engine, statements):
+    """Re-run captured statements on a raw connection and count the rows they return."""
+    connection = engine.raw_connection()
+    try:
+        cursor = connection.cursor()
+        return sum(len(cursor.execute(sql, params).fetchall()) for sql, params in statements)
+    finally:
+        connection.close()
+
+
+def main(projects=300, images=12, tags=10):
+    from sqlalchemy import desc
+    from backend.models.project import Project
+
+    app, db = setup_app()
+    with app.app_context():
+        seed_synthetic_portfolio(db, projects=projects, images=images, tags=tags)
+
+        print(f"{projects} projects x 2 translations x {images} images x {tags} tags x 2 urls\n")
+        print(f"{'strategy':<14} {'statements':>10} {'rows':>10} {'best wall':>11}")
+        for name, options in strategies().items():
+            best = float("inf")
+            for _ in range(REPEATS):
+                db.session.expunge_all()
+                statements, stop = capture_statements(db.engine)
+                started = time.perf_counter()
+                loaded = Project.query.options(*options).order_by(desc(Project.created_at)).all()
+                best = min(best, time.perf_counter() - started)
+                stop()
+                assert len(loaded) == projects
+
+            rows = count_rows(db.engine, statements)
+            print(f"{name:<14} {len(statements):>10} {rows:>10} {best * 1000:>9.0f}ms")
+
+
+if __name__ == "__main__":
+    main(*(int(arg) for arg in sys.argv[1:4]))
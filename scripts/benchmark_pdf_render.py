@@ -0,0 +1,75 @@
+"""
+Local PDF rendering benchmark.
+
+Renders the ``en`` CV of a synthetic portfolio with WeasyPrint two ways,
+both through ``pdf_pool.create_weasyprint_renderer`` so each page gets the
+same stylesheet: cold in the calling thread (``cv.css`` and the fonts
+loaded from scratch for every render, as with ``PDF_RENDER_PROCESSES=0``)
+and through a warm renderer pool. Each mode runs the renders from
+``concurrency`` threads, as gunicorn's request threads would, and reports
+throughput and p50 / p95 latency.
+
+Needs WeasyPrint and its system libraries (Pango).
+
+Usage:
+    python scripts/benchmark_pdf_render.py [renders] [concurrency] [processes]
+"""
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from benchmark_data import setup_app, seed_synthetic_portfolio
+
+
+def percentile(samples, p):
+    samples = sorted(samples)
+    return samples[min(len(samples) - 1, int(len(samples) * p))]
+
+
+def run(render, renders, concurrency):
+    def timed(_):
+        started = time.perf_counter()
+        render()
+        return (time.perf_counter() - started) * 1000
+
+    started = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=concurrency) as executor:
+        latencies = list(executor.map(timed, range(renders)))
+    return renders / (time.perf_counter() - started), latencies
+
+
+def main(renders=20, concurrency=4, processes=2):
+    from backend.routes.cv import build_cv_from_models
+    from backend.services.pdf_service import PDFService
+    from backend.services.pdf_pool import RendererPool, create_weasyprint_renderer
+
+    app, db = setup_app()
+    with app.app_context():
+        seed_synthetic_portfolio(db, projects=20)
+        with app.test_request_context("/cv/pdf?lang=en"):
+            html_string, _ = PDFService()._prepare_html(build_cv_from_models("en"), "en")
+
+    def cold():
+        create_weasyprint_renderer()(html_string)
+
+    pool = RendererPool(processes)
+    setup_ms = pool.wait_ready()
+    try:
+        pool.render(html_string)  # First real page
+        modes = [("cold in-thread", cold), (f"warm pool ({processes} proc)", lambda: pool.render(html_string))]
+        print(f"{renders} renders from {concurrency} threads; pool setup {setup_ms:.0f}ms\n")
+        print(f"{'mode':<24} {'renders/s':>10} {'p50':>9} {'p95':>9}")
+        for name, render in modes:
+            throughput, latencies = run(render, renders, concurrency)
+            print(
+                f"{name:<24} {throughput:10.2f} {percentile(latencies, 0.5):7.0f}ms "
+                f"{percentile(latencies, 0.95):7.0f}ms"
+            )
+    finally:
+        pool.close()
+
+
+if __name__ == "__main__":
+    import logging
+    logging.disable(logging.WARNING)
+    main(*(int(arg) for arg in sys.argv[1:4]))
@@ -0,0 +1,53 @@
+"""
+Read model build benchmark: ORM loader vs Core loader.
+
+Builds the ``en`` view of a synthetic portfolio with each
+``READ_MODEL_LOADER`` and reports the best wall time, the CPU time and the
+peak memory allocated during one build (tracemalloc). Both loaders produce
+the same view; this is checked before timing.
+
+Usage:
+    python scripts/benchmark_read_model.py [projects] [repeats]
+"""
+import sys
+import time
+import tracemalloc
+
+from benchmark_data import setup_app, seed_synthetic_portfolio
+
+
+def main(projects=200, repeats=10):
+    from backend.services import read_model
+
+    app, db = setup_app()
+    with app.app_context():
+        seed_synthetic_portfolio(db, projects=projects)
+
+        def build(loader):
+            read_model.READ_MODEL_LOADER = loader
+            return read_model.build_view("en")
+
+        core, orm = build("core"), build("orm")
+        assert core.projects == orm.projects and core.skills == orm.skills, "loaders disagree"
+
+        print(f"{projects} projects, 'en' view, best of {repeats}\n")
+        print(f"{'loader':<8} {'wall':>9} {'cpu':>9} {'peak alloc':>11}")
+        for loader in ("orm", "core"):
+            wall = cpu = float("inf")
+            for _ in range(repeats):
+                wall_started, cpu_started = time.perf_counter(), time.process_time()
+                build(loader)
+                wall = min(wall, time.perf_counter() - wall_started)
+                cpu = min(cpu, time.process_time() - cpu_started)
+
+            tracemalloc.start()
+            build(loader)
+            _, peak = tracemalloc.get_traced_memory()
+            tracemalloc.stop()
+            print(f"{loader:<8} {wall * 1000:7.1f}ms {cpu * 1000:7.1f}ms {peak / 1024 / 1024:9.1f}MB")
+
+
+if __name__ == "__main__":
+    import logging
+    logging.disable(logging.INFO)
+    main(*(int(arg) for arg in sys.argv[1:3]))
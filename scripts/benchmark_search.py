@@ -0,0 +1,58 @@
+"""
+Search index benchmark.
+
+Indexes the ``en`` view of a synthetic portfolio, then times a full build,
+an incremental (copy-on-write) sync after one project changes, and a set
+of queries (single word, multi-word, prefix) against the warm index.
+
+Usage:
+    python scripts/benchmark_search.py [projects] [repeats]
+"""
+import sys
+import time
+
+from benchmark_data import setup_app, seed_synthetic_portfolio
+
+QUERIES = ("python", "data pipeline", "dash", "api rest flask", "proj")
+
+
+def best_ms(run, repeats):
+    best = float("inf")
+    for _ in range(repeats):
+        started = time.perf_counter()
+        run()
+        best = min(best, time.perf_counter() - started)
+    return best * 1000
+
+
+def main(projects=200, repeats=200):
+    from backend.services.read_model import build_view
+    from backend.services.search_index import SearchIndex, documents_from_view
+
+    app, db = setup_app()
+    with app.app_context():
+        seed_synthetic_portfolio(db, projects=projects)
+        documents = documents_from_view(build_view("en"))
+
+    def build():
+        SearchIndex("en").sync(documents)
+
+    index = SearchIndex("en")
+    index.sync(documents)
+    key = next(k for k in documents if k[0] == "project")
+    meta, fields = documents[key]
+    edited = {**documents, key: (meta, {**fields, "summary": fields["summary"] + " edited"})}
+
+    print(f"{len(documents)} documents, {len(index.postings)} terms, best of {repeats}\n")
+    print(f"{'full build':<24} {best_ms(build, 10):8.2f}ms")
+    print(f"{'incremental sync':<24} {best_ms(lambda: index.synced(edited), 10):8.2f}ms")
+    for query in QUERIES:
+        total = index.search(query)[0]
+        ms = best_ms(lambda: index.search(query, limit=10), repeats)
+        print(f"{'q=' + query:<24} {ms * 1000:7.1f}us  ({total} hits)")
+
+
+if __name__ == "__main__":
+    import logging
+    logging.disable(logging.INFO)
+    main(*(int(arg) for arg in sys.argv[1:3]))
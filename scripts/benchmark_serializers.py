@@ -0,0 +1,114 @@
+"""
+Per-object serialization benchmark.
+
+Loads a synthetic portfolio and times, for each project, the hand-built
+or reflective dict code the serializers replaced ("before") against the
+compiled serializers in ``backend/services/serializers.py`` ("after").
+Both sides start from the same loaded ORM objects, so only the dict
+building is timed.
+
+Usage:
+    python scripts/benchmark_serializers.py [projects] [repeats]
+"""
+import sys
+import time
+
+from benchmark_data import setup_app, seed_synthetic_portfolio
+
+
+def reflective_serialize(obj):
+    """The old ``admin_home`` helper: getattr over ``__table__.columns``."""
+    d = {c.name: getattr(obj, c.name) for c in obj.__table__.columns}
+    for k, v in d.items():
+        if hasattr(v, 'isoformat'):
+            d[k] = v.isoformat()
+    if hasattr(obj, 'translations'):
+        d['translations'] = [{c.name: getattr(t, c.name) for c in t.__table__.columns} for t in obj.translations]
+    if hasattr(obj, 'tags'):
+        d['tags'] = [{'id': t.id, 'name': t.name, 'slug': t.slug} for t in obj.tags]
+    if hasattr(obj, 'images'):
+        d['images'] = [{c.name: getattr(i, c.name) for c in i.__table__.columns} for i in obj.images]
+    if hasattr(obj, 'urls'):
+        d['urls'] = [
+            {c.name: getattr(u, c.name) for c in u.__table__.columns} for u in sorted(obj.urls, key=lambda x: x.order)
+        ]
+    return d
+
+
+def hand_built_payload(p, trans):
+    """The old public project payload, one dict literal per object."""
+    images = sorted(p.images, key=lambda x: x.order)
+    return {
+        "id": p.id, "slug": p.slug, "category": p.category,
+        "urls": [{"type": u.url_type, "url": u.url, "label": u.label, "order": u.order}
+                 for u in sorted(p.urls or [], key=lambda x: x.order)],
+        "title": trans.title, "subtitle": trans.subtitle, "summary": trans.summary,
+        "description": trans.description, "content": trans.content,
+        "tags": [t.name for t in p.tags],
+        "images": [{"url": i.url, "type": i.type, "caption": i.caption, "order": i.order,
+                    "thumbnail_url": i.thumbnail_url, "alt_text": i.alt_text, "width": i.width,
+                    "height": i.height, "is_featured": i.is_featured} for i in images],
+        "desktop_image": images[0].url if images else None,
+        "mobile_image": images[1].url if len(images) > 1 else None,
+        "preview_video": next((i.url for i in images if i.type in ['video', 'gif']), None),
+        "created_at": p.created_at.isoformat() if p.created_at else None,
+    }
+
+
+def hand_built_backup(p):
+    """The old ``/admin/backup`` project entry."""
+    return {
+        'id': p.id, 'slug': p.slug, 'category': p.category, 'is_featured_cv': p.is_featured_cv,
+        'created_at': p.created_at.isoformat() if p.created_at else None,
+        'translations': [{'lang': t.lang, 'title': t.title, 'subtitle': t.subtitle,
+                          'description': t.description, 'summary': t.summary, 'content': t.content,
+                          'cv_description': getattr(t, 'cv_description', None)} for t in p.translations],
+        'urls': [{'url_type': u.url_type, 'url': u.url, 'order': u.order} for u in p.urls],
+        'images': [{'url': i.url, 'type': i.type, 'alt_text': getattr(i, 'alt_text', None),
+                    'width': getattr(i, 'width', None), 'height': getattr(i, 'height', None),
+                    'is_featured': getattr(i, 'is_featured', False), 'order': i.order} for i in p.images],
+        'tags': [{'name': tag.name, 'slug': tag.slug} for tag in p.tags],
+    }
+
+
+def per_object_us(func, objects, repeats):
+    best = float("inf")
+    for _ in range(repeats):
+        started = time.perf_counter()
+        for obj in objects:
+            func(obj)
+        best = min(best, time.perf_counter() - started)
+    return best / len(objects) * 1e6
+
+
+def main(projects=200, repeats=100):
+    from sqlalchemy.orm import selectinload
+    from backend.models.project import Project
+    from backend.services.read_model import _project_payload
+    from backend.services.serializers import serialize_admin, BACKUP_SERIALIZERS
+
+    app, db = setup_app()
+    with app.app_context():
+        seed_synthetic_portfolio(db, projects=projects)
+        loaded = Project.query.options(
+            selectinload(Project.translations), selectinload(Project.images),
+            selectinload(Project.urls), selectinload(Project.tags),
+        ).all()
+        pairs = [(p, p.translations[0]) for p in loaded]
+
+        cases = {
+            "public payload": (lambda pt: hand_built_payload(*pt), lambda pt: _project_payload(*pt), pairs),
+            "admin row": (reflective_serialize, serialize_admin, loaded),
+            "backup row": (hand_built_backup, BACKUP_SERIALIZERS["projects"], loaded),
+        }
+
+        print(f"{projects} projects, best of {repeats}, µs per project\n")
+        print(f"{'serializer':<16} {'before':>8} {'after':>8}")
+        for name, (before, after, objects) in cases.items():
+            before_us = per_object_us(before, objects, repeats)
+            after_us = per_object_us(after, objects, repeats)
+            print(f"{name:<16} {before_us:8.1f} {after_us:8.1f}")
+
+
+if __name__ == "__main__":
+    main(*(int(arg) for arg in sys.argv[1:3]))
@@ -17,10 +17,17 @@ project_root = os.path.dirname(os.path.abspath(__file__))
 sys.path.insert(0, project_root)
 
 from backend.app import app
+from backend.services.warmup import schedule_warmup, watch_other_workers
 
 # This is what the WSGI server imports
 application = app
 
+# Fill the response and PDF caches before the first visitor arrives
+# (each worker imports this module after forking; set CACHE_WARMUP=false to skip)
+schedule_warmup(app, reason="startup")
+# Without Redis, also warm this worker after saves handled by the others
+watch_other_workers(app)
+
 if __name__ == "__main__":
     # Fallback for direct execution
     app.run()